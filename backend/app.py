@@ -1,19 +1,43 @@
+import hashlib
 import json
 import logging
 import os
 import re
+import shutil
+import time
 from datetime import datetime
+from typing import Optional
 
-import requests
-from deep_translator import GoogleTranslator, single_detection
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 
-from backend.generate_summary import generate_summary
-from backend.semantic.index_transcripts import append_single_embedding
+from backend.batch_ingest import collect_audio_files, ingest_job_status, start_ingest_job
+from backend.config import (
+    AUDIO_EXTENSIONS,
+    BATCH_INGEST_CONFIG,
+    CALENDAR_CONFIG,
+    DATA_DIR,
+    TEMP_DIR,
+    TRANSCRIPT_CATALOG_CONFIG,
+    TRANSCRIPT_WATCHER_CONFIG,
+)
+from backend.generate_summary import generate_summary, stream_summary
+from backend.http_cache import cached_response
+from backend.summary_store import latest_summary_record
+from backend.semantic.reembed import reembed_status, start_reembed
 from backend.semantic.search_query import semantic_answer
+from backend.services.api_clients import google_translator
+from backend.services.calendar_store import get_calendar_store
+from backend.services.language_id import LANGUAGE_NAMES, detect_language
+from backend.services.rate_limiter import rate_limiter_stats
+from backend.services.transcript_catalog import get_transcript_catalog
+from backend.services.transcript_watcher import TranscriptWatcher
+from backend.services.resilience import provider_stats
+from backend.services.translation_memory import get_translation_memory
 from backend.transcribe import transcribe_audio
-from backend.visuals.generate_visual import generate_visual_image
+from backend.transcript_format import TranscriptReader
+from backend.translation_batch import translate_georgian_batch
+from backend.visuals.generate_visual import generate_visuals
 
 app = Flask(__name__)
 CORS(app)
@@ -25,16 +49,38 @@ for directory in ["data", "temp", "visuals/generated", "static_data"]:
     os.makedirs(directory, exist_ok=True)
 
 
-def is_georgian_file(filename: str) -> bool:
-    """Check if the filename indicates a Georgian transcript file."""
-    return filename.endswith(".json") and "_ge_" in filename
+def georgian_transcripts(has_translation=None) -> list:
+    """List Georgian transcripts by the language detected from their text (via the catalog), not by filename."""
+    catalog = get_transcript_catalog()
+    filenames, cursor = [], None
+    while True:
+        page = catalog.query(
+            language="Georgian",
+            has_translation=has_translation,
+            sort="filename",
+            order="asc",
+            limit=TRANSCRIPT_CATALOG_CONFIG["max_page_size"],
+            cursor=cursor,
+        )
+        filenames.extend(row["filename"] for row in page["transcripts"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return filenames
 
 
 def translate_text(text: str, dest="en") -> str:
-    """Translate text to the specified language using Google Translator."""
+    """Translate text to the specified language using Google Translator, reusing the translation memory."""
     try:
-        translated_text = GoogleTranslator(source="auto", target=dest).translate(text)
-        return translated_text
+        memory = get_translation_memory()
+        if memory is None:
+            return google_translator("auto", dest).translate(text)
+        return memory.translate(
+            text,
+            "auto",
+            dest,
+            "google",
+            lambda segment: google_translator("auto", dest).translate(segment),
+        )
     except Exception as e:
         logger.error(f"Translation error: {e}")
         return text
@@ -42,7 +88,7 @@ def translate_text(text: str, dest="en") -> str:
 
 @app.route("/api/transcribe", methods=["POST"])
 def transcribe():
-    """Handle audio file upload, transcribe using AssemblyAI, auto-translate Georgian audio, and trigger post-processing."""
+    """Handle audio file upload and run it through the ingest pipeline (transcription, translation of non-English audio, summary and embedding)."""
     try:
         if "file" not in request.files:
             return jsonify({"error": "No file provided"}), 400
@@ -52,17 +98,17 @@ def transcribe():
             return jsonify({"error": "No file selected"}), 400
 
         language = request.form.get("language", "auto")
-        language_map = {"English": "en", "Georgian": "ka", "Auto": "auto"}
-        api_language = language_map.get(language, "auto")
 
-        allowed_extensions = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
         file_ext = os.path.splitext(file.filename)[1].lower()
-        if file_ext not in allowed_extensions:
+        if file_ext not in AUDIO_EXTENSIONS:
             return jsonify({"error": f"Unsupported file type: {file_ext}"}), 400
 
         logger.info(f"Transcribing file: {file.filename} (Language: {language})")
 
         result = transcribe_audio()
+        if isinstance(result, tuple):
+            # Error response from the pipeline, with its status code
+            return result
         result_data = result if isinstance(result, dict) else result.get_json()
 
         if not result_data.get("filename"):
@@ -70,130 +116,157 @@ def transcribe():
 
         original_filename = result_data["filename"]
 
-        if result_data.get("language") == "ka" or api_language == "ka":
-            try:
-                transcript_text = " ".join(
-                    [
-                        entry.get("text", "")
-                        for entry in result_data.get("transcript", [])
-                    ]
-                )
-                translated_text = translate_text(transcript_text)
-                result_data["translated_text"] = translated_text
-                result_data["auto_translated"] = True
+        # Translation, summary and embedding already ran in the ingest pipeline (process_audio_file)
+        if result_data.get("duplicate_of"):
+            logger.info(f"{original_filename} is a near-duplicate of {result_data['duplicate_of']}; skipping post-processing")
+        elif result_data.get("translated_filename"):
+            logger.info(f"Transcribed {original_filename}, translated to {result_data['translated_filename']}")
+        else:
+            logger.info(f"Transcribed {original_filename}")
+
+        return jsonify(result_data)
+
+    except Exception as e:
+        logger.error(f"Transcription error: {e}")
+        return jsonify({"error": f"Transcription failed: {str(e)}"}), 500
 
-                translated_filename = original_filename.replace("_ge_", "_en_")
-                translated_path = os.path.join("data", translated_filename)
 
-                with open(translated_path, "w", encoding="utf-8") as f:
-                    json.dump(
+def resolve_ingest_directory(directory: str) -> Optional[str]:
+    """Resolve a requested ingest directory, or return None unless it lies inside the configured ingest root."""
+    root = BATCH_INGEST_CONFIG["ingest_root"]
+    if not root:
+        return None
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, directory))
+    if os.path.commonpath([root, resolved]) != root:
+        return None
+    return resolved
+
+
+@app.route("/api/transcribe-batch", methods=["POST"])
+def transcribe_batch():
+    """
+    Start ingesting many audio files (multipart `files`, or a `directory` inside BATCH_INGEST_ROOT)
+    as a background job. Returns 202 with the job id; poll `/api/transcribe-batch/<job_id>` for the report.
+    """
+    batch_dir = None
+    try:
+        payload = request.get_json(silent=True) or {}
+        language = request.form.get("language") or payload.get("language") or "auto"
+        language_map = {"English": "en", "Georgian": "ka", "Auto": "auto"}
+        api_language = language_map.get(language, language)
+
+        max_workers = request.form.get("max_workers") or payload.get("max_workers")
+        max_workers = int(max_workers) if max_workers else None
+
+        uploads = [upload for upload in request.files.getlist("files") if upload.filename]
+        filenames = {}
+        if uploads:
+            if len(uploads) > BATCH_INGEST_CONFIG["max_files"]:
+                return (
+                    jsonify(
                         {
-                            "transcript": [{"text": translated_text}],
-                            "original_language": "ka",
-                            "translated_from": original_filename,
-                        },
-                        f,
-                        ensure_ascii=False,
-                        indent=2,
-                    )
-
-                result_data["translated_filename"] = translated_filename
-
-                requests.post(
-                    "http://localhost:5050/api/summary",
-                    json={"filename": translated_filename},
+                            "error": f"Too many files: {len(uploads)} (max {BATCH_INGEST_CONFIG['max_files']})"
+                        }
+                    ),
+                    400,
                 )
-                append_single_embedding(translated_filename)
-
-            except Exception as e:
-                logger.warning(f"Translation failed: {e}")
-                result_data["auto_translated"] = False
-                result_data["translation_error"] = str(e)
+            for upload in uploads:
+                file_ext = os.path.splitext(upload.filename)[1].lower()
+                if file_ext not in AUDIO_EXTENSIONS:
+                    return jsonify({"error": f"Unsupported file type: {file_ext}"}), 400
 
+            batch_dir = os.path.join(
+                TEMP_DIR, f"batch_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+            )
+            os.makedirs(batch_dir, exist_ok=True)
+            file_paths = []
+            for index, upload in enumerate(uploads):
+                original_name = os.path.basename(upload.filename)
+                # Saved under a unique name so uploads sharing a filename don't overwrite each other
+                path = os.path.join(batch_dir, f"{index:04d}_{original_name}")
+                upload.save(path)
+                file_paths.append(path)
+                filenames[path] = original_name
+        elif payload.get("directory"):
+            directory = resolve_ingest_directory(payload["directory"])
+            if directory is None:
+                return jsonify({"error": "Directory is outside the configured ingest root"}), 403
+            if not os.path.isdir(directory):
+                return jsonify({"error": "Directory not found"}), 404
+            # Symlinks inside the root may not lead back out of it
+            file_paths = [
+                path
+                for path in collect_audio_files([directory])
+                if resolve_ingest_directory(path) is not None
+            ]
         else:
-            try:
-                requests.post(
-                    "http://localhost:5050/api/summary",
-                    json={"filename": original_filename},
-                )
-                append_single_embedding(original_filename)
-            except Exception as e:
-                logger.warning(f"Post-processing failed: {e}")
+            return jsonify({"error": "No files or directory provided"}), 400
 
-        return jsonify(result_data)
+        if not file_paths:
+            return jsonify({"error": "No supported audio files found"}), 400
+        if len(file_paths) > BATCH_INGEST_CONFIG["max_files"]:
+            return (
+                jsonify(
+                    {
+                        "error": f"Too many files: {len(file_paths)} (max {BATCH_INGEST_CONFIG['max_files']})"
+                    }
+                ),
+                400,
+            )
+
+        logger.info(f"Batch ingest of {len(file_paths)} file(s) (Language: {language})")
+        job = start_ingest_job(
+            file_paths,
+            api_language,
+            max_workers=max_workers,
+            filenames=filenames,
+            cleanup_dir=batch_dir,
+        )
+        # The job owns the uploads now and removes them when it finishes
+        batch_dir = None
+        return jsonify({**job.status(), "status_url": f"/api/transcribe-batch/{job.id}"}), 202
 
     except Exception as e:
-        logger.error(f"Transcription error: {e}")
-        return jsonify({"error": f"Transcription failed: {str(e)}"}), 500
+        logger.error(f"Batch transcription error: {e}")
+        return jsonify({"error": f"Batch transcription failed: {str(e)}"}), 500
+
+    finally:
+        if batch_dir:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+
+@app.route("/api/transcribe-batch/<job_id>", methods=["GET"])
+def transcribe_batch_status(job_id):
+    """Report the progress of a batch ingest job, and its per-file report once finished."""
+    status = ingest_job_status(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown batch job"}), 404
+    return jsonify(status)
 
 
 @app.route("/api/georgian-files", methods=["GET"])
 def get_georgian_files():
     """List all Georgian transcript files that do not have English translations."""
     try:
-        files = []
-        for filename in os.listdir("data"):
-            if is_georgian_file(filename):
-                translated = filename.replace("_ge_", "_en_")
-                if not os.path.exists(os.path.join("data", translated)):
-                    files.append(filename)
-        return jsonify(files)
+        return jsonify(georgian_transcripts(has_translation=False))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/api/translate-georgian", methods=["POST"])
 def translate_georgian_files():
-    """Translate all Georgian transcript files to English and save them."""
+    """Translate Georgian transcript files to English in parallel, skipping ones already translated and resuming from the checkpoint."""
     try:
-        data_dir = "data"
-        georgian_files = [f for f in os.listdir(data_dir) if is_georgian_file(f)]
+        georgian_files = georgian_transcripts()
 
         if not georgian_files:
             return jsonify({"message": "No Georgian files found to translate"}), 200
 
         def generate():
             """Generator to yield translation progress."""
-            for idx, filename in enumerate(georgian_files, 1):
-                try:
-                    path = os.path.join(data_dir, filename)
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    combined = " ".join(
-                        [entry.get("text", "") for entry in data.get("transcript", [])]
-                    )
-                    translated = translate_text(combined)
-
-                    translated_filename = filename.replace("_ge_", "_en_")
-                    translated_path = os.path.join(data_dir, translated_filename)
-
-                    with open(translated_path, "w", encoding="utf-8") as f:
-                        json.dump(
-                            {
-                                "transcript": [{"text": translated}],
-                                "original_language": "ka",
-                                "translated_from": filename,
-                            },
-                            f,
-                            ensure_ascii=False,
-                            indent=2,
-                        )
-
-                    append_single_embedding(translated_filename)
-
-                    yield json.dumps(
-                        {
-                            "progress": round((idx / len(georgian_files)) * 100, 2),
-                            "status": f"Translated {filename}",
-                        }
-                    ) + "\n"
-
-                except Exception as e:
-                    logger.error(f"Failed to translate {filename}: {e}")
-                    yield json.dumps(
-                        {"status": f"Error translating {filename}: {str(e)}"}
-                    ) + "\n"
+            for event in translate_georgian_batch(DATA_DIR, georgian_files):
+                yield json.dumps(event) + "\n"
 
         return app.response_class(generate(), mimetype="text/event-stream")
 
@@ -202,12 +275,53 @@ def translate_georgian_files():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/translation-memory", methods=["GET"])
+def translation_memory_stats():
+    """Report translation memory size and hit rate."""
+    memory = get_translation_memory()
+    if memory is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **memory.stats()})
+
+
+@app.route("/api/index/reembed", methods=["GET", "POST"])
+def reembed_index():
+    """Start re-embedding the search index with another model (POST) or report the job's progress (GET)."""
+    if request.method == "GET":
+        return jsonify(reembed_status())
+
+    model = (request.get_json(silent=True) or {}).get("model")
+    try:
+        start_reembed(model)
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 409
+    return jsonify(reembed_status()), 202
+
+
+@app.route("/api/rate-limits", methods=["GET"])
+def rate_limits():
+    """Report per-model request counts, estimated tokens and queueing delay."""
+    return jsonify(rate_limiter_stats())
+
+
+@app.route("/api/provider-health", methods=["GET"])
+def provider_health():
+    """Report circuit state, latency percentiles and error counters per external provider."""
+    return jsonify(provider_stats())
+
+
 @app.route("/api/summary", methods=["GET", "POST"])
 def summary():
     """Generate a summary for the latest transcript file."""
     return generate_summary()
 
 
+@app.route("/api/summary/stream", methods=["GET", "POST"])
+def summary_stream():
+    """Stream summary tokens for a transcript as server-sent events."""
+    return stream_summary()
+
+
 @app.route("/api/semantic-search", methods=["POST"])
 def semantic_search():
     """Handle semantic search queries."""
@@ -218,12 +332,11 @@ def semantic_search():
         if not query or len(query.strip()) < 3:
             return jsonify({"error": "Invalid query"}), 400
 
-        try:
-            detected_lang = single_detection(query, api_key=None)
-            if detected_lang == "ka":
-                query = translate_text(query)
-        except Exception as e:
-            logger.warning(f"Language detection failed: {e}")
+        # Offline language ID: English queries (and ones too short to tell) skip the translator
+        query_language = detect_language(query, default="en")
+        if query_language != "en":
+            logger.info(f"Translating {LANGUAGE_NAMES[query_language]} query")
+            query = translate_text(query)
 
         result = semantic_answer(query)
         return jsonify(result)
@@ -235,68 +348,91 @@ def semantic_search():
 
 @app.route("/api/transcripts", methods=["GET"])
 def get_transcripts():
-    """List all transcripts with metadata."""
+    """
+    List transcripts with metadata from the transcript catalog, without opening transcript files.
+
+    Query parameters: `language` (a language name such as English or Georgian, or its code),
+    `has_translation` (true/false), `q` (filename substring), `sort` (created_at, filename,
+    word_count, speaker_count, file_size), `order` (asc/desc), `limit` and `cursor` (the
+    `next_cursor` of the previous page).
+    Supports ETag/Last-Modified revalidation and compression.
+    """
     try:
-        transcripts = []
-        for filename in os.listdir("data"):
-            if filename.endswith(".json") and not filename.endswith("_summary.json"):
-                path = os.path.join("data", filename)
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                stat = os.stat(path)
-
-                is_ge = "_ge_" in filename
-                translated_filename = (
-                    filename.replace("_ge_", "_en_") if is_ge else None
-                )
-                has_translation = translated_filename and os.path.exists(
-                    os.path.join("data", translated_filename)
-                )
+        args = request.args
+        language = LANGUAGE_NAMES.get(args.get("language", ""), args.get("language") or None)
+        has_translation = args.get("has_translation")
+        if has_translation is not None:
+            has_translation = has_translation.lower() in ("1", "true", "yes")
+        try:
+            limit = int(args.get("limit", TRANSCRIPT_CATALOG_CONFIG["page_size"]))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        limit = max(1, min(limit, TRANSCRIPT_CATALOG_CONFIG["max_page_size"]))
+
+        catalog = get_transcript_catalog()
+        version, last_modified = catalog.version()
+
+        def build():
+            return catalog.query(
+                language=language,
+                has_translation=has_translation,
+                search=args.get("q"),
+                sort=args.get("sort", "created_at"),
+                order=args.get("order", "desc"),
+                limit=limit,
+                cursor=args.get("cursor"),
+            )
 
-                transcripts.append(
-                    {
-                        "filename": filename,
-                        "language": "Georgian" if is_ge else "English",
-                        "translated_filename": (
-                            translated_filename if has_translation else None
-                        ),
-                        "has_translation": has_translation,
-                        "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "file_size": stat.st_size,
-                        "word_count": sum(
-                            len(entry.get("text", "").split())
-                            for entry in data.get("transcript", [])
-                        ),
-                        "speaker_count": len(
-                            set(
-                                entry.get("speaker", "")
-                                for entry in data.get("transcript", [])
-                            )
-                        ),
-                    }
-                )
+        return cached_response(version, build, last_modified)
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Transcript listing failed: {e}")
+        return jsonify({"error": str(e)}), 500
 
-        transcripts.sort(key=lambda x: x["created_at"], reverse=True)
+
+@app.route("/api/transcripts/<filename>/segment", methods=["GET"])
+def get_transcript_segment(filename):
+    """
+    Return the utterances of a transcript that overlap a time window.
+
+    Query parameters `start` and `end` are milliseconds (window [start, end)). Compact transcripts are
+    served from their start-time index by binary search and seeking, without decoding the whole meeting.
+    """
+    try:
+        start, end = int(request.args["start"]), int(request.args["end"])
+    except (KeyError, ValueError):
+        return jsonify({"error": "start and end (milliseconds) are required integers"}), 400
+    if start < 0 or end <= start:
+        return jsonify({"error": "end must be greater than start"}), 400
+
+    path = os.path.join(DATA_DIR, os.path.basename(filename))
+    if not os.path.exists(path):
+        return jsonify({"error": "Transcript file not found"}), 404
+
+    try:
+        reader = TranscriptReader(path)
+        utterances = reader.segment(start, end)
         return jsonify(
             {
-                "transcripts": transcripts,
-                "total": len(transcripts),
-                "georgian_count": len(
-                    [t for t in transcripts if t["language"] == "Georgian"]
-                ),
-                "english_count": len(
-                    [t for t in transcripts if t["language"] == "English"]
-                ),
+                "filename": os.path.basename(filename),
+                "start": start,
+                "end": end,
+                "utterances": utterances,
+                "count": len(utterances),
+                "indexed": reader.indexed,
             }
         )
-
     except Exception as e:
-        logger.error(f"Transcript listing failed: {e}")
+        logger.error(f"Segment lookup failed: {e}")
         return jsonify({"error": str(e)}), 500
 
 
-def extract_key_info_for_visual(summary_content):
-    """Extract structured information from summary for visual generation"""
+def extract_key_info_for_visual(summary_record):
+    """Extract structured information from a stored summary record for visual generation.
+    Action items, owners and dates come from the record's parsed fields; themes are keyword-matched."""
+    summary_content = summary_record["summary"]
     content_lower = summary_content.lower()
 
     key_info = {
@@ -311,7 +447,8 @@ def extract_key_info_for_visual(summary_content):
                 "concluded",
             ]
         ),
-        "has_actions": any(
+        "has_actions": bool(summary_record.get("action_items"))
+        or any(
             word in content_lower
             for word in [
                 "action",
@@ -364,19 +501,8 @@ def extract_key_info_for_visual(summary_content):
             summary_content,
             flags=re.IGNORECASE,
         )[:5],
-        "dates": re.findall(
-            r"\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\b(?:January|February|March|April|May|June|July|August|September|October|November|December) \d{1,2}, \d{4}",
-            summary_content,
-        )[:3],
-        "participant_count": len(
-            set(
-                re.findall(
-                    r"\b(?:assigned to|responsible for|will handle|should complete|[A-Z][a-z]+ will)\b",
-                    summary_content,
-                    flags=re.IGNORECASE,
-                )
-            )
-        ),
+        "dates": summary_record.get("dates", [])[:3],
+        "participant_count": len(summary_record.get("owners", [])),
         "topics": list(
             set(
                 re.findall(
@@ -421,31 +547,18 @@ def extract_key_info_for_visual(summary_content):
 
 @app.route("/api/visual-summary", methods=["POST"])
 def generate_visual_summary():
-    """Generate 3 visual summaries using DALL-E 3"""
+    """Generate 3 visual summaries using DALL-E 3, concurrently and cached per summary, visual type and prompt version"""
     logger.info("Visual summary endpoint called")
 
     try:
-        summary_dir = "backend/data"
-        if not os.path.exists(summary_dir):
-            return jsonify({"error": "Summary directory not found"}), 404
-
-        summary_files = [
-            f
-            for f in os.listdir(summary_dir)
-            if f.startswith("summary_") and f.endswith(".txt")
-        ]
-        if not summary_files:
+        summary_record = latest_summary_record()
+        if not summary_record:
             return jsonify({"error": "No summaries found"}), 404
 
-        latest_file = max(
-            summary_files, key=lambda x: os.path.getctime(os.path.join(summary_dir, x))
-        )
-        summary_path = os.path.join(summary_dir, latest_file)
+        summary_content = summary_record["summary"]
+        latest_file = summary_record["source_file"]
 
-        with open(summary_path, "r", encoding="utf-8") as f:
-            summary_content = f.read()
-
-        key_info = extract_key_info_for_visual(summary_content)
+        key_info = extract_key_info_for_visual(summary_record)
         logger.info(f"Extracted key info: {key_info}")
 
         metrics_str = ", ".join(key_info["metrics"]) or "No specific metrics"
@@ -510,30 +623,35 @@ DESIGN: Modern task board aesthetic, {color_scheme}, clear visual hierarchy
 PURPOSE: Track and manage meeting follow-ups""",
         }
 
+        summary_hash = summary_record.get("key") or hashlib.sha256(summary_content.encode("utf-8")).hexdigest()
+        started = time.perf_counter()
+        generated = generate_visuals(summary_hash, visual_prompts)
+        total_seconds = round(time.perf_counter() - started, 3)
+
         results = {}
-        for visual_type, prompt in visual_prompts.items():
-            try:
-                logger.info(f"Generating {visual_type} visual...")
-                image_url = generate_visual_image(prompt)
-                if image_url:
-                    results[visual_type] = {
-                        "url": image_url,
-                        "title": f"{visual_type.replace('_', ' ').title()} Summary",
-                        "description": f"AI-generated {visual_type} visual for meeting stakeholders",
-                        "theme": visual_theme,
-                        "color_scheme": color_scheme,
-                    }
-                    logger.info(f"Successfully generated {visual_type} visual")
-                else:
-                    logger.warning(f"Failed to generate {visual_type} visual")
-            except Exception as e:
-                logger.error(f"Error generating {visual_type} visual: {e}")
-                continue
+        timings = {}
+        for visual_type, outcome in generated.items():
+            timings[visual_type] = outcome["seconds"]
+            if outcome["url"]:
+                results[visual_type] = {
+                    "url": outcome["url"],
+                    "title": f"{visual_type.replace('_', ' ').title()} Summary",
+                    "description": f"AI-generated {visual_type} visual for meeting stakeholders",
+                    "theme": visual_theme,
+                    "color_scheme": color_scheme,
+                    "cached": outcome["cached"],
+                    "seconds": outcome["seconds"],
+                }
+                logger.info(
+                    f"{'Served cached' if outcome['cached'] else 'Generated'} {visual_type} visual in {outcome['seconds']}s"
+                )
+            else:
+                logger.warning(f"Failed to generate {visual_type} visual")
 
         if not results:
-            return jsonify({"error": "No visuals were generated successfully"}), 500
+            return jsonify({"error": "No visuals were generated successfully", "timings": timings}), 500
 
-        logger.info(f"Generated {len(results)} visual(s) successfully")
+        logger.info(f"Generated {len(results)} visual(s) successfully in {total_seconds}s")
 
         return jsonify(
             {
@@ -543,6 +661,9 @@ PURPOSE: Track and manage meeting follow-ups""",
                 "key_info": key_info,
                 "summary_length": len(summary_content),
                 "generated_count": len(results),
+                "cached_count": sum(1 for visual in results.values() if visual["cached"]),
+                "timings": timings,
+                "total_seconds": total_seconds,
             }
         )
 
@@ -554,30 +675,65 @@ PURPOSE: Track and manage meeting follow-ups""",
         return jsonify({"error": f"Visual generation failed: {str(e)}"}), 500
 
 
+def _default_calendar_events():
+    return [
+        {
+            "title": "Weekly Team Meeting",
+            "date": "2024-01-15",
+            "time": "10:00 AM",
+            "duration": "1 hour",
+            "attendees": ["Team Lead", "Developers", "PM"],
+        }
+    ]
+
+
 @app.route("/api/calendar", methods=["GET"])
 def get_calendar_events():
-    """Fetch calendar events from JSON file"""
+    """
+    Fetch calendar events.
+
+    Without query parameters the full event list is returned. With `month` (YYYY-MM) or
+    `start`/`end` (YYYY-MM-DD) and optional `limit`/`offset`, one page of the date range is
+    returned together with the total number of matching events. Responses carry an ETag and
+    Last-Modified derived from the store version, so unchanged pages are answered with 304.
+    """
     try:
-        events_file = os.path.join("backend/static_data", "calendar_events.json")
-        if not os.path.exists(events_file):
-            default_events = [
-                {
-                    "id": 1,
-                    "title": "Weekly Team Meeting",
-                    "date": "2024-01-15",
-                    "time": "10:00 AM",
-                    "duration": "1 hour",
-                    "attendees": ["Team Lead", "Developers", "PM"],
-                }
-            ]
-            os.makedirs(os.path.dirname(events_file), exist_ok=True)
-            with open(events_file, "w", encoding="utf-8") as f:
-                json.dump(default_events, f, indent=2)
-            return jsonify(default_events)
+        store = get_calendar_store()
+        if store.query(limit=0)[1] == 0:
+            store.add_events(_default_calendar_events())
+
+        version, last_modified = store.version()
+        args = request.args
+        if not any(key in args for key in ("month", "start", "end", "limit", "offset")):
+            return cached_response(version, store.all_events, last_modified)
+
+        start, end = args.get("start"), args.get("end")
+        month = args.get("month")
+        if month:
+            if not re.fullmatch(r"\d{4}-\d{2}", month):
+                return jsonify({"error": "month must be YYYY-MM"}), 400
+            start, end = f"{month}-01", f"{month}-31"
+
+        try:
+            limit = int(args.get("limit", CALENDAR_CONFIG["page_size"]))
+            offset = int(args.get("offset", 0))
+        except ValueError:
+            return jsonify({"error": "limit and offset must be integers"}), 400
+        limit = max(1, min(limit, CALENDAR_CONFIG["max_page_size"]))
+        offset = max(0, offset)
+
+        def build():
+            events, total = store.query(start=start, end=end, limit=limit, offset=offset)
+            next_offset = offset + len(events)
+            return {
+                "events": events,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "next_offset": next_offset if next_offset < total else None,
+            }
 
-        with open(events_file, "r", encoding="utf-8") as f:
-            events = json.load(f)
-        return jsonify(events)
+        return cached_response(version, build, last_modified)
 
     except Exception as e:
         logger.error(f"Calendar events error: {e}")
@@ -586,12 +742,17 @@ def get_calendar_events():
 
 @app.route("/data/calendar_events.json")
 def serve_calendar_json():
-    """Serve calendar events JSON file"""
-    return send_from_directory("static_data", "calendar_events.json")
+    """Serve every calendar event as JSON, built from the calendar store only when its version changes"""
+    store = get_calendar_store()
+    version, last_modified = store.version()
+    return cached_response(version, store.all_events, last_modified)
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5050))
     debug = os.environ.get("FLASK_DEBUG", "True").lower() == "true"
     logger.info(f"🚀 Starting Smart Meeting Assistant on port {port}")
+    # With the debug reloader only the serving child process runs the watcher
+    if TRANSCRIPT_WATCHER_CONFIG["enabled"] and (not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+        TranscriptWatcher().start()
     app.run(host="0.0.0.0", port=port, debug=debug)
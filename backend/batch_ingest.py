@@ -0,0 +1,240 @@
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from backend.config import AUDIO_EXTENSIONS, BATCH_INGEST_CONFIG
+from backend.transcribe import process_audio_file
+
+
+def collect_audio_files(paths: Iterable[str]) -> List[str]:
+    """
+        Expand a mix of file and directory paths into a sorted list of supported audio files.
+
+        Args:
+            paths (Iterable[str]): Audio file paths and/or directories to scan (non-recursive).
+
+        Returns:
+            List[str]: Paths of audio files with a supported extension, without duplicates.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = [os.path.join(path, name) for name in sorted(os.listdir(path))]
+        else:
+            candidates = [path]
+
+        for candidate in candidates:
+            ext = os.path.splitext(candidate)[1].lower()
+            if os.path.isfile(candidate) and ext in AUDIO_EXTENSIONS:
+                if candidate not in found:
+                    found.append(candidate)
+            elif not os.path.isdir(path):
+                print(f"⚠️ Skipping unsupported or missing file: {candidate}")
+    return found
+
+
+def _ingest_one(file_path: str, language: str, filename: Optional[str] = None) -> Dict[str, Any]:
+    """Run a single file through the pipeline and return its status record."""
+    filename = filename or os.path.basename(file_path)
+    started = time.perf_counter()
+    try:
+        result = process_audio_file(file_path, filename, language)
+        return {
+            "file": filename,
+            "status": "ok",
+            "filename": result.get("filename") or result.get("original_filename"),
+            "translated_filename": result.get("translated_filename"),
+            "duplicate_of": result.get("duplicate_of"),
+            "language": result.get("language"),
+            "duration_seconds": round(time.perf_counter() - started, 2),
+        }
+    except Exception as e:
+        print(f"❌ Batch ingest failed for {filename}: {e}")
+        return {
+            "file": filename,
+            "status": "error",
+            "error": str(e),
+            "duration_seconds": round(time.perf_counter() - started, 2),
+        }
+
+
+def ingest_files(
+    file_paths: List[str],
+    language: str = "en",
+    max_workers: Optional[int] = None,
+    filenames: Optional[Dict[str, str]] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+        Ingest many audio files through transcription, translation, summary and embedding
+        with a bounded number of files in flight at once.
+
+        Args:
+            file_paths (List[str]): Audio files to process.
+            language (str, optional): Language code passed to the transcription backend.
+            max_workers (int, optional): Concurrency limit; defaults to BATCH_INGEST_CONFIG["max_workers"].
+            filenames (Dict[str, str], optional): Original name per path, used for the transcript
+                filenames when files were saved under temporary names.
+            on_result (Callable, optional): Called with each file's status record as it finishes.
+
+        Returns:
+            Dict[str, Any]: Per-file results (in input order) plus totals and throughput.
+    """
+    workers = max(1, int(max_workers or BATCH_INGEST_CONFIG["max_workers"]))
+    started = time.perf_counter()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_ingest_one, path, language, (filenames or {}).get(path)): path
+            for path in file_paths
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            results[path] = future.result()
+            print(f"📦 [{done}/{len(file_paths)}] {results[path]['status']}: {results[path]['file']}")
+            if on_result:
+                on_result(results[path])
+
+    elapsed = time.perf_counter() - started
+    ordered = [results[path] for path in file_paths]
+    succeeded = sum(1 for r in ordered if r["status"] == "ok")
+
+    return {
+        "results": ordered,
+        "total": len(ordered),
+        "succeeded": succeeded,
+        "failed": len(ordered) - succeeded,
+        "max_workers": workers,
+        "elapsed_seconds": round(elapsed, 2),
+        "files_per_minute": round(len(ordered) / elapsed * 60, 2) if elapsed else 0.0,
+    }
+
+
+class IngestJob:
+    """
+    A batch ingest running on a background thread, so HTTP clients poll for the report instead of
+    holding a request open for the whole batch.
+
+    Methods:
+        - run(): Ingest the files in the calling thread, then remove `cleanup_dir` if given.
+        - status(): State, progress and (once finished) the ingest report.
+    """
+
+    def __init__(
+        self,
+        file_paths: List[str],
+        language: str,
+        max_workers: Optional[int] = None,
+        filenames: Optional[Dict[str, str]] = None,
+        cleanup_dir: Optional[str] = None,
+    ):
+        self.id = uuid.uuid4().hex
+        self.file_paths = file_paths
+        self.language = language
+        self.max_workers = max_workers
+        self.filenames = filenames
+        self.cleanup_dir = cleanup_dir
+        self.state = "pending"
+        self.done = 0
+        self.report: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _progress(self, result: Dict[str, Any]):
+        with self._lock:
+            self.done += 1
+
+    def run(self):
+        with self._lock:
+            self.state = "running"
+            self.started_at = datetime.now().isoformat()
+        try:
+            report = ingest_files(
+                self.file_paths, self.language, self.max_workers, self.filenames, self._progress
+            )
+            with self._lock:
+                self.report, self.state = report, "done"
+        except Exception as e:
+            print(f"❌ Batch ingest job {self.id} failed: {e}")
+            with self._lock:
+                self.error, self.state = str(e), "failed"
+        finally:
+            with self._lock:
+                self.finished_at = datetime.now().isoformat()
+            if self.cleanup_dir:
+                shutil.rmtree(self.cleanup_dir, ignore_errors=True)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "state": self.state,
+                "done": self.done,
+                "total": len(self.file_paths),
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "error": self.error,
+                "report": self.report,
+            }
+
+
+_jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def start_ingest_job(file_paths: List[str], language: str = "en", **kwargs) -> IngestJob:
+    """Start ingesting `file_paths` on a background thread and return the job (see IngestJob)."""
+    job = IngestJob(file_paths, language, **kwargs)
+    with _jobs_lock:
+        _jobs[job.id] = job
+        # Only the most recent reports are kept
+        while len(_jobs) > BATCH_INGEST_CONFIG["max_jobs"]:
+            _jobs.popitem(last=False)
+    threading.Thread(target=job.run, name=f"ingest-{job.id[:8]}", daemon=True).start()
+    return job
+
+
+def ingest_job_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """Return the status of a batch ingest job, or None if it is unknown."""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    return job.status() if job else None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch-ingest meeting recordings through the transcription pipeline."
+    )
+    parser.add_argument("paths", nargs="+", help="Audio files and/or directories")
+    parser.add_argument("--language", default="en", help="Language code (default: en)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_INGEST_CONFIG["max_workers"],
+        help="Number of files processed concurrently",
+    )
+    args = parser.parse_args()
+
+    file_paths = collect_audio_files(args.paths)
+    if not file_paths:
+        print("❌ No supported audio files found.")
+        return
+
+    print(f"🚀 Ingesting {len(file_paths)} file(s) with {args.workers} worker(s)...")
+    report = ingest_files(file_paths, args.language, args.workers)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import argparse
+import fnmatch
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.config import DATA_DIR, SUMMARY_CONFIG
+from backend.generate_summary import ensure_summary, follow_duplicate
+from backend.summary_store import load_summary_record, summary_key
+from backend.transcript_model import Transcript, load_transcript
+
+
+def list_transcripts(data_dir: str = DATA_DIR, pattern: str = "*.json") -> List[str]:
+    """Return transcript filenames in `data_dir` matching `pattern`, sorted by name."""
+    return sorted(
+        name
+        for name in os.listdir(data_dir)
+        if name.endswith(".json")
+        and fnmatch.fnmatch(name, pattern)
+        and os.path.isfile(os.path.join(data_dir, name))
+    )
+
+
+def read_utterances(path: str) -> Tuple[Optional[Transcript], str]:
+    """
+        Read a transcript the same way /api/summary does, without the retry loop.
+
+        Returns:
+            Tuple: (transcript, original language). The transcript is None for files without utterances.
+    """
+    transcript = follow_duplicate(path, load_transcript(path))
+    return transcript or None, transcript.language
+
+
+def is_current_record(record: Optional[Dict[str, Any]], key: str) -> bool:
+    """Return whether `record` was generated for the content behind `key` under the current prompt and model."""
+    return bool(
+        record
+        and record.get("prompt_version") == SUMMARY_CONFIG["prompt_version"]
+        and record.get("model") == SUMMARY_CONFIG["model"]
+        and record.get("key") == key
+    )
+
+
+def run_bulk_summaries(
+    filenames: List[str],
+    data_dir: str = DATA_DIR,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+    add_events: bool = False,
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[int, int, str, str], None]] = None,
+) -> Dict[str, Any]:
+    """
+        (Re)generate summaries for many transcripts with bounded concurrency.
+
+        Only filenames are queued: each worker loads its transcript, checks it and summarizes it,
+        so at most `max_workers` transcripts are in memory at once. Transcripts whose summary record
+        already matches their content and the current prompt version are skipped; legacy summaries
+        and records from another prompt version are regenerated. Every LLM call
+        goes through the shared rate limiter, so a large run queues behind the configured limits
+        rather than tripping provider errors.
+
+        Args:
+            filenames (List[str]): Transcript filenames in `data_dir`.
+            data_dir (str, optional): Directory holding the transcripts.
+            max_workers (int, optional): Transcripts processed concurrently; defaults to SUMMARY_CONFIG.
+            force (bool, optional): Regenerate even up-to-date summaries.
+            add_events (bool, optional): Add proposed calendar events for regenerated summaries.
+            dry_run (bool, optional): Only report which transcripts are stale.
+            on_progress (Callable, optional): Called with (done, total, status, filename) as each
+                transcript finishes; status is one of up_to_date, skipped, stale, generated, failed.
+
+        Returns:
+            Dict[str, Any]: Counts, tokens used, failures and throughput.
+    """
+    workers = max(1, int(max_workers or SUMMARY_CONFIG["bulk_workers"]))
+    started = time.perf_counter()
+    report: Dict[str, Any] = {
+        "total": len(filenames),
+        "up_to_date": 0,
+        "skipped": 0,
+        "generated": 0,
+        "failed": 0,
+        "tokens_used": 0,
+        "stale": [],
+        "failures": [],
+    }
+
+    def process(filename: str) -> Tuple[str, Dict[str, Any]]:
+        try:
+            transcript, language = read_utterances(os.path.join(data_dir, filename))
+        except Exception as e:
+            return "failed", {"error": f"unreadable: {e}"}
+        if not transcript:
+            return "skipped", {}
+        key = summary_key(transcript, language)
+        if not force and is_current_record(load_summary_record(key), key):
+            return "up_to_date", {}
+        if dry_run:
+            return "stale", {}
+        try:
+            # Stale here includes migrated legacy records, which ensure_summary would otherwise serve
+            record, cached = ensure_summary(
+                filename, transcript, language, add_events=add_events, force=True
+            )
+        except Exception as e:
+            return "failed", {"error": str(e), "stale": True}
+        if cached:
+            return "up_to_date", {"stale": True}
+        return "generated", {"stale": True, "tokens": record.get("tokens", 0)}
+
+    outcomes: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(process, filename): filename for filename in filenames}
+        for done, future in enumerate(as_completed(futures), 1):
+            filename = futures[future]
+            outcomes[filename] = future.result()
+            if on_progress:
+                on_progress(done, len(filenames), outcomes[filename][0], filename)
+
+    # Aggregated in input order, so the report does not depend on completion order
+    for filename in filenames:
+        status, detail = outcomes[filename]
+        if status == "stale" or detail.get("stale"):
+            report["stale"].append(filename)
+        if status == "failed":
+            report["failures"].append({"file": filename, "error": detail["error"]})
+        if status != "stale":
+            report[status] += 1
+        report["tokens_used"] += detail.get("tokens", 0)
+
+    elapsed = time.perf_counter() - started
+    report["elapsed_seconds"] = round(elapsed, 2)
+    if not dry_run:
+        report["summaries_per_minute"] = round(report["generated"] / elapsed * 60, 2) if elapsed else 0.0
+        report["tokens_per_minute"] = round(report["tokens_used"] / elapsed * 60) if elapsed else 0
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=f"Regenerate meeting summaries (prompt version {SUMMARY_CONFIG['prompt_version']})."
+    )
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Transcript directory")
+    parser.add_argument("--pattern", default="*.json", help="Filename glob (default: *.json)")
+    parser.add_argument(
+        "--workers", type=int, default=SUMMARY_CONFIG["bulk_workers"], help="Concurrent summaries"
+    )
+    parser.add_argument("--force", action="store_true", help="Regenerate up-to-date summaries too")
+    parser.add_argument(
+        "--add-events", action="store_true", help="Add proposed calendar events"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list stale transcripts")
+    args = parser.parse_args()
+
+    filenames = list_transcripts(args.data_dir, args.pattern)
+    print(f"🧠 Checking {len(filenames)} transcript(s) with {args.workers} worker(s)...")
+
+    def progress(done: int, total: int, status: str, filename: str):
+        print(f"📄 [{done}/{total}] {status}: {filename}")
+
+    report = run_bulk_summaries(
+        filenames,
+        data_dir=args.data_dir,
+        max_workers=args.workers,
+        force=args.force,
+        add_events=args.add_events,
+        dry_run=args.dry_run,
+        on_progress=progress,
+    )
+    if not args.dry_run:
+        report.pop("stale")
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
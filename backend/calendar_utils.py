@@ -1,40 +1,19 @@
-import json
-import os
+from typing import Iterable, Tuple
 
-CALENDAR_FILE = os.path.join("backend/static_data", "calendar_events.json")
+from backend.services.calendar_store import get_calendar_store
 
 
-def add_calendar_event(title: str, date: str):
-    """Add a new event to the calendar JSON file, avoiding duplicate entries."""
-    os.makedirs("backend/static_data", exist_ok=True)
-    events = []
-    if os.path.exists(CALENDAR_FILE):
-        try:
-            with open(CALENDAR_FILE, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                if content:
-                    events = json.loads(content)
-                else:
-                    print("📝 Calendar file exists but is empty, starting fresh")
-        except json.JSONDecodeError as e:
-            print(f"⚠️ JSON parsing error in calendar file: {e}")
-            print("📝 Starting with empty events list")
-            events = []
-        except Exception as e:
-            print(f"⚠️ Error reading calendar file: {e}")
-            events = []
-    else:
-        print("📝 No existing events file found, starting fresh")
-
-    if any(e.get("title") == title and e.get("date") == date for e in events):
-        print(f"⚠️ Event already exists: {title} on {date}")
-        return
+def add_calendar_events(events: Iterable[Tuple[str, str]]) -> int:
+    """Add (title, date) events in one transaction, skipping ones already in the calendar."""
+    events = list(events)
+    added = get_calendar_store().add_events(events)
+    if added < len(events):
+        print(f"⚠️ Skipped {len(events) - added} duplicate or invalid calendar event(s)")
+    if added:
+        print(f"✅ Successfully saved {added} calendar event(s)")
+    return added
 
-    events.append({"title": title, "date": date})
 
-    try:
-        with open(CALENDAR_FILE, "w", encoding="utf-8") as f:
-            json.dump(events, f, indent=2, ensure_ascii=False)
-        print(f"✅ Successfully saved {len(events)} events to {CALENDAR_FILE}")
-    except Exception as e:
-        print(f"❌ Failed to save calendar events: {e}")
+def add_calendar_event(title: str, date: str):
+    """Add a new event to the calendar, avoiding duplicate entries."""
+    add_calendar_events([(title, date)])
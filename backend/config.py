@@ -8,6 +8,42 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
 
+# Shared external-API client layer: pooled connections and per-model rate limits.
+# "rpm" is requests per minute, "tpm" tokens per minute (None disables that bucket).
+API_CLIENT_CONFIG = {
+    "base_url": os.getenv("OPENAI_BASE_URL"),
+    "max_connections": int(os.getenv("OPENAI_MAX_CONNECTIONS", "20")),
+    "max_keepalive_connections": 10,
+    "timeout_seconds": 120,
+    "max_retries": 2,
+}
+
+RATE_LIMITS = {
+    "text-embedding-ada-002": {"rpm": 3000, "tpm": 1000000},
+    "text-embedding-3-small": {"rpm": 3000, "tpm": 1000000},
+    "text-embedding-3-large": {"rpm": 3000, "tpm": 1000000},
+    "gpt-4": {"rpm": 500, "tpm": 10000},
+    "gpt-4-0613": {"rpm": 500, "tpm": 10000},
+    "dall-e-3": {"rpm": 5, "tpm": None},
+    "google-translate": {"rpm": 300, "tpm": None},
+    "default": {"rpm": 500, "tpm": 30000},
+}
+
+# Tail-latency controls per provider: a deadline for every call, an optional hedged retry
+# for idempotent calls, and a circuit breaker that fails fast while a provider is unhealthy.
+PROVIDER_RESILIENCE = {
+    "openai-embeddings": {"deadline_seconds": 15, "hedge_after_seconds": 2.0},
+    "openai-chat": {"deadline_seconds": 90, "hedge_after_seconds": None},
+    "openai-images": {"deadline_seconds": 120, "hedge_after_seconds": None},
+    "google-translate": {"deadline_seconds": 20, "hedge_after_seconds": 5.0},
+    "default": {"deadline_seconds": 60, "hedge_after_seconds": None},
+}
+
+CIRCUIT_BREAKER_CONFIG = {
+    "failure_threshold": 5,
+    "reset_timeout_seconds": 30,
+}
+
 # Language Settings
 SUPPORTED_LANGUAGES = {
     "auto": "Auto Detect",
@@ -28,6 +64,17 @@ ASSEMBLYAI_CONFIG = {
     "speaker_labels": True,
 }
 
+# Transcription backend: "assemblyai", "local" (synthetic, offline),
+# "record" (AssemblyAI + capture responses) or "replay" (serve captured responses)
+TRANSCRIPTION_CONFIG = {
+    "backend": os.getenv("TRANSCRIPTION_BACKEND", "assemblyai"),
+    "local_latency_seconds": float(os.getenv("LOCAL_TRANSCRIPTION_LATENCY", "0")),
+    "local_utterances": int(os.getenv("LOCAL_TRANSCRIPTION_UTTERANCES", "12")),
+    "recordings_dir": os.getenv(
+        "TRANSCRIPTION_RECORDINGS_DIR", "backend/static_data/transcription_recordings"
+    ),
+}
+
 # Translation Settings
 TRANSLATION_CONFIG = {
     "ka": {
@@ -56,7 +103,160 @@ TRANSLATION_CONFIG = {
     },
 }
 
+# Machine translation batching (GoogleTranslator rejects requests over 5000 characters)
+TRANSLATION_BATCH_CONFIG = {
+    "max_chars": 4500,
+    "max_workers": int(os.getenv("TRANSLATION_WORKERS", "4")),
+}
+
+
+# Summary generation. Transcripts above the threshold are summarized map-reduce style:
+# chunks are summarized in parallel and the partial summaries are merged.
+SUMMARY_CONFIG = {
+    "model": "gpt-4-0613",
+    # Bump when the summary prompt changes so cached summaries are regenerated
+    "prompt_version": "2",
+    # Prompt version the legacy summary_<name>.txt files were written with; they are stale once it changes
+    "legacy_prompt_version": "2",
+    "map_reduce_threshold_tokens": 6000,
+    "chunk_tokens": 3000,
+    "max_workers": int(os.getenv("SUMMARY_MAP_WORKERS", "4")),
+    # Transcripts processed concurrently by `python -m backend.bulk_summary`
+    "bulk_workers": int(os.getenv("BULK_SUMMARY_WORKERS", "4")),
+    "map_max_tokens": 600,
+}
+
 
 # File Storage
 DATA_DIR = "backend/data"
 TEMP_DIR = "backend/temp"
+CACHE_DIR = "backend/cache"
+SUMMARY_DIR = os.path.join(DATA_DIR, "summaries")
+
+# Translation memory shared by every translation path
+TRANSLATION_MEMORY_CONFIG = {
+    "enabled": os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() == "true",
+    "path": os.path.join(CACHE_DIR, "translation_memory.sqlite3"),
+    "max_entries": 200000,
+    "max_age_days": 180,
+}
+
+# Batch translation of Georgian transcripts (/api/translate-georgian)
+GEORGIAN_BATCH_CONFIG = {
+    "max_workers": int(os.getenv("GEORGIAN_BATCH_WORKERS", "3")),
+    "checkpoint_path": os.path.join(CACHE_DIR, "translate_georgian_checkpoint.json"),
+}
+
+# Calendar events: SQLite store; /data/calendar_events.json is built from it on request
+CALENDAR_CONFIG = {
+    "path": os.path.join(DATA_DIR, "calendar.sqlite3"),
+    # Pre-SQLite event file, imported once into an empty store
+    "snapshot_path": os.path.join("backend/static_data", "calendar_events.json"),
+    "page_size": 200,
+    "max_page_size": 1000,
+}
+
+# Transcript storage: "compact" (header + offset table + compressed utterance blocks) or "json".
+# Compact files keep the .json name and are recognized by their magic bytes; legacy JSON stays readable.
+# "zstd" needs the optional zstandard package and falls back to zlib without it.
+TRANSCRIPT_STORAGE_CONFIG = {
+    "format": os.getenv("TRANSCRIPT_FORMAT", "compact"),
+    "compression": os.getenv("TRANSCRIPT_COMPRESSION", "zstd"),
+    "block_size": 64,
+    "zlib_level": 6,
+    "zstd_level": 3,
+}
+
+# Transcript catalog: per-transcript stats maintained at write time, backing /api/transcripts
+TRANSCRIPT_CATALOG_CONFIG = {
+    "path": os.path.join(DATA_DIR, "catalog.sqlite3"),
+    "page_size": 50,
+    "max_page_size": 500,
+}
+
+# Conditional GETs and response compression for read-heavy endpoints
+HTTP_CACHE_CONFIG = {
+    "compress_min_bytes": 1024,
+    "gzip_level": 6,
+    "brotli_quality": 5,
+    "body_cache_size": 64,
+}
+
+# Ingest Settings
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
+
+# `ingest_root` is the only server-side directory /api/transcribe-batch may read from (unset
+# disables directory ingest over HTTP; the CLI reads any path). Batches run as background jobs and
+# the reports of the last `max_jobs` are kept for polling.
+BATCH_INGEST_CONFIG = {
+    "max_workers": int(os.getenv("BATCH_INGEST_WORKERS", "3")),
+    "max_files": 200,
+    "ingest_root": os.getenv("BATCH_INGEST_ROOT"),
+    "max_jobs": 50,
+}
+
+# Transcript readiness: readers wait for a publish event (from an in-process writer or the
+# transcript watcher); outside watched directories they also poll every external_recheck_seconds
+TRANSCRIPT_READY_CONFIG = {
+    "timeout_seconds": 30.0,
+    "external_recheck_seconds": 1.0,
+}
+
+# Background watcher that indexes transcripts dropped into DATA_DIR by other tools
+TRANSCRIPT_WATCHER_CONFIG = {
+    "enabled": os.getenv("TRANSCRIPT_WATCHER", "true").lower() == "true",
+    "interval_seconds": 2.0,
+    # A file is processed once its size and mtime have been stable this long
+    "debounce_seconds": 2.0,
+    "batch_size": 16,
+    "checkpoint_path": os.path.join(CACHE_DIR, "transcript_watcher_checkpoint.json"),
+}
+
+# Full vector index rebuild: embedded batches are written as segments under build_dir with a
+# checkpoint, so an interrupted rebuild resumes where it stopped
+VECTOR_INDEX_BUILD_CONFIG = {
+    "build_dir": os.path.join(CACHE_DIR, "index_build"),
+    "batch_size": 16,
+}
+
+# Embedding model migrations: search keeps using the active index generation while a throttled
+# job re-embeds the corpus with the target model, then switches atomically
+EMBEDDING_CONFIG = {
+    "model": os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
+    "reembed_batch_size": 16,
+    "reembed_requests_per_minute": float(os.getenv("REEMBED_REQUESTS_PER_MINUTE", "20")),
+    "reembed_build_dir": os.path.join(CACHE_DIR, "reembed"),
+}
+
+# Near-duplicate detection at ingest: MinHash signatures over word shingles, bucketed with LSH.
+# 16 bands of 8 rows make pairs above ~0.7 Jaccard likely candidates; candidates are confirmed
+# against `threshold` using the full signature.
+NEAR_DUPLICATE_CONFIG = {
+    "path": os.path.join(DATA_DIR, "near_duplicates.sqlite3"),
+    "shingle_size": 5,
+    "num_perm": 128,
+    "bands": 16,
+    "threshold": float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8")),
+}
+
+# Offline language identification (Unicode script, then a character n-gram model for Latin text).
+# Text is scored on its first `sample_chars` characters; a result needs `min_letters` letters and a
+# log-likelihood `min_margin` over the runner-up, otherwise the caller's default is used.
+LANGUAGE_ID_CONFIG = {
+    "ngram_sizes": (1, 2, 3),
+    "sample_chars": 2000,
+    "min_letters": 3,
+    "min_margin": 2.0,
+}
+
+# Visual summaries: the DALL·E images are generated concurrently and cached per (summary hash,
+# visual type, prompt version). DALL·E image URLs expire after an hour, so cached entries expire
+# a little before that.
+VISUAL_CONFIG = {
+    "model": "dall-e-3",
+    # Bump when the visual prompts change so cached images are regenerated
+    "prompt_version": "1",
+    "cache_dir": os.path.join(CACHE_DIR, "visuals"),
+    "ttl_seconds": int(os.getenv("VISUAL_CACHE_TTL", "3300")),
+    "max_workers": 3,
+}
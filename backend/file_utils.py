@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+from typing import Any, Iterable
+
+
+def atomic_write_stream(path: str, chunks: Iterable[bytes]):
+    """
+        Write a sequence of byte chunks to `path` atomically.
+
+        The chunks are written to a temporary file in the same directory, flushed to disk and then
+        renamed over `path`, so readers see either the old file or the complete new one. Only one
+        chunk is held at a time, so large files can be produced from a generator.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: str, content: bytes):
+    """Write bytes to `path` atomically."""
+    atomic_write_stream(path, [content])
+
+
+def atomic_write_text(path: str, content: str):
+    """Write text to `path` atomically (UTF-8)."""
+    atomic_write_bytes(path, content.encode("utf-8"))
+
+
+def atomic_write_json(path: str, data: Any, indent: int = 2):
+    """Serialize `data` as JSON and write it to `path` atomically."""
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=False))
@@ -1,50 +1,393 @@
 import json
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from dotenv import load_dotenv
-from flask import jsonify, request
-from openai import OpenAI
+from flask import Response, jsonify, request, stream_with_context
 
-from backend.calendar_utils import add_calendar_event
-from backend.config import DATA_DIR
+from backend.calendar_utils import add_calendar_events
+from backend.config import DATA_DIR, SUMMARY_CONFIG
+from backend.services.api_clients import create_chat_completion, estimate_tokens
+from backend.services.singleflight import SingleFlight
+from backend.summary_store import find_summary_record, load_summary_record, save_summary_record, summary_key
+from backend.transcript_model import (
+    Transcript,
+    TranscriptLike,
+    as_transcript,
+    load_transcript,
+    wait_for_transcript,
+)
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Coalesces concurrent summary requests for the same transcript content
+summary_flight = SingleFlight()
 
+CALENDAR_FUNCTIONS = [
+    {
+        "name": "add_calendar_event",
+        "description": "Add a task or meeting to the calendar",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "date": {"type": "string", "format": "date"},
+            },
+            "required": ["title", "date"],
+        },
+    }
+]
 
-def load_transcript_safely(filepath, max_attempts=10, wait_time=2):
-    """Safely load a transcript JSON file with retry logic. Supports both utterances and transcript formats."""
-    for attempt in range(1, max_attempts + 1):
+CALENDAR_CALL_PATTERN = r'functions\.add_calendar_event\(\s*\{\s*"title":\s*"([^"]+)",\s*"date":\s*"([^"]+)"\s*\}\s*\)'
+
+MAP_PROMPT = (
+    "You're an expert meeting assistant. The following is part {part} of {total} of a diarized "
+    "meeting transcript. Summarize this part in a few sentences, then list every decision and "
+    "action item it contains with the owner (speaker) and any date mentioned. Do not invent "
+    "information that is not in this part."
+)
+
+
+def follow_duplicate(filepath: str, transcript: Transcript) -> Transcript:
+    """
+        Return the original transcript when `transcript` is a near-duplicate linked to one.
+
+        Summaries are cached by content, so summarizing the original reuses its cached summary
+        instead of paying for a new one for a slightly different copy.
+    """
+    original = transcript.metadata.get("duplicate_of")
+    if not original:
+        return transcript
+    original_path = os.path.join(os.path.dirname(filepath), original)
+    if not os.path.exists(original_path):
+        return transcript
+    print(f"🔗 Using the summary of {original} for its near-duplicate {os.path.basename(filepath)}")
+    return load_transcript(original_path)
+
+
+def load_transcript_safely(filepath, timeout=None):
+    """
+        Load a transcript in any layout, waiting for it to be published if it is not there yet.
+
+        Returns:
+            Tuple: (transcript, language), or (None, None) if the file is missing or has no utterances.
+    """
+    transcript = wait_for_transcript(filepath, timeout)
+    if transcript is None or transcript.layout == "none":
+        print(f"❌ No transcript available at {filepath}")
+        return None, None
+
+    transcript = follow_duplicate(filepath, transcript)
+
+    print(f"✅ Loaded transcript from '{transcript.layout}'")
+    return transcript, transcript.language
+
+
+def build_system_prompt(original_language: str) -> str:
+    """Build the summary system prompt, noting when the transcript was translated."""
+    note = ""
+    if original_language != "en":
+        note = f"(Note: Transcript was originally in {original_language.upper()} and translated to English)\n\n"
+
+    return (
+        note
+        + "You're an expert meeting assistant. Given the diarized transcript, generate:\n"
+        "1. A concise meeting summary (3–5 sentences).\n"
+        "2. A list of clear action items.\n"
+        "3. Assign an owner (speaker) to each action if possible.\n"
+        "4. Suggest a realistic future or past date (not a placeholder) for each action using the format YYYY-MM-DD.\n"
+        '5. If needed, call: functions.add_calendar_event({"title":..., "date":...})'
+    )
+
+
+def format_utterances(utterances: TranscriptLike) -> List[str]:
+    """Render utterances as `speaker: text` lines."""
+    return as_transcript(utterances).lines()
+
+
+def chunk_lines(lines: List[str], max_tokens: int) -> List[str]:
+    """
+        Split transcript lines into chunks of at most `max_tokens` estimated tokens,
+        cutting only between utterances (an over-long utterance becomes its own chunk).
+    """
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for line in lines:
+        line_tokens = estimate_tokens(line)
+        if current and current_tokens + line_tokens > max_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+        current.append(line)
+        current_tokens += line_tokens
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _usage_tokens(response) -> int:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", 0) or 0
+
+
+def _summarize_chunk(chunk: str, part: int, total: int) -> Tuple[str, int]:
+    response = create_chat_completion(
+        model=SUMMARY_CONFIG["model"],
+        messages=[
+            {"role": "system", "content": MAP_PROMPT.format(part=part, total=total)},
+            {"role": "user", "content": chunk},
+        ],
+        max_tokens=SUMMARY_CONFIG["map_max_tokens"],
+        temperature=0.2,
+    )
+    return response.choices[0].message.content or "", _usage_tokens(response)
+
+
+def _prepare_summary_request(
+    utterances: TranscriptLike, original_language: str
+) -> Dict[str, Any]:
+    """
+        Build the final summary request, running the parallel map phase first for long transcripts.
+
+        Returns:
+            Dict[str, Any]: 'messages' for the final request, 'tokens' used so far and the 'mode'.
+    """
+    lines = format_utterances(utterances)
+    speaker_text = "\n".join(lines)
+    system_prompt = build_system_prompt(original_language)
+    tokens_used = 0
+    mode = "single"
+
+    if estimate_tokens(speaker_text) > SUMMARY_CONFIG["map_reduce_threshold_tokens"]:
+        mode = "map_reduce"
+        chunks = chunk_lines(lines, SUMMARY_CONFIG["chunk_tokens"])
+        print(f"🧩 Long transcript: summarizing {len(chunks)} chunks in parallel")
+
+        with ThreadPoolExecutor(max_workers=SUMMARY_CONFIG["max_workers"]) as executor:
+            partials = list(
+                executor.map(
+                    lambda args: _summarize_chunk(args[1], args[0], len(chunks)),
+                    enumerate(chunks, 1),
+                )
+            )
+        tokens_used += sum(tokens for _, tokens in partials)
+
+        system_prompt += (
+            "\n\nThe transcript was too long to send at once, so you are given summaries of its "
+            "consecutive parts. Merge them into one summary of the whole meeting."
+        )
+        speaker_text = "\n\n".join(
+            f"Part {idx}:\n{summary}" for idx, (summary, _) in enumerate(partials, 1)
+        )
+
+    return {
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": speaker_text},
+        ],
+        "tokens": tokens_used,
+        "mode": mode,
+    }
+
+
+def _build_result(
+    content: str,
+    function_name: Optional[str],
+    function_arguments: Optional[str],
+    tokens: int,
+    mode: str,
+) -> Dict[str, Any]:
+    """Collect the summary text and proposed calendar events from a finished completion."""
+    summary_text = content or "No summary generated."
+
+    calendar_events = []
+    if function_name == "add_calendar_event":
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            args = json.loads(function_arguments)
+            calendar_events.append((args["title"], args["date"]))
+        except Exception as calendar_error:
+            print("⚠️ Structured function call failed:", calendar_error)
 
-            if isinstance(data, dict):
-                if "utterances" in data:
-                    print(f"✅ Loaded transcript from 'utterances' (Attempt {attempt})")
-                    return data["utterances"], data.get("language", "en")
-                elif "transcript" in data:
-                    print(f"✅ Loaded transcript from 'transcript' (Attempt {attempt})")
-                    return data["transcript"], data.get("language", "en")
+    calendar_events.extend(re.findall(CALENDAR_CALL_PATTERN, summary_text))
 
-            if isinstance(data, list):
-                print(f"✅ Loaded transcript from raw list (Attempt {attempt})")
-                return data, "en"
+    return {
+        "summary": summary_text,
+        "calendar_events": calendar_events,
+        "tokens": tokens,
+        "mode": mode,
+    }
 
-            time.sleep(wait_time)
 
-        except Exception as e:
-            print(f"⏳ Attempt {attempt}: JSON error ({e}), retrying...")
-            time.sleep(wait_time)
+def summarize_utterances(
+    utterances: TranscriptLike, original_language: str = "en"
+) -> Dict[str, Any]:
+    """
+        Summarize a transcript with GPT-4, switching to map-reduce for long transcripts.
+
+        Short transcripts are sent in a single request. Above SUMMARY_CONFIG["map_reduce_threshold_tokens"]
+        the transcript is split by utterance into token-bounded chunks that are summarized in parallel,
+        and the partial summaries are merged in a final request that keeps the calendar function calling.
+
+        Args:
+            utterances (TranscriptLike): Transcript or utterance dicts with speaker and text.
+            original_language (str, optional): Language the meeting was held in.
+
+        Returns:
+            Dict[str, Any]: 'summary' text, 'calendar_events' as (title, date) tuples,
+                            'tokens' used and the 'mode' ("single" or "map_reduce").
+    """
+    prepared = _prepare_summary_request(utterances, original_language)
+
+    response = create_chat_completion(
+        model=SUMMARY_CONFIG["model"],
+        messages=prepared["messages"],
+        functions=CALENDAR_FUNCTIONS,
+        function_call="auto",
+    )
+
+    message = response.choices[0].message
+    function_call = message.function_call
+    return _build_result(
+        message.content,
+        function_call.name if function_call else None,
+        function_call.arguments if function_call else None,
+        prepared["tokens"] + _usage_tokens(response),
+        prepared["mode"],
+    )
+
 
-    print(f"❌ File not ready after {max_attempts} attempts")
-    return None, None
+def stream_summarize_utterances(
+    utterances: TranscriptLike, original_language: str = "en"
+) -> Iterator[Tuple[str, Any]]:
+    """
+        Streaming variant of `summarize_utterances`.
+
+        Yields ("status", message) while long transcripts go through the map phase, ("token", text)
+        for every content delta of the final completion, and finally ("result", result) with the same
+        result dictionary as `summarize_utterances`. Function-call deltas are accumulated until the
+        stream ends, since the call's name and JSON arguments arrive in fragments.
+    """
+    utterances = as_transcript(utterances)
+    if estimate_tokens("\n".join(format_utterances(utterances))) > SUMMARY_CONFIG[
+        "map_reduce_threshold_tokens"
+    ]:
+        yield "status", "Summarizing long transcript in parts..."
+
+    prepared = _prepare_summary_request(utterances, original_language)
+
+    stream = create_chat_completion(
+        model=SUMMARY_CONFIG["model"],
+        messages=prepared["messages"],
+        functions=CALENDAR_FUNCTIONS,
+        function_call="auto",
+        stream=True,
+    )
+
+    content_parts: List[str] = []
+    function_name = None
+    argument_parts: List[str] = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta.content:
+            content_parts.append(delta.content)
+            yield "token", delta.content
+        if delta.function_call:
+            if delta.function_call.name:
+                function_name = delta.function_call.name
+            if delta.function_call.arguments:
+                argument_parts.append(delta.function_call.arguments)
+
+    content = "".join(content_parts)
+    arguments = "".join(argument_parts)
+    # Streamed responses carry no usage block, so the final request is estimated
+    tokens = (
+        prepared["tokens"]
+        + sum(estimate_tokens(m["content"]) for m in prepared["messages"])
+        + estimate_tokens(content)
+        + estimate_tokens(arguments)
+    )
+    yield "result", _build_result(
+        content, function_name, arguments or None, tokens, prepared["mode"]
+    )
+
+
+def add_summary_events(calendar_events: List[Tuple[str, str]]):
+    """Add the calendar events proposed by a summary in one batch."""
+    if not calendar_events:
+        return
+    try:
+        add_calendar_events(calendar_events)
+    except Exception as e:
+        print(f"⚠️ Failed to add calendar events: {e}")
+
+
+def ensure_summary(
+    filename: str,
+    utterances: TranscriptLike,
+    original_language: str = "en",
+    add_events: bool = True,
+    force: bool = False,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+        Return the summary record for a transcript, generating and storing it if needed.
+
+        Concurrent calls for the same transcript content share one generation.
+
+        Args:
+            filename (str): Transcript filename, stored as the record's source.
+            utterances (TranscriptLike): Transcript or utterance dicts.
+            original_language (str, optional): Language the meeting was held in.
+            add_events (bool, optional): Add the proposed calendar events after generating.
+            force (bool, optional): Regenerate even if a record for this content already exists.
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: The record and whether it came from the cache (or another flight).
+    """
+    utterances = as_transcript(utterances)
+    key = summary_key(utterances, original_language)
+    if not force:
+        record = find_summary_record(key, filename, original_language)
+        if record:
+            return record, True
+
+    def summarize_and_store():
+        # Another flight may have stored the summary since the lookup above
+        existing = None if force else find_summary_record(key, filename, original_language)
+        if existing:
+            return existing, True
+        result = summarize_utterances(utterances, original_language)
+        stored = save_summary_record(key, filename, result, original_language)
+        if add_events:
+            add_summary_events(result["calendar_events"])
+        return stored, False
+
+    (record, cached), shared = summary_flight.do(key, summarize_and_store)
+    return record, cached or shared
+
+
+def summary_response(record: Dict[str, Any], cached: bool) -> Dict[str, Any]:
+    """Shape a stored summary record for the /api/summary response."""
+    return {
+        "summary": record["summary"],
+        "summary_file": f"{record['key']}.json",
+        "action_items": record["action_items"],
+        "owners": record["owners"],
+        "dates": record["dates"],
+        "mode": record.get("mode"),
+        "cached": cached,
+    }
+
+
+def _requested_filename() -> Optional[str]:
+    if request.method == "POST":
+        return (request.get_json(silent=True) or {}).get("filename")
+    return request.args.get("filename")
 
 
 def generate_summary():
-    """Generate a structured meeting summary and action items using GPT-4. Supports function calling for adding calendar events."""
+    """Generate a structured meeting summary and action items using GPT-4. Supports function calling for adding calendar events.
+    Summaries are cached by transcript content and prompt version, so a cache hit is a key lookup."""
     try:
         if request.method == "GET":
             filename = request.args.get("filename")
@@ -61,92 +404,86 @@ def generate_summary():
         if not os.path.exists(filepath):
             return jsonify({"error": "Transcript file not found"}), 404
 
-        summary_filename = f"summary_{filename.replace('.json', '.txt')}"
-        summary_path = os.path.join(DATA_DIR, summary_filename)
-        if os.path.exists(summary_path):
-            with open(summary_path, "r", encoding="utf-8") as f:
-                saved_summary = f.read()
-            return jsonify(
-                {
-                    "summary": saved_summary,
-                    "summary_file": summary_filename,
-                    "cached": True,
-                }
-            )
-
         utterances, original_language = load_transcript_safely(filepath)
         if not utterances:
             return jsonify({"error": "Transcript could not be loaded."}), 500
 
-        speaker_text = "\n".join([f"{u['speaker']}: {u['text']}" for u in utterances])
+        record, cached = ensure_summary(filename, utterances, original_language)
+        return jsonify(summary_response(record, cached=cached))
+
+    except Exception as e:
+        print("❌ Summary generation error:", e)
+        return jsonify({"error": str(e)}), 500
+
 
-        note = ""
-        if original_language != "en":
-            note = f"(Note: Transcript was originally in {original_language.upper()} and translated to English)\n\n"
+def _sse(event: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
 
-        system_prompt = (
-            note
-            + "You're an expert meeting assistant. Given the diarized transcript, generate:\n"
-            "1. A concise meeting summary (3–5 sentences).\n"
-            "2. A list of clear action items.\n"
-            "3. Assign an owner (speaker) to each action if possible.\n"
-            "4. Suggest a realistic future or past date (not a placeholder) for each action using the format YYYY-MM-DD.\n"
-            '5. If needed, call: functions.add_calendar_event({"title":..., "date":...})'
-        )
 
-        functions = [
-            {
-                "name": "add_calendar_event",
-                "description": "Add a task or meeting to the calendar",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "title": {"type": "string"},
-                        "date": {"type": "string", "format": "date"},
-                    },
-                    "required": ["title", "date"],
-                },
-            }
-        ]
-
-        response = client.chat.completions.create(
-            model="gpt-4-0613",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": speaker_text},
-            ],
-            functions=functions,
-            function_call="auto",
-        )
+def stream_summary():
+    """Stream summary generation as server-sent events.
 
-        choice = response.choices[0]
-        summary_text = choice.message.content or "No summary generated."
+    Emits `token` events as the completion is generated, then a `done` event with the same fields as
+    /api/summary after the summary is cached and its calendar events are added. Cached summaries are
+    sent as a single `done` event."""
+    filename = _requested_filename()
+    if not filename:
+        return jsonify({"error": "Filename not provided"}), 400
 
-        with open(summary_path, "w", encoding="utf-8") as f:
-            f.write(summary_text)
+    filepath = os.path.join(DATA_DIR, filename)
+    if not os.path.exists(filepath):
+        return jsonify({"error": "Transcript file not found"}), 404
 
-        if (
-            choice.message.function_call
-            and choice.message.function_call.name == "add_calendar_event"
-        ):
-            try:
-                args = json.loads(choice.message.function_call.arguments)
-                add_calendar_event(args["title"], args["date"])
-            except Exception as calendar_error:
-                print("⚠️ Structured function call failed:", calendar_error)
-
-        pattern = r'functions\.add_calendar_event\(\s*\{\s*"title":\s*"([^"]+)",\s*"date":\s*"([^"]+)"\s*\}\s*\)'
-        matches = re.findall(pattern, summary_text)
-        for match in matches:
+    def generate():
+        try:
+            utterances, original_language = load_transcript_safely(filepath)
+            if not utterances:
+                yield _sse({"type": "error", "error": "Transcript could not be loaded."})
+                return
+
+            key = summary_key(utterances, original_language)
+            record = find_summary_record(key, filename, original_language)
+            if record:
+                yield _sse({"type": "done", **summary_response(record, cached=True)})
+                return
+
+            call, leader = summary_flight.begin(key)
+            if not leader:
+                yield _sse({"type": "status", "message": "Summary already in progress..."})
+                record, _ = call.wait()
+                yield _sse({"type": "done", **summary_response(record, cached=True)})
+                return
+
+            record = None
             try:
-                title, date = match
-                add_calendar_event(title, date)
-                print(f"✅ Successfully added calendar event: {title}")
-            except Exception as e:
-                print(f"⚠️ Failed to add calendar event: {e}")
+                record = load_summary_record(key)
+                if record:
+                    yield _sse({"type": "done", **summary_response(record, cached=True)})
+                    return
 
-        return jsonify({"summary": summary_text, "summary_file": summary_filename})
+                for kind, payload in stream_summarize_utterances(utterances, original_language):
+                    if kind == "token":
+                        yield _sse({"type": "token", "content": payload})
+                    elif kind == "status":
+                        yield _sse({"type": "status", "message": payload})
+                    else:
+                        record = save_summary_record(key, filename, payload, original_language)
+                        add_summary_events(payload["calendar_events"])
+                        yield _sse({"type": "done", **summary_response(record, cached=False)})
+            finally:
+                if record:
+                    summary_flight.finish(key, call, result=(record, False))
+                else:
+                    summary_flight.finish(
+                        key, call, error=Exception("Summary generation did not complete")
+                    )
 
-    except Exception as e:
-        print("❌ Summary generation error:", e)
-        return jsonify({"error": str(e)}), 500
+        except Exception as e:
+            print("❌ Streaming summary error:", e)
+            yield _sse({"type": "error", "error": str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,102 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Tuple
+
+from flask import Response, current_app, request
+
+from backend.config import HTTP_CACHE_CONFIG
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip is used when brotli is not installed
+    brotli = None
+
+_body_cache: "OrderedDict[Tuple[str, str], Tuple[str, bytes, Optional[str]]]" = OrderedDict()
+_body_cache_lock = threading.Lock()
+
+
+def _choose_encoding() -> Optional[str]:
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=HTTP_CACHE_CONFIG["brotli_quality"])
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=HTTP_CACHE_CONFIG["gzip_level"])
+    return body
+
+
+def _not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return bool(since and last_modified and last_modified.replace(microsecond=0) <= since)
+
+
+def cached_response(
+    version: str,
+    build: Callable[[], Any],
+    last_modified: Optional[float] = None,
+    mimetype: str = "application/json",
+) -> Response:
+    """
+        Answer a GET with validators derived from a store version, 304s and compression.
+
+        The ETag is a hash of `version` and the request path with query string, so each page or
+        filter has its own validator. `build` is only called when the client's copy is stale and
+        no body for this version is cached; it returns bytes or a JSON-serializable object.
+        Bodies over `compress_min_bytes` are sent brotli- or gzip-encoded when the client accepts it.
+
+        Args:
+            version (str): Changes whenever the underlying data changes.
+            build (Callable[[], Any]): Produces the response body.
+            last_modified (float, optional): Timestamp of the latest change, for Last-Modified.
+            mimetype (str, optional): Response content type.
+
+        Returns:
+            Response: 200 with the (possibly compressed) body, or 304 Not Modified.
+    """
+    etag = hashlib.sha256(f"{version}|{request.full_path}".encode("utf-8")).hexdigest()[:32]
+    modified_at = (
+        datetime.fromtimestamp(last_modified, timezone.utc) if last_modified is not None else None
+    )
+
+    if _not_modified(etag, modified_at):
+        response = Response(status=304)
+    else:
+        encoding = _choose_encoding()
+        key = (request.full_path, encoding or "identity")
+        with _body_cache_lock:
+            cached = _body_cache.get(key)
+        if cached and cached[0] == version:
+            _, body, used_encoding = cached
+        else:
+            payload = build()
+            body = payload if isinstance(payload, bytes) else current_app.json.dumps(payload).encode("utf-8")
+            used_encoding = encoding if len(body) >= HTTP_CACHE_CONFIG["compress_min_bytes"] else None
+            body = _compress(body, used_encoding)
+            with _body_cache_lock:
+                _body_cache[key] = (version, body, used_encoding)
+                _body_cache.move_to_end(key)
+                while len(_body_cache) > HTTP_CACHE_CONFIG["body_cache_size"]:
+                    _body_cache.popitem(last=False)
+
+        response = Response(body, mimetype=mimetype)
+        if used_encoding:
+            response.headers["Content-Encoding"] = used_encoding
+
+    response.set_etag(etag, weak=True)
+    if modified_at:
+        response.last_modified = modified_at
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
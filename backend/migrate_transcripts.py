@@ -0,0 +1,128 @@
+import argparse
+import json
+import os
+from typing import Any, Dict, Optional
+
+from backend.config import DATA_DIR, GEORGIAN_BATCH_CONFIG
+from backend.file_utils import atomic_write_bytes, atomic_write_json
+from backend.services.transcript_catalog import TranscriptCatalog, get_transcript_catalog
+from backend.transcript_format import (
+    FORMAT_VERSION,
+    compact_version,
+    encode_transcript,
+    loads_transcript,
+)
+from backend.translation_batch import load_checkpoint
+
+
+def _encode(data: Any, target: str) -> bytes:
+    if target == "compact":
+        return encode_transcript(data)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def migrate_transcripts(
+    data_dir: str = DATA_DIR,
+    target: str = "compact",
+    dry_run: bool = False,
+    checkpoint_path: str = GEORGIAN_BATCH_CONFIG["checkpoint_path"],
+    catalog: Optional[TranscriptCatalog] = None,
+) -> Dict[str, Any]:
+    """
+        Convert every transcript in `data_dir` to the target storage format in place.
+
+        Each file is decoded, re-encoded, checked to round-trip to identical data and then replaced
+        atomically with its modification time preserved. Files already in the target format are
+        skipped, so the migration can be re-run safely; compact files from an older format version
+        are re-encoded (e.g. to add the time index). Translation checkpoint entries and catalog
+        rows for converted files are refreshed, so nothing is re-translated because a size changed.
+
+        Args:
+            data_dir (str, optional): Transcript directory.
+            target (str, optional): 'compact' or 'json' (to roll back).
+            dry_run (bool, optional): Only report what would change.
+            checkpoint_path (str, optional): Georgian translation checkpoint to keep in sync.
+            catalog (TranscriptCatalog, optional): Catalog whose rows are refreshed for converted files.
+
+        Returns:
+            Dict[str, Any]: Counts, failures and total bytes before and after.
+    """
+    if target not in ("compact", "json"):
+        raise ValueError("target must be 'compact' or 'json'")
+
+    report: Dict[str, Any] = {
+        "converted": 0,
+        "skipped": 0,
+        "failed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+        "failures": [],
+    }
+    checkpoint = load_checkpoint(checkpoint_path)
+    checkpoint_changed = False
+
+    for filename in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, filename)
+        if not filename.endswith(".json") or not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            version = compact_version(raw)
+            if (target == "compact" and version == FORMAT_VERSION) or (target == "json" and version is None):
+                report["skipped"] += 1
+                continue
+
+            data = loads_transcript(raw)
+            encoded = _encode(data, target)
+            if loads_transcript(encoded) != data:
+                raise ValueError("re-encoded transcript does not round-trip")
+
+            report["converted"] += 1
+            report["bytes_before"] += len(raw)
+            report["bytes_after"] += len(encoded)
+            if dry_run:
+                continue
+
+            stat = os.stat(path)
+            atomic_write_bytes(path, encoded)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            record = checkpoint.get(filename)
+            if record and record.get("source_size") == stat.st_size:
+                record["source_size"] = len(encoded)
+                checkpoint_changed = True
+            if catalog is not None:
+                catalog.record(filename, data, path)
+        except Exception as e:
+            report["failed"] += 1
+            report["failures"].append({"file": filename, "error": str(e)})
+
+    if checkpoint_changed:
+        atomic_write_json(checkpoint_path, checkpoint)
+
+    if report["bytes_before"]:
+        report["size_ratio"] = round(report["bytes_after"] / report["bytes_before"], 3)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert stored transcripts between JSON and the compact format.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Transcript directory")
+    parser.add_argument(
+        "--to", dest="target", choices=("compact", "json"), default="compact", help="Target format"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    args = parser.parse_args()
+
+    catalog = (
+        get_transcript_catalog()
+        if os.path.abspath(args.data_dir) == os.path.abspath(DATA_DIR) and not args.dry_run
+        else None
+    )
+    report = migrate_transcripts(args.data_dir, args.target, args.dry_run, catalog=catalog)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,99 @@
+import argparse
 import json
-import os
+import re
+import shutil
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
 
-from openai import OpenAI
-from dotenv import load_dotenv
-
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from backend.config import VECTOR_INDEX_BUILD_CONFIG
+from backend.file_utils import atomic_write_json, atomic_write_stream, atomic_write_text
+from backend.services.api_clients import create_embedding
+from backend.transcript_model import Transcript, load_transcript, wait_for_transcript
 
 DATA_FOLDER = Path(__file__).resolve().parent.parent / "data"
 INDEX_FILE = Path(__file__).resolve().parent / "vector_index.json"
 
+# Model of indexes built before generations existed (no manifest next to INDEX_FILE)
+LEGACY_EMBEDDING_MODEL = "text-embedding-ada-002"
 
-def load_transcripts():
+# Serializes read-modify-write cycles on the index file between worker threads
+_index_lock = threading.Lock()
+
+
+def _manifest_file() -> Path:
+    return INDEX_FILE.parent / "index_manifest.json"
+
+
+def generation_file(model: str) -> Path:
+    """Return the index file of the generation embedded with `model`."""
+    return INDEX_FILE.parent / f"vector_index.{re.sub(r'[^A-Za-z0-9.-]+', '-', model)}.json"
+
+
+def active_generation():
     """
-    Load and process transcript files from the DATA_FOLDER directory.
+        Return the generation that search reads: {'model': embedding model, 'file': index path}.
 
-    Returns:
-        list: A list of dictionaries containing processed transcripts.
-              Each dictionary has two keys:
-              - 'source': The filename of the transcript
-              - 'text': The concatenated text content of all utterances
+        The manifest next to the index names it; without a manifest the original
+        `vector_index.json`, embedded with text-embedding-ada-002, is active.
+    """
+    manifest = _manifest_file()
+    if manifest.exists():
+        with open(manifest, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {"model": data["model"], "file": INDEX_FILE.parent / data["file"]}
+    return {"model": LEGACY_EMBEDDING_MODEL, "file": INDEX_FILE}
+
+
+def _switch_generation(model: str):
+    """Make the generation embedded with `model` the one search reads (callers hold _index_lock)."""
+    previous = active_generation()
+    atomic_write_json(
+        str(_manifest_file()),
+        {
+            "model": model,
+            "file": generation_file(model).name,
+            "switched_at": datetime.now().isoformat(),
+            "previous": {"model": previous["model"], "file": previous["file"].name},
+        },
+    )
+
+
+def indexable_text(transcript: Transcript, name: str):
+    """
+        Return the text to embed for a transcript, or None if it should not be indexed.
+
+        Only the 'transcript' and raw list layouts are indexed, and untranslated non-English
+        transcripts and near-duplicates linked to an original are skipped. The text is the transcript's shared text buffer, so no per-file
+        string is built for the embedding.
+    """
+    if transcript.metadata.get("duplicate_of"):
+        print(f"🔗 Skipping near-duplicate of {transcript.metadata['duplicate_of']}: {name}")
+        return None
+    if transcript.layout == "transcript":
+        if transcript.original_language != "en" and not transcript.translated:
+            print(f"⚠️ Skipping untranslated non-English file: {name}")
+            return None
+    elif transcript.layout != "list":
+        print(f"⚠️ Unknown format in: {name}")
+        return None
+
+    if not transcript.full_text.strip():
+        print(f"⚠️ No text content in {name}")
+        return None
+    return transcript.full_text
+
+
+def iter_transcripts(after=None):
+    """
+    Yield processed transcripts from the DATA_FOLDER directory one at a time, in filename order.
+
+    Args:
+        after (str, optional): Only yield transcripts whose filename sorts after this one (to resume).
+
+    Yields:
+        dict: {'source': filename, 'text': concatenated text of all utterances}
 
     Handles multiple transcript formats:
     - Dictionary with 'transcript' key
@@ -29,158 +101,295 @@ def load_transcripts():
     - Skips untranslated non-English files
     - Skips files with invalid formats or empty content
     """
-    transcripts = []
-    for file in DATA_FOLDER.glob("*.json"):
+    for file in sorted(DATA_FOLDER.glob("*.json")):
+        if after is not None and file.name <= after:
+            continue
         try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-                if isinstance(data, dict) and "transcript" in data:
-                    original_lang = data.get("original_language", "en")
-                    is_translated = data.get("translated", False)
+            full_text = indexable_text(load_transcript(str(file)), file.name)
+            if full_text is None:
+                continue
 
-                    if original_lang != "en" and not is_translated:
-                        print(f"⚠️ Skipping untranslated non-English file: {file.name}")
-                        continue
+            yield {"source": file.name, "text": full_text}
 
-                    utterances = data["transcript"]
+        except Exception as e:
+            print(f"❌ Error processing {file.name}: {e}")
 
-                elif isinstance(data, list):
-                    utterances = data
-                else:
-                    print(f"⚠️ Unknown format in: {file.name}")
-                    continue
 
-                full_text = " ".join([u["text"] for u in utterances if "text" in u])
-                if not full_text.strip():
-                    print(f"⚠️ No text content in {file.name}")
-                    continue
-
-                transcripts.append({"source": file.name, "text": full_text})
+def load_transcripts():
+    """
+    Load and process transcript files from the DATA_FOLDER directory.
 
-        except Exception as e:
-            print(f"❌ Error processing {file.name}: {e}")
-    return transcripts
+    Returns:
+        list: A list of dictionaries containing processed transcripts.
+              Each dictionary has two keys:
+              - 'source': The filename of the transcript
+              - 'text': The concatenated text content of all utterances
+    """
+    return list(iter_transcripts())
 
 
-def get_embedding(text: str):
+def get_embedding(text: str, model=None):
     """
-        Generate an embedding vector for the given text using OpenAI's text-embedding-ada-002 model.
+        Generate an embedding vector for the given text.
 
         Args:
             text (str): The input text for which the embedding is to be generated.
+            model (str, optional): Embedding model; defaults to the active generation's model.
 
         Returns:
             list[float] | None: A list of floating point numbers representing the embedding vector,
                                 or None if the embedding generation fails.
     """
     try:
-        response = client.embeddings.create(model="text-embedding-ada-002", input=text)
+        response = create_embedding(text, model=model or active_generation()["model"])
         return response.data[0].embedding
     except Exception as e:
         print(f"❌ Failed to get embedding: {e}")
         return None
 
 
-def build_vector_index():
+def get_embeddings(texts, model=None):
     """
-        Build a vector index from transcript files in the `DATA_FOLDER`.
+        Generate embeddings for several texts in one request.
 
-        This method processes transcript files, generates embeddings for their content using OpenAI's embedding model,
-        and saves the resulting index to the `INDEX_FILE`. It handles multiple transcript formats and skips files
-        with untranslated non-English content or invalid formats.
+        Returns:
+            list[list[float]] | None: One vector per text, in order, or None if the request fails.
+    """
+    try:
+        response = create_embedding(list(texts), model=model or active_generation()["model"])
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    except Exception as e:
+        print(f"❌ Failed to get embeddings: {e}")
+        return None
 
-        Steps:
-        1. Load transcript files from the `DATA_FOLDER`.
-        2. Generate embeddings for the text content of each transcript.
-        3. Save the embeddings along with the source filename and text content to the `INDEX_FILE`.
 
-        Returns:
-            None
+def load_index(path=None):
+    """Load the records of an index file (the active generation by default), or [] if unreadable."""
+    path = Path(path) if path else active_generation()["file"]
+    try:
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Error loading existing index: {e}, creating new one")
+    return []
+
+
+def indexed_texts(path=None):
+    """Return {source: embedded text} for every record in an index (the active generation by default)."""
+    with _index_lock:
+        return {item.get("source"): item.get("text") for item in load_index(path)}
+
+
+def update_index(records, removed=(), model=None, path=None, replace=True):
     """
-    transcripts = load_transcripts()
-    print(f"🔍 Found {len(transcripts)} transcript files.")
+        Replace or add index records by source and drop removed sources, in one atomic write.
 
-    index = []
-    for t in transcripts:
-        print(f"📄 Processing: {t['source']}")
-        embedding = get_embedding(t["text"])
-        if embedding:
-            index.append(
-                {"embedding": embedding, "text": t["text"], "source": t["source"]}
-            )
+        Args:
+            records (list[dict]): Records with 'embedding', 'text' and 'source'.
+            removed (Iterable[str]): Sources to drop from the index.
+            model (str, optional): Model the records were embedded with. If the active generation
+                switched to another model meanwhile, they are re-embedded with the new one.
+            path (str, optional): Write this generation file instead of the active one.
+            replace (bool, optional): Replace existing records for the same source (else keep them).
 
-    with open(INDEX_FILE, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2)
-    print(f"✅ Embeddings saved to {INDEX_FILE.name}")
+        Returns:
+            int: Number of records written.
+    """
+    if not records and not removed:
+        return 0
+    with _index_lock:
+        if path is None:
+            generation = active_generation()
+            path = generation["file"]
+            if records and model and model != generation["model"]:
+                embeddings = get_embeddings([record["text"] for record in records], generation["model"])
+                if embeddings is None:
+                    raise RuntimeError(f"Could not re-embed records for {generation['model']}")
+                records = [{**record, "embedding": e} for record, e in zip(records, embeddings)]
+
+        index = load_index(path)
+        if not replace:
+            existing = {item.get("source") for item in index}
+            records = [record for record in records if record["source"] not in existing]
+        dropped = {record["source"] for record in records} | set(removed)
+        index = [item for item in index if item.get("source") not in dropped]
+        index.extend(records)
+        atomic_write_json(str(path), index)
+        return len(records)
+
+
+def switch_when_caught_up(model, source_model):
+    """
+        Atomically switch search to the `model` generation if it holds every active record.
 
+        Runs under the index lock, so no write can land in the old generation between the check
+        and the switch. Records added or changed in the active generation since the new one was
+        built are returned instead, for the caller to embed before trying again; records deleted
+        meanwhile are dropped from the new generation.
 
-def wait_for_file_ready(file_path, max_attempts=10, initial_wait=0.5):
+        Args:
+            model (str): Model of the new generation.
+            source_model (str): Model the new generation was built from; nothing is switched if the
+                active generation is no longer that one.
+
+        Returns:
+            list[dict]: {'source', 'text'} records still missing (empty once switched).
     """
-    Wait for file to be fully written and contain valid JSON (dict or list).
-    Uses exponential backoff for more reliable file reading.
+    with _index_lock:
+        active = active_generation()
+        if active["model"] != source_model:
+            raise RuntimeError(f"Active generation changed to {active['model']} during the migration")
+        current = {item["source"]: item["text"] for item in load_index(active["file"])}
+        target = generation_file(model)
+        built = load_index(target)
+        built_texts = {item["source"]: item["text"] for item in built}
+        missing = [
+            {"source": source, "text": text}
+            for source, text in sorted(current.items())
+            if built_texts.get(source) != text
+        ]
+        if missing:
+            return missing
+        if len(built) != len(current):
+            atomic_write_json(str(target), [item for item in built if item["source"] in current])
+        _switch_generation(model)
+        return []
+
+
+def _batches(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_build_checkpoint(build_dir: Path):
+    path = build_dir / "checkpoint.json"
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"segments": [], "last_source": None, "records": 0}
+
+
+def _index_chunks(segment_paths):
+    """Yield the bytes of a JSON index assembled from JSONL segments, one record at a time."""
+    yield b"["
+    first = True
+    for segment_path in segment_paths:
+        with open(segment_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                yield (b"\n" if first else b",\n") + line
+                first = False
+    yield b"\n]\n"
+
+
+def build_vector_index(
+    batch_size=None,
+    build_dir=None,
+    restart=False,
+    records=None,
+    model=None,
+    path=None,
+    requests_per_minute=None,
+    on_batch=None,
+):
     """
-    for attempt in range(max_attempts):
-        try:
-            if not file_path.exists():
-                print(f"⏳ Attempt {attempt + 1}: File doesn't exist yet, waiting...")
-                time.sleep(initial_wait * (1.5**attempt))
-                continue
+        Rebuild a vector index as a streaming pipeline (all transcripts into the active generation by default).
 
-            file_size = file_path.stat().st_size
-            if file_size == 0:
-                print(f"⏳ Attempt {attempt + 1}: File is empty, waiting...")
-                time.sleep(initial_wait * (1.5**attempt))
-                continue
+        Records are read one at a time in source order, embedded in batches, and each batch is
+        written to its own JSONL segment before the checkpoint records it, so memory stays flat and
+        an interrupted rebuild (crash, provider outage) resumes after the last completed batch when
+        run again. Once every record is embedded the segments are streamed into the index file,
+        which is replaced atomically, and the build directory is removed.
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
+        Args:
+            batch_size (int, optional): Records per embedding request and segment.
+            build_dir (str, optional): Where segments and the checkpoint are kept.
+            restart (bool, optional): Discard an unfinished build instead of resuming it.
+            records (Callable, optional): `records(after)` yielding {'source', 'text'} sorted by
+                source; defaults to `iter_transcripts`.
+            model (str, optional): Embedding model; defaults to the active generation's.
+            path (str, optional): Index file to write; defaults to the active generation's.
+            requests_per_minute (float, optional): Throttle embedding requests to this rate.
+            on_batch (Callable, optional): Called with the number of records embedded so far.
 
-            if not content:
-                print(f"⏳ Attempt {attempt + 1}: File content is empty, waiting...")
-                time.sleep(initial_wait * (1.5**attempt))
-                continue
+        Returns:
+            bool: True if the index was rebuilt, False if the build stopped early (re-run to resume).
+    """
+    generation = active_generation()
+    model = model or generation["model"]
+    path = Path(path) if path else generation["file"]
+    records = records or iter_transcripts
+    batch_size = batch_size or VECTOR_INDEX_BUILD_CONFIG["batch_size"]
+    build_dir = Path(build_dir or VECTOR_INDEX_BUILD_CONFIG["build_dir"])
+    if restart and build_dir.exists():
+        shutil.rmtree(build_dir)
+    build_dir.mkdir(parents=True, exist_ok=True)
+
+    checkpoint = load_build_checkpoint(build_dir)
+    if checkpoint["last_source"]:
+        print(
+            f"⏩ Resuming rebuild after {checkpoint['last_source']} "
+            f"({checkpoint['records']} transcripts already embedded)"
+        )
 
-            data = json.loads(content)
-
-            if isinstance(data, dict):
-                if "transcript" in data or "utterances" in data:
-                    print(
-                        f"✅ File ready with dict structure after {attempt + 1} attempts"
-                    )
-                    return content, data
-                else:
-                    print(
-                        f"⏳ Attempt {attempt + 1}: Dict missing expected keys, waiting..."
-                    )
-                    time.sleep(initial_wait * (1.5**attempt))
-                    continue
+    min_interval = 60.0 / requests_per_minute if requests_per_minute else 0
+    last_request = None
+    for batch in _batches(records(after=checkpoint["last_source"]), batch_size):
+        if last_request is not None and min_interval:
+            time.sleep(max(0.0, last_request + min_interval - time.monotonic()))
+        last_request = time.monotonic()
+
+        print(f"📄 Embedding {len(batch)} transcripts: {batch[0]['source']} … {batch[-1]['source']}")
+        embeddings = get_embeddings([t["text"] for t in batch], model)
+        if embeddings is None:
+            print("❌ Rebuild stopped; run it again to resume from the last completed batch")
+            return False
 
-            elif isinstance(data, list):
-                if any("text" in entry for entry in data):
-                    print(
-                        f"✅ File ready with list structure after {attempt + 1} attempts"
-                    )
-                    return content, data
-                else:
-                    print(
-                        f"⏳ Attempt {attempt + 1}: List has no 'text' entries, waiting..."
-                    )
-                    time.sleep(initial_wait * (1.5**attempt))
-                    continue
+        segment = f"segment-{len(checkpoint['segments']):05d}.jsonl"
+        atomic_write_text(
+            str(build_dir / segment),
+            "".join(
+                json.dumps({"embedding": embedding, "text": t["text"], "source": t["source"]}) + "\n"
+                for t, embedding in zip(batch, embeddings)
+            ),
+        )
+        checkpoint["segments"].append(segment)
+        checkpoint["last_source"] = batch[-1]["source"]
+        checkpoint["records"] += len(batch)
+        atomic_write_json(str(build_dir / "checkpoint.json"), checkpoint)
+        if on_batch:
+            on_batch(checkpoint["records"])
+
+    with _index_lock:
+        atomic_write_stream(
+            str(path), _index_chunks(build_dir / segment for segment in checkpoint["segments"])
+        )
+    shutil.rmtree(build_dir)
+    print(f"✅ {checkpoint['records']} embeddings saved to {path.name}")
+    return True
 
-            print(f"⏳ Attempt {attempt + 1}: Unexpected structure, waiting...")
-            time.sleep(initial_wait * (1.5**attempt))
 
-        except json.JSONDecodeError as e:
-            print(f"⏳ Attempt {attempt + 1}: JSON parse error ({e}), waiting...")
-            time.sleep(initial_wait * (1.5**attempt))
-        except Exception as e:
-            print(f"⏳ Attempt {attempt + 1}: Read error ({e}), waiting...")
-            time.sleep(initial_wait * (1.5**attempt))
+def wait_for_file_ready(file_path, timeout=None):
+    """
+    Return the transcript at `file_path` (compact or JSON; any layout) once it has been published.
 
-    print(f"❌ File not ready after {max_attempts} attempts")
-    return None, None
+    Writers publish transcripts atomically and notify waiting readers, so this returns as soon as
+    the file is complete instead of sleeping with backoff (files written by other processes outside
+    a watched directory are rechecked every second). Returns None if it does not appear in time.
+    """
+    transcript = wait_for_transcript(str(file_path), timeout)
+    if transcript is not None:
+        print(f"✅ File ready with '{transcript.layout}' structure")
+    return transcript
 
 
 def append_single_embedding(filename):
@@ -195,7 +404,7 @@ def append_single_embedding(filename):
                   False if the process failed or the file was skipped.
 
         This method:
-        - Waits for the file to be ready and contain valid JSON content.
+        - Waits for the file to be published (returns at once if it already exists).
         - Detects the structure of the transcript (dictionary or list).
         - Skips untranslated non-English files and files with invalid formats.
         - Generates an embedding for the transcript's text content using OpenAI's embedding model.
@@ -204,72 +413,41 @@ def append_single_embedding(filename):
     file_path = (DATA_FOLDER / filename).resolve()
     print(f"📂 Processing file: {file_path}")
 
-    content, data = wait_for_file_ready(file_path)
+    transcript = wait_for_file_ready(file_path)
 
-    if not content or not data:
-        print(
-            f"❌ Failed to read valid content from {filename} after multiple attempts."
-        )
+    if transcript is None:
+        print(f"❌ Failed to read valid content from {filename}.")
         return False
 
-    print(f"📦 Successfully loaded {len(data)} transcript entries from {filename}")
+    print(f"📦 Successfully loaded {len(transcript)} transcript entries from {filename}")
 
-    # Detect structure
-    if isinstance(data, dict) and "transcript" in data:
-        original_lang = data.get("original_language", "en")
-        is_translated = data.get("translated", False)
-
-        if original_lang != "en" and not is_translated:
-            print(f"⚠️ Skipping untranslated non-English file: {filename}")
-            return False
-
-        utterances = data["transcript"]
-
-    elif isinstance(data, list):
-        utterances = data
-    else:
-        print(f"⚠️ Unknown format in {filename}")
+    full_text = indexable_text(transcript, filename)
+    if full_text is None:
         return False
 
-    full_text = " ".join([entry["text"] for entry in utterances if "text" in entry])
-
-    if not full_text.strip():
-        print(f"⚠️ No text content found in {filename}")
-        return False
+    if filename in indexed_texts():
+        print(f"⚠️ {filename} already exists in index, skipping...")
+        return True
 
-    embedding = get_embedding(full_text)
+    model = active_generation()["model"]
+    embedding = get_embedding(full_text, model)
     if not embedding:
         print(f"❌ Failed to generate embedding for {filename}")
         return False
 
     try:
-        if INDEX_FILE.exists():
-            with open(INDEX_FILE, "r", encoding="utf-8") as f:
-                index = json.load(f)
-        else:
-            index = []
-    except Exception as e:
-        print(f"⚠️ Error loading existing index: {e}, creating new one")
-        index = []
-
-    existing_sources = [item.get("source") for item in index]
-    if filename in existing_sources:
-        print(f"⚠️ {filename} already exists in index, skipping...")
-        return True
-
-    new_record = {"embedding": embedding, "text": full_text, "source": filename}
-
-    index.append(new_record)
-
-    try:
-        with open(INDEX_FILE, "w", encoding="utf-8") as f:
-            json.dump(index, f, indent=2)
+        update_index(
+            [{"embedding": embedding, "text": full_text, "source": filename}], model=model, replace=False
+        )
         print(f"✅ Successfully embedded and indexed: {filename}")
         return True
     except Exception as e:
         print(f"❌ Failed to save index: {e}")
         return False
 
-
 if __name__ == "__main__":
-    build_vector_index()
+    parser = argparse.ArgumentParser(description="Rebuild the semantic search index from every transcript.")
+    parser.add_argument("--batch-size", type=int, help="Transcripts per embedding request")
+    parser.add_argument("--restart", action="store_true", help="Discard an unfinished rebuild instead of resuming it")
+    args = parser.parse_args()
+    build_vector_index(args.batch_size, restart=args.restart)
@@ -0,0 +1,209 @@
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from backend.config import EMBEDDING_CONFIG
+from backend.semantic import index_transcripts
+
+# Catch-up rounds for records indexed while the job ran, before giving up on the switch
+MAX_CATCH_UP_ROUNDS = 5
+
+
+class ReembedJob:
+    """
+    Re-embed the active index generation with a new model, then switch search over atomically.
+
+    The job snapshots the (source, text) pairs of the active generation and streams them through
+    the checkpointed rebuild into a new generation file, throttled to a fixed request rate so live
+    traffic keeps its share of the rate limit. Search keeps reading the old generation (and
+    embedding queries with the old model) until the switch. Records indexed while the job ran are
+    caught up before switching, under the index lock.
+
+    Methods:
+        - run(): Do the migration in the calling thread. Returns True once switched.
+        - status(): Progress, throughput and estimated time remaining.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        batch_size: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        build_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.model = model
+        self.batch_size = batch_size or EMBEDDING_CONFIG["reembed_batch_size"]
+        self.requests_per_minute = (
+            requests_per_minute
+            if requests_per_minute is not None
+            else EMBEDDING_CONFIG["reembed_requests_per_minute"]
+        )
+        self.build_dir = build_dir or os.path.join(
+            EMBEDDING_CONFIG["reembed_build_dir"], index_transcripts.generation_file(model).stem
+        )
+        self.clock = clock
+        self.state = "pending"
+        self.source_model: Optional[str] = None
+        self.total = 0
+        self.done = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._started: Optional[float] = None
+        self._resumed_from = 0
+        self._lock = threading.Lock()
+
+    def _progress(self, done: int):
+        with self._lock:
+            self.done = done
+
+    def _finish(self, state: str, error: Optional[str] = None) -> bool:
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.finished_at = datetime.now().isoformat()
+        if error:
+            print(f"❌ Re-embedding into {self.model} failed: {error}")
+        return state == "done"
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            status = {
+                "state": self.state,
+                "source_model": self.source_model,
+                "target_model": self.model,
+                "done": self.done,
+                "total": self.total,
+                "percent": round(100 * self.done / self.total, 1) if self.total else None,
+                "rate_per_minute": None,
+                "eta_seconds": None,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "error": self.error,
+            }
+            if self._started is not None and self.state == "running":
+                elapsed = self.clock() - self._started
+                embedded = self.done - self._resumed_from
+                if elapsed > 0 and embedded > 0:
+                    rate = embedded / elapsed
+                    status["rate_per_minute"] = round(rate * 60, 1)
+                    status["eta_seconds"] = round(max(0, self.total - self.done) / rate)
+        return status
+
+    def run(self) -> bool:
+        with self._lock:
+            self.state = "running"
+            self.started_at = datetime.now().isoformat()
+
+        try:
+            active = index_transcripts.active_generation()
+            self.source_model = active["model"]
+            if active["model"] == self.model:
+                return self._finish("done")
+
+            snapshot = sorted(
+                (item["source"], item["text"]) for item in index_transcripts.load_index(active["file"])
+            )
+            self.total = len(snapshot)
+            print(f"🔁 Re-embedding {self.total} transcripts from {self.source_model} into {self.model}")
+
+            def records(after=None):
+                for source, text in snapshot:
+                    if after is None or source > after:
+                        yield {"source": source, "text": text}
+
+            # Batches finished by an earlier, interrupted run don't count toward the rate
+            resumed = index_transcripts.load_build_checkpoint(Path(self.build_dir))["records"]
+            with self._lock:
+                self.done = self._resumed_from = resumed
+                self._started = self.clock()
+
+            target = index_transcripts.generation_file(self.model)
+            if not index_transcripts.build_vector_index(
+                batch_size=self.batch_size,
+                build_dir=self.build_dir,
+                records=records,
+                model=self.model,
+                path=target,
+                requests_per_minute=self.requests_per_minute,
+                on_batch=self._progress,
+            ):
+                return self._finish("failed", "embedding request failed; start the job again to resume")
+
+            for _ in range(MAX_CATCH_UP_ROUNDS):
+                missing = index_transcripts.switch_when_caught_up(self.model, self.source_model)
+                if not missing:
+                    print(f"✅ Search switched to the {self.model} index generation")
+                    return self._finish("done")
+                self.total += len(missing)
+                for start in range(0, len(missing), self.batch_size):
+                    batch = missing[start : start + self.batch_size]
+                    embeddings = index_transcripts.get_embeddings([r["text"] for r in batch], self.model)
+                    if embeddings is None:
+                        return self._finish("failed", "embedding request failed while catching up")
+                    index_transcripts.update_index(
+                        [{**r, "embedding": e} for r, e in zip(batch, embeddings)], path=target
+                    )
+                    self._progress(self.done + len(batch))
+            return self._finish("failed", "index kept changing; could not catch up before switching")
+        except Exception as e:
+            return self._finish("failed", str(e))
+
+
+_job: Optional[ReembedJob] = None
+_job_lock = threading.Lock()
+
+
+def start_reembed(model: Optional[str] = None, **kwargs) -> ReembedJob:
+    """
+        Start re-embedding into `model` (EMBEDDING_CONFIG by default) on a background thread.
+
+        Raises:
+            RuntimeError: If a re-embedding job is already running.
+    """
+    global _job
+    with _job_lock:
+        if _job is not None and _job.state == "running":
+            raise RuntimeError(f"Re-embedding into {_job.model} is already running")
+        _job = ReembedJob(model or EMBEDDING_CONFIG["model"], **kwargs)
+        _job.state = "running"
+        threading.Thread(target=_job.run, name="reembed", daemon=True).start()
+        return _job
+
+
+def reembed_status() -> Dict[str, Any]:
+    """Return the active generation and the status of the latest re-embedding job."""
+    active = index_transcripts.active_generation()
+    with _job_lock:
+        job = _job
+    return {
+        "active_model": active["model"],
+        "job": job.status() if job else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-embed the search index with another embedding model.")
+    parser.add_argument("--model", default=EMBEDDING_CONFIG["model"], help="Target embedding model")
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=EMBEDDING_CONFIG["reembed_requests_per_minute"],
+        help="Embedding requests per minute",
+    )
+    args = parser.parse_args()
+
+    job = ReembedJob(args.model, requests_per_minute=args.rpm)
+    ok = job.run()
+    print(json.dumps(job.status(), indent=2))
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,49 @@
 import json
-import os
-from pathlib import Path
-from typing import Dict, List
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from backend.semantic.index_transcripts import active_generation
+from backend.services.api_clients import create_chat_completion, create_embedding
+from backend.services.near_duplicates import get_near_duplicate_index, minhash, similarity
 
-INDEX_FILE = Path(__file__).resolve().parent / "vector_index.json"
+# Recent query embeddings by (model, query), reused for repeated queries and while the embedding provider is down
+_query_cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+QUERY_CACHE_SIZE = 512
 
 
-def get_query_embedding(query: str) -> List[float]:
-    """Generate a semantic embedding for the given query string using OpenAI's embedding model."""
-    response = client.embeddings.create(model="text-embedding-ada-002", input=query)
-    return response.data[0].embedding
-
+def get_query_embedding(query: str, model: Optional[str] = None) -> List[float]:
+    """
+        Generate a semantic embedding for the given query string.
 
-def load_vector_index() -> List[Dict]:
-    """Load the vector index from the `vector_index.json` file."""
-    with open(INDEX_FILE, "r", encoding="utf-8") as f:
+        The model defaults to the active index generation's, so queries and the vectors they are
+        compared with always come from the same model.
+    """
+    model = model or active_generation()["model"]
+    key = (model, " ".join(query.lower().split()))
+    with _query_cache_lock:
+        if key in _query_cache:
+            _query_cache.move_to_end(key)
+            return _query_cache[key]
+
+    response = create_embedding(query, model=model)
+    embedding = response.data[0].embedding
+
+    with _query_cache_lock:
+        _query_cache[key] = embedding
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return embedding
+
+
+def load_vector_index(generation: Optional[Dict] = None) -> List[Dict]:
+    """Load the vector index of a generation (the active one by default)."""
+    generation = generation or active_generation()
+    with open(generation["file"], "r", encoding="utf-8") as f:
         return json.load(f)
 
 
@@ -32,6 +54,53 @@ def cosine_similarity(vec1, vec2) -> float:
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
 
+def keyword_scores(query: str, index: List[Dict]) -> List[tuple]:
+    """Degraded lexical ranking used when query embeddings are unavailable."""
+    terms = set(re.findall(r"\w{3,}", query.lower()))
+    scored = []
+    for item in index:
+        words = re.findall(r"\w{3,}", item["text"].lower())
+        hits = sum(1 for word in words if word in terms)
+        scored.append((item["text"], item["source"], hits / (len(words) ** 0.5 or 1)))
+    return scored
+
+
+def distinct_matches(scored: List[Tuple[str, str, float]], top_k: int, duplicates=None) -> List[Tuple[str, str, float]]:
+    """
+        Pick the `top_k` best matches, skipping near-duplicates of a match already picked.
+
+        Two matches are duplicates if the near-duplicate index links them to the same original, or
+        if their MinHash signatures are above its threshold (e.g. copies indexed before the link
+        existed). `scored` must already be sorted best first.
+    """
+    try:
+        duplicates = duplicates or get_near_duplicate_index()
+    except Exception as e:
+        print(f"⚠️ Near-duplicate index unavailable ({e}), results are not deduplicated")
+        return scored[:top_k]
+
+    picked: List[Tuple[str, str, float]] = []
+    seen_originals = set()
+    seen_signatures = []
+    for match in scored:
+        if len(picked) == top_k:
+            break
+        text, source, _ = match
+        original = duplicates.canonical(source)
+        if original in seen_originals:
+            continue
+        signature = minhash(text, duplicates.num_perm)
+        if signature is not None and any(
+            similarity(signature, other) >= duplicates.threshold for other in seen_signatures
+        ):
+            continue
+        picked.append(match)
+        seen_originals.add(original)
+        if signature is not None:
+            seen_signatures.append(signature)
+    return picked
+
+
 def semantic_answer(query: str, top_k: int = 3) -> Dict:
     """
         Generate a semantic answer to a query by finding the most relevant
@@ -42,18 +111,27 @@ def semantic_answer(query: str, top_k: int = 3) -> Dict:
             top_k (int): Number of top matching excerpts to include in the context.
 
         Returns:
-            Dict: A dictionary containing the generated answer and the sources used.
+            Dict: A dictionary containing the generated answer and the sources used. If a provider
+                  is slow or unavailable, a degraded result is returned with `"degraded": True`.
     """
-    query_vec = get_query_embedding(query)
-    index = load_vector_index()
+    # Read the generation once so the query is embedded with the model of the vectors it is compared with
+    generation = active_generation()
+    index = load_vector_index(generation)
+    degraded = False
 
-    scored = []
-    for item in index:
-        sim = cosine_similarity(query_vec, item["embedding"])
-        scored.append((item["text"], item["source"], sim))
+    try:
+        query_vec = get_query_embedding(query, generation["model"])
+        scored = []
+        for item in index:
+            sim = cosine_similarity(query_vec, item["embedding"])
+            scored.append((item["text"], item["source"], sim))
+    except Exception as e:
+        print(f"⚠️ Query embedding unavailable ({e}), falling back to keyword ranking")
+        scored = keyword_scores(query, index)
+        degraded = True
     scored.sort(key=lambda x: x[2], reverse=True)
 
-    top_matches = scored[:top_k]
+    top_matches = distinct_matches(scored, top_k)
     context = "\n\n".join([match[0] for match in top_matches])
     sources = [match[1] for match in top_matches]
 
@@ -66,16 +144,24 @@ Question: {query}
 Answer:"""
 
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
             model="gpt-4",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
         )
         final_answer = response.choices[0].message.content
     except Exception as e:
-        final_answer = f"❌ GPT failed: {e}"
+        print(f"⚠️ GPT answer unavailable ({e}), returning matching excerpts")
+        excerpts = "\n\n".join(
+            f"[{source}] {text[:400]}" for text, source, _ in top_matches
+        )
+        final_answer = (
+            "The answer service is temporarily unavailable. Most relevant meeting excerpts:\n\n"
+            + excerpts
+        )
+        degraded = True
 
-    return {"answer": final_answer, "sources": sources}
+    return {"answer": final_answer, "sources": sources, "degraded": degraded}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+from deep_translator import GoogleTranslator
+from openai import OpenAI
+
+from ..config import API_CLIENT_CONFIG, OPENAI_API_KEY
+from .rate_limiter import get_rate_limiter
+from .resilience import get_provider
+
+# Completion budget assumed for the tokens-per-minute bucket when max_tokens is not given
+DEFAULT_COMPLETION_TOKENS = 800
+
+_openai_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client, backed by one pooled HTTP connection pool."""
+    global _openai_client
+    with _client_lock:
+        if _openai_client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=API_CLIENT_CONFIG["max_connections"],
+                    max_keepalive_connections=API_CLIENT_CONFIG["max_keepalive_connections"],
+                ),
+                timeout=API_CLIENT_CONFIG["timeout_seconds"],
+            )
+            _openai_client = OpenAI(
+                api_key=OPENAI_API_KEY,
+                base_url=API_CLIENT_CONFIG["base_url"],
+                http_client=http_client,
+                max_retries=API_CLIENT_CONFIG["max_retries"],
+            )
+        return _openai_client
+
+
+def estimate_tokens(text: Union[str, List[str], None]) -> int:
+    """Rough token estimate (about four characters per token) used for rate limiting."""
+    if not text:
+        return 0
+    if isinstance(text, list):
+        return sum(estimate_tokens(item) for item in text)
+    return len(text) // 4 + 1
+
+
+def _message_tokens(messages: List[Dict[str, Any]]) -> int:
+    return sum(estimate_tokens(m.get("content") or "") + 4 for m in messages)
+
+
+def create_embedding(input: Union[str, List[str]], model: str = "text-embedding-ada-002"):
+    """
+    Create embeddings through the shared client, queueing behind the model's rate limits.
+    Embeddings are idempotent, so a slow call is hedged with a second attempt; the deadline
+    and hedge start only once the limiter has admitted the request.
+    """
+    provider = get_provider("openai-embeddings")
+
+    def call():
+        return get_openai_client().embeddings.create(
+            model=model, input=input, timeout=provider.deadline_seconds
+        )
+
+    return provider.call(
+        call,
+        idempotent=True,
+        acquire=lambda: get_rate_limiter(model).acquire(estimate_tokens(input)),
+    )
+
+
+def create_chat_completion(model: str, messages: List[Dict[str, Any]], **kwargs):
+    """Create a chat completion through the shared client, queueing behind the model's rate limits."""
+    provider = get_provider("openai-chat")
+    completion_budget = kwargs.get("max_tokens") or DEFAULT_COMPLETION_TOKENS
+
+    def call():
+        return get_openai_client().chat.completions.create(
+            model=model, messages=messages, timeout=provider.deadline_seconds, **kwargs
+        )
+
+    return provider.call(
+        call, acquire=lambda: get_rate_limiter(model).acquire(_message_tokens(messages) + completion_budget)
+    )
+
+
+def generate_image(prompt: str, model: str = "dall-e-3", **kwargs):
+    """Generate an image through the shared client, queueing behind the model's rate limits."""
+    provider = get_provider("openai-images")
+
+    def call():
+        return get_openai_client().images.generate(
+            model=model, prompt=prompt, timeout=provider.deadline_seconds, **kwargs
+        )
+
+    return provider.call(call, acquire=lambda: get_rate_limiter(model).acquire(0))
+
+
+class RateLimitedTranslator:
+    """GoogleTranslator wrapper whose requests go through the shared "google-translate" limiter."""
+
+    def __init__(self, source: str = "auto", target: str = "en"):
+        self._translator = GoogleTranslator(source=source, target=target)
+
+    def translate(self, text: str) -> str:
+        return get_provider("google-translate").call(
+            lambda: self._translator.translate(text),
+            idempotent=True,
+            acquire=lambda: get_rate_limiter("google-translate").acquire(0),
+        )
+
+
+def google_translator(source: str = "auto", target: str = "en") -> RateLimitedTranslator:
+    """Return a rate-limited Google translator for the given language pair."""
+    return RateLimitedTranslator(source=source, target=target)
@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..config import CALENDAR_CONFIG
+
+EventInput = Union[Dict[str, Any], Tuple[str, str]]
+
+
+def _normalize_event(event: EventInput) -> Optional[Tuple[str, str, Optional[str]]]:
+    """Return (title, date, extra fields as JSON) for an event dict or (title, date) pair."""
+    if isinstance(event, dict):
+        title, date = event.get("title"), event.get("date")
+        extra = {k: v for k, v in event.items() if k not in ("id", "title", "date")}
+    else:
+        title, date = event
+        extra = {}
+    title, date = str(title or "").strip(), str(date or "").strip()
+    if not title or not date:
+        return None
+    return title, date, json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+class CalendarStore:
+    """
+    Calendar events in SQLite with a unique (title, date) constraint and an index on date.
+
+    Events from one summary are inserted in a single transaction, so concurrent summaries cannot
+    lose each other's events. Inserts write nothing else: /data/calendar_events.json is built from
+    the store on request and cached per `version()`. The JSON file at `snapshot_path` (the
+    pre-SQLite event file) is only read, to seed an empty store.
+
+    Methods:
+        - add_events(events): Insert events, ignoring duplicates; returns the number added.
+        - query(start, end, limit, offset): One page of events in a date range, plus the total.
+        - all_events(): Every event ordered by date.
+        - version(): A version string that changes with every insert, and the last change time.
+    """
+
+    def __init__(self, path: Optional[str] = None, snapshot_path: Optional[str] = None):
+        self.path = path or CALENDAR_CONFIG["path"]
+        self.snapshot_path = (
+            CALENDAR_CONFIG["snapshot_path"] if snapshot_path is None else snapshot_path
+        )
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS events (
+                       id INTEGER PRIMARY KEY AUTOINCREMENT,
+                       title TEXT NOT NULL,
+                       date TEXT NOT NULL,
+                       extra TEXT,
+                       created_at REAL NOT NULL,
+                       UNIQUE (title, date)
+                   )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_date ON events (date, id)")
+            # Random per-database id, so a recreated store whose ids start again never reuses a version
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS calendar_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO calendar_meta (key, value) VALUES ('db_id', ?)",
+                (uuid.uuid4().hex,),
+            )
+            self._db_id = self._conn.execute(
+                "SELECT value FROM calendar_meta WHERE key = 'db_id'"
+            ).fetchone()[0]
+            empty = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+        if empty:
+            self._import_snapshot()
+
+    def _import_snapshot(self):
+        """Seed an empty store from an existing JSON snapshot (the pre-SQLite event file)."""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+            events = json.loads(content) if content else []
+        except Exception as e:
+            print(f"⚠️ Could not import calendar snapshot: {e}")
+            return
+        if isinstance(events, list):
+            added = self._insert(events)
+            if added:
+                print(f"📥 Imported {added} calendar event(s) from {self.snapshot_path}")
+
+    def _insert(self, events: Iterable[EventInput]) -> int:
+        rows = [row for row in map(_normalize_event, events) if row]
+        if not rows:
+            return 0
+        now = time.time()
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO events (title, date, extra, created_at) VALUES (?, ?, ?, ?)",
+                [(title, date, extra, now) for title, date, extra in rows],
+            )
+            return self._conn.total_changes - before
+
+    def add_events(self, events: Iterable[EventInput]) -> int:
+        """
+            Insert events in one transaction, skipping any (title, date) already stored.
+
+            Args:
+                events (Iterable): Event dicts with 'title' and 'date', or (title, date) pairs.
+
+            Returns:
+                int: Number of new events.
+        """
+        return self._insert(events)
+
+    @staticmethod
+    def _row_to_event(row) -> Dict[str, Any]:
+        event_id, title, date, extra = row
+        event = {"id": event_id, "title": title, "date": date}
+        if extra:
+            event.update(json.loads(extra))
+        return event
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+            Return one page of events with start <= date <= end (ISO dates, both optional).
+
+            Returns:
+                Tuple[List[Dict[str, Any]], int]: The page, ordered by date, and the total matches.
+        """
+        clauses, params = [], []
+        if start:
+            clauses.append("date >= ?")
+            params.append(start)
+        if end:
+            clauses.append("date <= ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM events {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT id, title, date, extra FROM events {where} ORDER BY date, id LIMIT ? OFFSET ?",
+                (*params, -1 if limit is None else limit, max(0, offset)),
+            ).fetchall()
+        return [self._row_to_event(row) for row in rows], total
+
+    def version(self) -> Tuple[str, Optional[float]]:
+        """Return (version, last change timestamp). Events are insert-only, so database id, count and max id suffice."""
+        with self._lock:
+            count, max_id, changed_at = self._conn.execute(
+                "SELECT COUNT(*), MAX(id), MAX(created_at) FROM events"
+            ).fetchone()
+        return f"{self._db_id}-{count}-{max_id or 0}", changed_at
+
+    def all_events(self) -> List[Dict[str, Any]]:
+        """Return every event ordered by date."""
+        return self.query()[0]
+
+
+_shared_store: Optional[CalendarStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_calendar_store() -> CalendarStore:
+    """Return the process-wide calendar store."""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = CalendarStore()
+        return _shared_store
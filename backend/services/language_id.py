@@ -0,0 +1,191 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Optional
+
+from ..config import LANGUAGE_ID_CONFIG, SUPPORTED_LANGUAGES
+
+LANGUAGE_NAMES = {
+    "en": "English",
+    "ka": "Georgian",
+    "sk": "Slovak",
+    "sl": "Slovenian",
+    "lv": "Latvian",
+}
+
+# Parallel sample texts the character n-gram model is built from. Parallel content keeps the
+# profiles about spelling, not topic; the distinguishing letters (ľ ô ä ŕ in Slovak, č š ž
+# without other accents in Slovenian, long vowels and ķ ļ ņ ģ in Latvian) come from the samples.
+_SAMPLES = {
+    "en": (
+        "Good morning everyone, thank you for joining the weekly project meeting. Today we need to "
+        "review the budget, agree on the release date and decide who will prepare the report for "
+        "the board. The development team finished most of the tasks planned for this sprint, but "
+        "testing found several problems with the new login page, so we should fix them before the "
+        "release. Marketing wants to start the campaign next month and asked whether the product "
+        "will be ready in time. I think we can make it if we move two people from the mobile team "
+        "to help with the remaining work. Please send me your estimates by Thursday, and let's meet "
+        "again on Friday afternoon to make the final decision. Does anyone have questions about the "
+        "schedule, the customers or the contract with our new partner? We also have to talk about "
+        "hiring, because the support team is still short of staff and the number of requests keeps "
+        "growing every week. What did we decide about the budget? When is the next meeting with the "
+        "client and who is responsible for the new design? Which tasks were still open after last week?"
+    ),
+    "sk": (
+        "Dobré ráno všetkým, ďakujem, že ste prišli na dnešnú poradu. Dnes musíme prejsť rozpočet, "
+        "dohodnúť sa na termíne vydania a rozhodnúť, kto pripraví správu pre vedenie. Vývojový tím "
+        "dokončil väčšinu úloh, ktoré sme naplánovali na tento šprint, ale pri testovaní sa objavilo "
+        "niekoľko problémov s novou prihlasovacou stránkou, preto ich musíme opraviť ešte pred "
+        "vydaním. Marketing chce začať kampaň budúci mesiac a pýta sa, či bude produkt pripravený "
+        "včas. Myslím si, že to stihneme, ak presunieme dvoch ľudí z mobilného tímu, aby pomohli so "
+        "zvyšnou prácou. Pošlite mi, prosím, svoje odhady do štvrtka a v piatok popoludní sa znova "
+        "stretneme, aby sme urobili konečné rozhodnutie. Máte nejaké otázky k harmonogramu, k "
+        "zákazníkom alebo k zmluve s novým partnerom? Musíme sa porozprávať aj o prijímaní "
+        "zamestnancov, pretože oddeleniu podpory stále chýbajú ľudia a počet požiadaviek každý týždeň "
+        "rastie. Čo sme sa rozhodli o rozpočte? Kedy je ďalšie stretnutie s klientom a kto je "
+        "zodpovedný za nový dizajn? Aké úlohy zostali otvorené po minulom týždni?"
+    ),
+    "sl": (
+        "Dobro jutro vsem, hvala, da ste se udeležili današnjega sestanka. Danes moramo pregledati "
+        "proračun, se dogovoriti o datumu izdaje in odločiti, kdo bo pripravil poročilo za upravo. "
+        "Razvojna ekipa je končala večino nalog, ki smo jih načrtovali za ta sprint, vendar je "
+        "testiranje odkrilo nekaj težav z novo stranjo za prijavo, zato jih moramo popraviti še pred "
+        "izdajo. Oddelek za trženje želi začeti kampanjo prihodnji mesec in sprašuje, ali bo izdelek "
+        "pravočasno pripravljen. Mislim, da nam bo uspelo, če dva človeka iz mobilne ekipe premaknemo "
+        "na pomoč pri preostalem delu. Prosim, pošljite mi svoje ocene do četrtka, v petek popoldne "
+        "pa se bomo spet sestali in sprejeli končno odločitev. Ali ima kdo vprašanja o urniku, o "
+        "strankah ali o pogodbi z novim partnerjem? Pogovoriti se moramo tudi o zaposlovanju, ker "
+        "podpori še vedno primanjkuje ljudi in število zahtevkov vsak teden narašča. Kaj smo se "
+        "odločili glede proračuna? Kdaj je naslednji sestanek s stranko in kdo je odgovoren za novo "
+        "oblikovanje? Katere naloge so ostale odprte po prejšnjem tednu?"
+    ),
+    "lv": (
+        "Labrīt visiem, paldies, ka piedalāties šodienas sanāksmē. Šodien mums jāpārskata budžets, "
+        "jāvienojas par izlaides datumu un jāizlemj, kurš sagatavos ziņojumu valdei. Izstrādes "
+        "komanda ir pabeigusi lielāko daļu uzdevumu, ko plānojām šim sprintam, taču testēšanā "
+        "atklājās vairākas problēmas ar jauno pieteikšanās lapu, tāpēc tās jāizlabo pirms izlaides. "
+        "Mārketinga nodaļa vēlas sākt kampaņu nākamajā mēnesī un jautā, vai produkts būs gatavs "
+        "laikā. Es domāju, ka mēs paspēsim, ja pārcelsim divus cilvēkus no mobilās komandas, lai "
+        "palīdzētu ar atlikušo darbu. Lūdzu, atsūtiet man savus novērtējumus līdz ceturtdienai, un "
+        "piektdienas pēcpusdienā mēs atkal tiksimies, lai pieņemtu galīgo lēmumu. Vai kādam ir "
+        "jautājumi par grafiku, klientiem vai līgumu ar jauno partneri? Mums arī jārunā par "
+        "darbinieku pieņemšanu, jo atbalsta nodaļā joprojām trūkst cilvēku un pieprasījumu skaits "
+        "katru nedēļu pieaug. Ko mēs nolēmām par budžetu? Kad ir nākamā tikšanās ar klientu un kurš "
+        "ir atbildīgs par jauno dizainu? Kādi uzdevumi palika neizpildīti pēc pagājušās nedēļas?"
+    ),
+}
+
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _is_georgian(char: str) -> bool:
+    # Mkhedruli and Asomtavruli/Nuskhuri, Mtavruli capitals, Nuskhuri supplement
+    return "Ⴀ" <= char <= "ჿ" or "Ა" <= char <= "Ჿ" or "ⴀ" <= char <= "⴯"
+
+
+def _ngrams(text: str) -> Counter:
+    counts: Counter = Counter()
+    for word in _WORD.findall(unicodedata.normalize("NFC", text.lower())):
+        padded = f" {word} "
+        for n in LANGUAGE_ID_CONFIG["ngram_sizes"]:
+            for i in range(len(padded) - n + 1):
+                gram = padded[i : i + n]
+                if gram.strip():
+                    counts[gram] += 1
+    return counts
+
+
+class NgramModel:
+    """
+    Naive Bayes character n-gram model over the Latin-script languages.
+
+    Each language's profile holds add-one smoothed log-probabilities of the 1- to 3-grams of its
+    sample text (words padded with spaces), plus a floor for n-grams the sample never contained.
+
+    Methods:
+        - scores(text): Summed log-likelihood of the text's n-grams per language.
+    """
+
+    def __init__(self, samples: Dict[str, str]):
+        self.profiles: Dict[str, Dict[str, float]] = {}
+        self.floors: Dict[str, float] = {}
+        counts = {language: _ngrams(text) for language, text in samples.items()}
+        vocabulary = len(set().union(*counts.values())) + 1
+        for language, grams in counts.items():
+            total = sum(grams.values()) + vocabulary
+            self.profiles[language] = {gram: math.log((c + 1) / total) for gram, c in grams.items()}
+            self.floors[language] = math.log(1 / total)
+
+    def scores(self, text: str) -> Dict[str, float]:
+        grams = _ngrams(text)
+        return {
+            language: sum(
+                count * profile.get(gram, self.floors[language]) for gram, count in grams.items()
+            )
+            for language, profile in self.profiles.items()
+        }
+
+
+_model = NgramModel({code: text for code, text in _SAMPLES.items() if code in SUPPORTED_LANGUAGES})
+
+
+def language_scores(text: str) -> Dict[str, float]:
+    """
+        Return a log-likelihood per supported language for the start of `text`.
+
+        Georgian is decided by script: it scores 0 when at least half the letters are Georgian and
+        -inf otherwise, in which case the Latin languages are ranked by the n-gram model.
+    """
+    sample = text[: LANGUAGE_ID_CONFIG["sample_chars"]]
+    letters = [char for char in sample if char.isalpha()]
+    georgian = sum(1 for char in letters if _is_georgian(char))
+    if letters and georgian * 2 >= len(letters):
+        return {"ka": 0.0, **{language: -math.inf for language in _model.profiles}}
+    return {"ka": -math.inf, **_model.scores(sample)}
+
+
+def detect_language(text: str, default: Optional[str] = None) -> Optional[str]:
+    """
+        Identify the language of `text` among the supported languages, offline.
+
+        Args:
+            text (str): Text to identify (only the first LANGUAGE_ID_CONFIG["sample_chars"] are read).
+            default (str, optional): Returned when the text is too short or too ambiguous to call.
+
+        Returns:
+            Optional[str]: A language code ('en', 'ka', 'sk', 'sl', 'lv') or `default`.
+    """
+    sample = text[: LANGUAGE_ID_CONFIG["sample_chars"]]
+    if sum(1 for char in sample if char.isalpha()) < LANGUAGE_ID_CONFIG["min_letters"]:
+        return default
+    ranked = sorted(language_scores(sample).items(), key=lambda item: item[1], reverse=True)
+    (best, best_score), (_, runner_up) = ranked[0], ranked[1]
+    if best_score - runner_up < LANGUAGE_ID_CONFIG["min_margin"]:
+        return default
+    return best
+
+
+def transcript_language(transcript, hint: Optional[str] = None) -> str:
+    """
+        Decide the language of a transcript from its text and its stored `language` field.
+
+        Translations keep their stored language. Otherwise a supported stored language is kept
+        unless the text is confidently in another script (a Georgian recording transcribed as
+        English, for example), and the detected language wins. Without a confident detection,
+        `hint` (e.g. from a filename) or English is used.
+
+        Args:
+            transcript (Transcript): The transcript to classify.
+            hint (str, optional): Fallback language code.
+
+        Returns:
+            str: A supported language code.
+    """
+    claimed = transcript.metadata.get("language")
+    if transcript.translated or "original_language" in transcript.metadata:
+        return claimed if claimed in LANGUAGE_NAMES else "en"
+    detected = detect_language(transcript.full_text)
+    if claimed in LANGUAGE_NAMES and (detected is None or (claimed == "ka") == (detected == "ka")):
+        return claimed
+    return detected or hint or "en"
@@ -0,0 +1,300 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import DATA_DIR, NEAR_DUPLICATE_CONFIG
+from ..transcript_model import load_transcript
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_HASH_CHUNK = 2048
+
+
+def _permutations(num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Fixed seed: signatures stored in the index must stay comparable across restarts
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingle_hashes(text: str, size: Optional[int] = None) -> np.ndarray:
+    """Return the distinct 32-bit hashes of the lowercase word `size`-shingles of `text`."""
+    size = size or NEAR_DUPLICATE_CONFIG["shingle_size"]
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return np.array([], dtype=np.uint64)
+    count = max(1, len(words) - size + 1)
+    return np.unique(
+        np.fromiter(
+            (zlib.crc32(" ".join(words[i : i + size]).encode("utf-8")) for i in range(count)),
+            dtype=np.uint64,
+            count=count,
+        )
+    )
+
+
+def minhash(text: str, num_perm: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+        Return the MinHash signature (uint32 array) of the text's shingles, or None for empty text.
+
+        Each of the `num_perm` universal hash functions (a*x + b) mod p is applied to every shingle
+        hash and the minimum kept; the fraction of equal positions between two signatures estimates
+        the Jaccard similarity of their shingle sets.
+    """
+    hashes = shingle_hashes(text)
+    if not len(hashes):
+        return None
+    a, b = _permutations(num_perm or NEAR_DUPLICATE_CONFIG["num_perm"])
+    signature = np.full(len(a), _MAX_HASH, dtype=np.uint64)
+    for start in range(0, len(hashes), _HASH_CHUNK):
+        chunk = hashes[start : start + _HASH_CHUNK, None]
+        permuted = ((chunk * a + b) % _MERSENNE_PRIME) & _MAX_HASH
+        np.minimum(signature, permuted.min(axis=0), out=signature)
+    return signature.astype(np.uint32)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(first == second))
+
+
+class NearDuplicateIndex:
+    """
+    SQLite-backed MinHash/LSH index of ingested transcripts.
+
+    Each canonical transcript's signature is split into bands; transcripts sharing any band
+    bucket are candidates, confirmed by comparing full signatures. A transcript that matches an
+    existing one is stored as a link to it (`duplicate_of`) and kept out of the bands, so later
+    copies always resolve to the original. The index is built from the data directory the first
+    time it is opened.
+
+    Methods:
+        - register(filename, text): Add a transcript; returns (original, similarity) if it is a near-duplicate.
+        - find(text): The best matching original above the threshold, without adding anything.
+        - canonical(filename): The original a transcript is linked to (itself if none).
+        - signature(filename): Stored signature, if the transcript is indexed.
+        - remove(filename): Drop a transcript, promoting its first duplicate if it was an original.
+        - rebuild(): Re-index every transcript in the data directory, oldest first.
+    """
+
+    def __init__(self, path: Optional[str] = None, data_dir: Optional[str] = None):
+        self.path = path or NEAR_DUPLICATE_CONFIG["path"]
+        self.data_dir = data_dir or DATA_DIR
+        self.num_perm = NEAR_DUPLICATE_CONFIG["num_perm"]
+        self.bands = NEAR_DUPLICATE_CONFIG["bands"]
+        self.rows = self.num_perm // self.bands
+        self.threshold = NEAR_DUPLICATE_CONFIG["threshold"]
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS signatures (
+                       filename TEXT PRIMARY KEY,
+                       signature BLOB,
+                       duplicate_of TEXT,
+                       similarity REAL,
+                       added_ts REAL NOT NULL
+                   )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_signatures_duplicate_of ON signatures (duplicate_of)"
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS bands (
+                       band INTEGER NOT NULL,
+                       bucket BLOB NOT NULL,
+                       filename TEXT NOT NULL
+                   )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bands_bucket ON bands (band, bucket)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bands_filename ON bands (filename)")
+            empty = self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0] == 0
+        if empty and os.path.isdir(self.data_dir):
+            self.rebuild()
+
+    def _buckets(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _find(self, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        candidates = set()
+        for band, bucket in self._buckets(signature):
+            candidates.update(
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT filename FROM bands WHERE band = ? AND bucket = ?", (band, bucket)
+                )
+            )
+        best = None
+        for filename in sorted(candidates):
+            stored = self._signature(filename)
+            if stored is None:
+                continue
+            score = similarity(signature, stored)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (filename, score)
+        return best
+
+    def _signature(self, filename: str) -> Optional[np.ndarray]:
+        row = self._conn.execute(
+            "SELECT signature FROM signatures WHERE filename = ?", (filename,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.uint32)
+
+    def _add(self, filename: str, signature: Optional[np.ndarray], duplicate_of: Optional[str], score: Optional[float]):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO signatures (filename, signature, duplicate_of, similarity, added_ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                filename,
+                signature.tobytes() if signature is not None else None,
+                duplicate_of,
+                score,
+                time.time(),
+            ),
+        )
+        self._conn.execute("DELETE FROM bands WHERE filename = ?", (filename,))
+        if duplicate_of is None and signature is not None:
+            self._conn.executemany(
+                "INSERT INTO bands (band, bucket, filename) VALUES (?, ?, ?)",
+                [(band, bucket, filename) for band, bucket in self._buckets(signature)],
+            )
+
+    def find(self, text: str) -> Optional[Tuple[str, float]]:
+        """Return (original filename, estimated similarity) for the best match above the threshold."""
+        signature = minhash(text, self.num_perm)
+        if signature is None:
+            return None
+        with self._lock:
+            return self._find(signature)
+
+    def register(self, filename: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+            Index a transcript, linking it to an existing original if it is a near-duplicate.
+
+            Registering the same filename with unchanged content returns its existing link, so
+            writers and the watcher can both call it; changed content is matched again.
+
+            Returns:
+                Optional[Tuple[str, float]]: (original filename, similarity) for near-duplicates, else None.
+        """
+        signature = minhash(text, self.num_perm)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT duplicate_of, similarity, signature FROM signatures WHERE filename = ?", (filename,)
+            ).fetchone()
+            if row is not None:
+                unchanged = row[2] == (signature.tobytes() if signature is not None else None)
+                if unchanged:
+                    return (row[0], row[1]) if row[0] else None
+                self._conn.execute("DELETE FROM bands WHERE filename = ?", (filename,))
+            match = self._find(signature) if signature is not None else None
+            self._add(filename, signature, *(match or (None, None)))
+            return match
+
+    def canonical(self, filename: str) -> str:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT duplicate_of FROM signatures WHERE filename = ?", (filename,)
+            ).fetchone()
+        return row[0] if row and row[0] else filename
+
+    def signature(self, filename: str) -> Optional[np.ndarray]:
+        with self._lock:
+            return self._signature(filename)
+
+    def duplicates(self) -> Dict[str, str]:
+        """Return {duplicate filename: original filename}."""
+        with self._lock:
+            return dict(
+                self._conn.execute(
+                    "SELECT filename, duplicate_of FROM signatures WHERE duplicate_of IS NOT NULL"
+                )
+            )
+
+    def remove(self, filename: str):
+        """Drop a transcript; if it was an original, its oldest duplicate takes its place."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM signatures WHERE filename = ?", (filename,))
+            self._conn.execute("DELETE FROM bands WHERE filename = ?", (filename,))
+            copies = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT filename FROM signatures WHERE duplicate_of = ? ORDER BY added_ts, filename",
+                    (filename,),
+                )
+            ]
+            if not copies:
+                return
+            successor = copies[0]
+            self._add(successor, self._signature(successor), None, None)
+            self._conn.execute(
+                "UPDATE signatures SET duplicate_of = ? WHERE duplicate_of = ?", (successor, filename)
+            )
+
+    def rebuild(self) -> int:
+        """
+            Re-index every transcript in the data directory, oldest first, so originals win.
+
+            Returns:
+                int: Number of transcripts indexed.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM signatures")
+            self._conn.execute("DELETE FROM bands")
+        names = [
+            name
+            for name in os.listdir(self.data_dir)
+            if name.endswith(".json") and os.path.isfile(os.path.join(self.data_dir, name))
+        ]
+        names.sort(key=lambda name: (os.path.getmtime(os.path.join(self.data_dir, name)), name))
+        indexed = 0
+        for name in names:
+            try:
+                self.register(name, load_transcript(os.path.join(self.data_dir, name)).full_text)
+                indexed += 1
+            except Exception as e:
+                print(f"⚠️ Skipping unreadable transcript {name}: {e}")
+        print(f"🧬 Indexed {indexed} transcript(s) for near-duplicate detection")
+        return indexed
+
+
+_shared_index: Optional[NearDuplicateIndex] = None
+_shared_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Return the process-wide near-duplicate index."""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = NearDuplicateIndex()
+        return _shared_index
+
+
+def register_transcript(filename: str, text: str) -> Optional[Tuple[str, float]]:
+    """Register a transcript in the shared index; failures are logged and treated as unique."""
+    try:
+        match = get_near_duplicate_index().register(filename, text)
+    except Exception as e:
+        print(f"⚠️ Near-duplicate check failed for {filename}: {e}")
+        return None
+    if match:
+        print(f"🔗 {filename} is a near-duplicate of {match[0]} (similarity {match[1]:.2f})")
+    return match
@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config import RATE_LIMITS
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that refills continuously up to `capacity`.
+
+    `acquire` blocks until enough tokens are available instead of failing, so callers queue
+    behind the limit rather than tripping provider rate-limit errors.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, clock=time.monotonic, sleep=time.sleep):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens, waiting as long as needed. Returns the seconds spent waiting."""
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.refill_per_second
+            self._sleep(delay)
+            waited += delay
+
+
+class ModelRateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for a single model."""
+
+    def __init__(self, model: str, rpm: Optional[int], tpm: Optional[int]):
+        self.model = model
+        self.requests = TokenBucket(rpm, rpm / 60.0) if rpm else None
+        self.tokens = TokenBucket(tpm, tpm / 60.0) if tpm else None
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.total_wait_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request and `tokens` tokens fit under the limits. Returns the queueing delay."""
+        waited = 0.0
+        if self.requests:
+            waited += self.requests.acquire(1)
+        if self.tokens and tokens:
+            waited += self.tokens.acquire(tokens)
+        with self._stats_lock:
+            self.total_requests += 1
+            self.total_tokens += tokens
+            self.total_wait_seconds += waited
+        return waited
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            return {
+                "requests": self.total_requests,
+                "estimated_tokens": self.total_tokens,
+                "wait_seconds": round(self.total_wait_seconds, 3),
+            }
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: str) -> ModelRateLimiter:
+    """Return the process-wide limiter for `model`, configured from RATE_LIMITS."""
+    with _limiters_lock:
+        if model not in _limiters:
+            limits = RATE_LIMITS.get(model, RATE_LIMITS["default"])
+            _limiters[model] = ModelRateLimiter(model, limits.get("rpm"), limits.get("tpm"))
+        return _limiters[model]
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """Return usage and queueing statistics for every model seen so far."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {model: limiter.stats() for model, limiter in limiters.items()}
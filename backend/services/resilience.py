@@ -0,0 +1,290 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from ..config import CIRCUIT_BREAKER_CONFIG, PROVIDER_RESILIENCE
+
+# Shared pool for calls that run under a deadline; a call that overruns keeps its worker
+# until the underlying request returns, so the pool is sized generously.
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="provider-call")
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a provider call does not finish within its deadline."""
+
+
+class ProviderUnavailable(Exception):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    # openai.APIStatusError, requests.HTTPError and urllib.error.HTTPError each keep it elsewhere
+    for source in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "status", "code"):
+            value = getattr(source, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """
+    Return whether `exc` means the provider is unhealthy: a deadline, timeout or connection error,
+    a 429 or a 5xx. Other errors (bad requests, auth, parsing) are the caller's problem and
+    must not trip the circuit breaker.
+    """
+    if isinstance(exc, (DeadlineExceeded, TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    # Client libraries without a shared base class: openai.APITimeoutError/APIConnectionError,
+    # requests.Timeout/ConnectionError, urllib.error.URLError
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    return bool(names & {"APITimeoutError", "APIConnectionError", "Timeout", "ConnectionError", "URLError"})
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker.
+
+    After `failure_threshold` consecutive provider failures (see `is_provider_failure`) the breaker
+    opens and calls fail fast.
+    Once `reset_timeout` seconds have passed, a single trial call is let through (half-open);
+    its success closes the breaker, its failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "open" and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return True
+            return self.state == "closed"
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_ignored(self):
+        """A call failed for a reason unrelated to provider health; only a half-open trial is settled."""
+        with self._lock:
+            if self.state == "half_open":
+                self.state = "closed"
+                self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = self._clock()
+
+
+class ProviderStats:
+    """Call, error, timeout and hedge counters plus a window of recent latencies."""
+
+    def __init__(self, window: int = 500):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.hedges = 0
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, error: bool = False, timeout: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.timeouts += int(timeout)
+            self.latencies.append(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self.latencies)
+
+            def percentile(p):
+                if not ordered:
+                    return None
+                return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1)
+
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "hedges": self.hedges,
+                "latency_ms": {
+                    "p50": percentile(0.50),
+                    "p95": percentile(0.95),
+                    "p99": percentile(0.99),
+                },
+            }
+
+
+def call_with_deadline(fn: Callable[[], Any], deadline_seconds: float) -> Any:
+    """Run `fn` and return its result, raising DeadlineExceeded if it takes longer than the deadline."""
+    future = _executor.submit(fn)
+    try:
+        return future.result(timeout=deadline_seconds)
+    except FutureTimeoutError:
+        raise DeadlineExceeded(f"Call exceeded its {deadline_seconds}s deadline")
+
+
+def hedged_call(
+    fn: Callable[[], Any],
+    hedge_after_seconds: float,
+    deadline_seconds: float,
+    on_hedge: Optional[Callable[[], None]] = None,
+) -> Any:
+    """
+    Run an idempotent `fn`; if it has not answered after `hedge_after_seconds`, start a second
+    identical attempt and return whichever succeeds first, all within `deadline_seconds`.
+    """
+    started = time.monotonic()
+    futures = {_executor.submit(fn)}
+    done, _ = wait(futures, timeout=hedge_after_seconds)
+    if not done:
+        if on_hedge:
+            on_hedge()
+        futures.add(_executor.submit(fn))
+
+    last_error: Optional[BaseException] = None
+    while futures:
+        remaining = deadline_seconds - (time.monotonic() - started)
+        if remaining <= 0:
+            break
+        done, futures = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            last_error = future.exception()
+        if not done:
+            break
+
+    if futures or last_error is None:
+        raise DeadlineExceeded(f"Call exceeded its {deadline_seconds}s deadline")
+    raise last_error
+
+
+class ResilientProvider:
+    """
+    Wraps calls to one external provider with a deadline, optional hedging and a circuit breaker,
+    and keeps per-provider latency and error statistics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        deadline_seconds: float,
+        hedge_after_seconds: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.deadline_seconds = deadline_seconds
+        self.hedge_after_seconds = hedge_after_seconds
+        self.breaker = CircuitBreaker(
+            failure_threshold or CIRCUIT_BREAKER_CONFIG["failure_threshold"],
+            reset_timeout_seconds or CIRCUIT_BREAKER_CONFIG["reset_timeout_seconds"],
+        )
+        self.stats = ProviderStats()
+
+    @property
+    def healthy(self) -> bool:
+        return self.breaker.state != "open"
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        idempotent: bool = False,
+        acquire: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Call the provider through `fn`.
+
+        `acquire` (typically a local rate limiter) runs once before the call, outside the deadline
+        and any hedge, so time spent queueing locally is never counted as a provider failure.
+
+        Raises:
+            ProviderUnavailable: If the circuit breaker is open.
+            DeadlineExceeded: If no answer arrived within the deadline.
+
+        Errors raised by `fn` are re-raised; only those `is_provider_failure` accepts count
+        towards opening the breaker.
+        """
+        if not self.breaker.allow():
+            with self.stats._lock:
+                self.stats.rejected += 1
+            raise ProviderUnavailable(f"{self.name} is temporarily unavailable (circuit open)")
+
+        if acquire:
+            acquire()
+        started = time.monotonic()
+        try:
+            if idempotent and self.hedge_after_seconds:
+
+                def count_hedge():
+                    with self.stats._lock:
+                        self.stats.hedges += 1
+
+                result = hedged_call(
+                    fn, self.hedge_after_seconds, self.deadline_seconds, on_hedge=count_hedge
+                )
+            else:
+                result = call_with_deadline(fn, self.deadline_seconds)
+        except DeadlineExceeded:
+            self.stats.record(time.monotonic() - started, error=True, timeout=True)
+            self.breaker.record_failure()
+            raise
+        except Exception as e:
+            self.stats.record(time.monotonic() - started, error=True)
+            if is_provider_failure(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_ignored()
+            raise
+
+        self.stats.record(time.monotonic() - started)
+        self.breaker.record_success()
+        return result
+
+
+_providers: Dict[str, ResilientProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider(name: str) -> ResilientProvider:
+    """Return the process-wide ResilientProvider for `name`, configured from PROVIDER_RESILIENCE."""
+    with _providers_lock:
+        if name not in _providers:
+            settings = PROVIDER_RESILIENCE.get(name, PROVIDER_RESILIENCE["default"])
+            _providers[name] = ResilientProvider(
+                name,
+                settings["deadline_seconds"],
+                settings.get("hedge_after_seconds"),
+            )
+        return _providers[name]
+
+
+def provider_stats() -> Dict[str, Dict[str, Any]]:
+    """Return health, latency percentiles and error counters for every provider seen so far."""
+    with _providers_lock:
+        providers = dict(_providers)
+    return {
+        name: {"circuit": provider.breaker.state, **provider.stats.snapshot()}
+        for name, provider in providers.items()
+    }
@@ -0,0 +1,79 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class Call:
+    """One in-flight computation that any number of callers can wait on."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Block until the leader finishes; return its result or re-raise its error."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("Timed out waiting for in-flight call")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key so the work runs once.
+
+    The first caller for a key becomes the leader and does the work; callers arriving while it
+    is running wait for the leader's result instead of repeating the work. Once the leader
+    finishes, the key is released and the next call starts a new flight.
+
+    Methods:
+        - do(key, fn): Run `fn` once per in-flight key and return (result, shared).
+        - begin(key): Lower-level entry for leaders that produce their result incrementally.
+        - finish(key, call, result, error): Publish a leader's outcome started with `begin`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Call] = {}
+
+    def begin(self, key: str) -> Tuple[Call, bool]:
+        """Join or start the flight for `key`. Returns the call and whether the caller is its leader."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                return call, False
+            call = self._calls[key] = Call()
+            return call, True
+
+    def finish(
+        self, key: str, call: Call, result: Any = None, error: Optional[BaseException] = None
+    ):
+        """Publish the leader's result (or error) to every follower and release the key."""
+        call.result = result
+        call.error = error
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call._done.set()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `fn` unless a call with the same key is already in flight.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it was shared from another caller's flight.
+        """
+        call, leader = self.begin(key)
+        if not leader:
+            return call.wait(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result=result)
+        return result, False
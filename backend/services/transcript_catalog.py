@@ -0,0 +1,370 @@
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import DATA_DIR, TRANSCRIPT_CATALOG_CONFIG
+from ..transcript_model import Transcript, load_transcript
+from .language_id import LANGUAGE_NAMES, transcript_language
+
+SORT_COLUMNS = {
+    "created_at": "created_ts",
+    "filename": "filename",
+    "word_count": "word_count",
+    "speaker_count": "speaker_count",
+    "file_size": "file_size",
+}
+
+
+def translated_name(filename: str) -> str:
+    """Return the English transcript filename for a Georgian one."""
+    if "_ge_" in filename:
+        return filename.replace("_ge_", "_en_")
+    base, ext = os.path.splitext(filename)
+    return f"{base}_en{ext}"
+
+
+def transcript_stats(data: Any) -> Dict[str, Any]:
+    """Compute the per-transcript stats shown on the dashboard from stored data or a Transcript."""
+    transcript = data if isinstance(data, Transcript) else Transcript.from_data(data)
+    return {
+        "word_count": transcript.word_count(),
+        "speaker_count": transcript.speaker_count(),
+        "utterance_count": len(transcript),
+    }
+
+
+def encode_cursor(value: Any, filename: str) -> str:
+    """Encode a keyset position (sort value, filename) as an opaque cursor."""
+    raw = json.dumps([value, filename], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor produced by encode_cursor. Raises ValueError for malformed cursors."""
+    try:
+        value, filename = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    return value, filename
+
+
+class TranscriptCatalog:
+    """
+    SQLite catalog of transcripts with precomputed stats, maintained when transcripts are written.
+
+    Listing transcripts is an indexed query that never opens transcript files. Rows are added by
+    `record` from the save and translation paths; an empty catalog is backfilled from the data
+    directory once.
+
+    Methods:
+        - record(filename, data, path): Add or refresh a transcript from the data just written.
+        - remove(filename): Drop a transcript from the catalog.
+        - query(...): Filtered, sorted page of transcripts with a cursor for the next page.
+        - rebuild(): Re-scan the data directory (one-time backfill or repair).
+        - version(): A version string that changes with every write, and the last write time.
+    """
+
+    def __init__(self, path: Optional[str] = None, data_dir: Optional[str] = None):
+        self.path = path or TRANSCRIPT_CATALOG_CONFIG["path"]
+        self.data_dir = data_dir or DATA_DIR
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS transcripts (
+                       filename TEXT PRIMARY KEY,
+                       language TEXT NOT NULL,
+                       original_language TEXT,
+                       translated INTEGER NOT NULL DEFAULT 0,
+                       translated_filename TEXT,
+                       has_translation INTEGER NOT NULL DEFAULT 0,
+                       created_ts REAL NOT NULL,
+                       file_size INTEGER NOT NULL,
+                       word_count INTEGER NOT NULL,
+                       speaker_count INTEGER NOT NULL,
+                       utterance_count INTEGER NOT NULL
+                   )"""
+            )
+            for column in ("created_ts", "word_count", "speaker_count", "file_size"):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_transcripts_{column} "
+                    f"ON transcripts ({column}, filename)"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_transcripts_language ON transcripts (language, created_ts)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('version', 0), ('updated_at', 0)"
+            )
+            # Random per-database id (52 bits, exact in a REAL), so a recreated catalog whose
+            # counter starts again never reuses an old version
+            self._conn.execute(
+                "INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('db_id', ?)",
+                (uuid.uuid4().int >> 76,),
+            )
+            empty = self._conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0] == 0
+        if empty and os.path.isdir(self.data_dir):
+            self.rebuild()
+
+    def _bump_version(self):
+        self._conn.execute("UPDATE catalog_meta SET value = value + 1 WHERE key = 'version'")
+        self._conn.execute(
+            "UPDATE catalog_meta SET value = ? WHERE key = 'updated_at'", (time.time(),)
+        )
+
+    def _row_for(self, filename: str, data: Any, path: str) -> Tuple:
+        stat = os.stat(path)
+        transcript = data if isinstance(data, Transcript) else Transcript.from_data(data)
+        # Detected from the text; the `_ge_` naming convention only breaks ties for empty files
+        language = transcript_language(transcript, hint="ka" if "_ge_" in filename else None)
+        translated_filename = translated_name(filename) if language == "ka" else None
+        has_translation = bool(translated_filename) and (
+            self._conn.execute(
+                "SELECT 1 FROM transcripts WHERE filename = ?", (translated_filename,)
+            ).fetchone()
+            is not None
+            or os.path.exists(os.path.join(os.path.dirname(path), translated_filename))
+        )
+        meta = transcript.metadata
+        stats = transcript_stats(transcript)
+        return (
+            filename,
+            LANGUAGE_NAMES[language],
+            meta.get("original_language", meta.get("language")),
+            int(bool(meta.get("translated", False))),
+            translated_filename if has_translation else None,
+            int(has_translation),
+            stat.st_ctime,
+            stat.st_size,
+            stats["word_count"],
+            stats["speaker_count"],
+            stats["utterance_count"],
+        )
+
+    def _upsert(self, filename: str, data: Any, path: str):
+        transcript = data if isinstance(data, Transcript) else Transcript.from_data(data)
+        # Rewrites (translation refresh, format migration) keep the original creation time
+        self._conn.execute(
+            """INSERT INTO transcripts
+               (filename, language, original_language, translated, translated_filename,
+                has_translation, created_ts, file_size, word_count, speaker_count, utterance_count)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (filename) DO UPDATE SET
+                   language = excluded.language,
+                   original_language = excluded.original_language,
+                   translated = excluded.translated,
+                   translated_filename = excluded.translated_filename,
+                   has_translation = excluded.has_translation,
+                   file_size = excluded.file_size,
+                   word_count = excluded.word_count,
+                   speaker_count = excluded.speaker_count,
+                   utterance_count = excluded.utterance_count""",
+            self._row_for(filename, transcript, path),
+        )
+        # An English file marks its Georgian source as translated
+        sources = {filename.replace("_en_", "_ge_")} if "_en_" in filename else set()
+        if transcript.metadata.get("translated_from"):
+            sources.add(transcript.metadata["translated_from"])
+        for source in sources - {filename}:
+            self._conn.execute(
+                "UPDATE transcripts SET translated_filename = ?, has_translation = 1 WHERE filename = ?",
+                (filename, source),
+            )
+
+    def record(self, filename: str, data: Any, path: Optional[str] = None):
+        """
+            Add or refresh a transcript using the data that was just written (the file is only stat'ed).
+
+            Args:
+                filename (str): Transcript filename.
+                data (Any): The transcript content as written, or a Transcript.
+                path (str, optional): Where the file was written; defaults to the catalog's data directory.
+        """
+        path = path or os.path.join(self.data_dir, filename)
+        with self._lock, self._conn:
+            self._upsert(filename, data, path)
+            self._bump_version()
+
+    def remove(self, filename: str):
+        """Drop a transcript from the catalog."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transcripts WHERE filename = ?", (filename,))
+            self._conn.execute(
+                "UPDATE transcripts SET translated_filename = NULL, has_translation = 0 "
+                "WHERE translated_filename = ?",
+                (filename,),
+            )
+            self._bump_version()
+
+    def rebuild(self) -> int:
+        """
+            Re-scan the data directory, reading every transcript once, and replace the catalog rows.
+
+            Returns:
+                int: Number of transcripts catalogued.
+        """
+        filenames = sorted(
+            name
+            for name in os.listdir(self.data_dir)
+            if name.endswith(".json") and not name.endswith("_summary.json")
+            and os.path.isfile(os.path.join(self.data_dir, name))
+        )
+        loaded = []
+        for filename in filenames:
+            path = os.path.join(self.data_dir, filename)
+            try:
+                loaded.append((filename, load_transcript(path), path))
+            except Exception as e:
+                print(f"⚠️ Skipping unreadable transcript {filename}: {e}")
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transcripts")
+            # English files go last so their Georgian sources already exist when linked
+            for filename, data, path in sorted(loaded, key=lambda item: "_en_" in item[0]):
+                self._upsert(filename, data, path)
+            self._bump_version()
+        print(f"📚 Catalogued {len(loaded)} transcript(s) from {self.data_dir}")
+        return len(loaded)
+
+    def version(self) -> Tuple[str, Optional[float]]:
+        """Return (version, last write timestamp). The version combines the database id and write counter."""
+        with self._lock:
+            values = dict(self._conn.execute("SELECT key, value FROM catalog_meta").fetchall())
+        return f"{int(values['db_id']):x}-{int(values['version'])}", values["updated_at"] or None
+
+    @staticmethod
+    def _row_to_transcript(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "filename": row["filename"],
+            "language": row["language"],
+            "translated_filename": row["translated_filename"],
+            "has_translation": bool(row["has_translation"]),
+            "created_at": datetime.fromtimestamp(row["created_ts"]).isoformat(),
+            "file_size": row["file_size"],
+            "word_count": row["word_count"],
+            "speaker_count": row["speaker_count"],
+            "utterance_count": row["utterance_count"],
+        }
+
+    def query(
+        self,
+        language: Optional[str] = None,
+        has_translation: Optional[bool] = None,
+        search: Optional[str] = None,
+        sort: str = "created_at",
+        order: str = "desc",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+            Return one page of transcripts matching the filters.
+
+            Args:
+                language (str, optional): A language name ("English", "Georgian", "Slovak"...).
+                has_translation (bool, optional): Only transcripts with (or without) a translation.
+                search (str, optional): Case-insensitive filename substring.
+                sort (str, optional): One of SORT_COLUMNS.
+                order (str, optional): "asc" or "desc".
+                limit (int, optional): Page size; defaults to TRANSCRIPT_CATALOG_CONFIG["page_size"].
+                cursor (str, optional): `next_cursor` from the previous page.
+
+            Returns:
+                Dict[str, Any]: 'transcripts', 'total' (matches across all pages), 'georgian_count',
+                                'english_count' and 'next_cursor' (None on the last page).
+
+            Raises:
+                ValueError: For an unknown sort column or order, or a malformed cursor.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_COLUMNS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be 'asc' or 'desc'")
+        column = SORT_COLUMNS[sort]
+        limit = limit or TRANSCRIPT_CATALOG_CONFIG["page_size"]
+
+        clauses, params = [], []
+        if language:
+            clauses.append("language = ?")
+            params.append(language)
+        if has_translation is not None:
+            clauses.append("has_translation = ?")
+            params.append(int(has_translation))
+        if search:
+            clauses.append("filename LIKE ? ESCAPE '\\'")
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        filter_sql = " AND ".join(clauses) or "1"
+
+        page_clauses, page_params = list(clauses), list(params)
+        if cursor:
+            value, last_filename = decode_cursor(cursor)
+            op = "<" if order == "desc" else ">"
+            page_clauses.append(f"({column} {op} ? OR ({column} = ? AND filename {op} ?))")
+            page_params.extend([value, value, last_filename])
+        page_sql = " AND ".join(page_clauses) or "1"
+        direction = order.upper()
+
+        with self._lock:
+            self._conn.row_factory = sqlite3.Row
+            try:
+                total, georgian = self._conn.execute(
+                    f"""SELECT COUNT(*), COALESCE(SUM(language = 'Georgian'), 0)
+                        FROM transcripts WHERE {filter_sql}""",
+                    params,
+                ).fetchone()
+                rows = self._conn.execute(
+                    f"""SELECT * FROM transcripts WHERE {page_sql}
+                        ORDER BY {column} {direction}, filename {direction} LIMIT ?""",
+                    (*page_params, limit + 1),
+                ).fetchall()
+            finally:
+                self._conn.row_factory = None
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last[column], last["filename"])
+
+        return {
+            "transcripts": [self._row_to_transcript(row) for row in rows],
+            "total": total,
+            "georgian_count": georgian,
+            "english_count": total - georgian,
+            "next_cursor": next_cursor,
+        }
+
+
+_shared_catalog: Optional[TranscriptCatalog] = None
+_shared_lock = threading.Lock()
+
+
+def get_transcript_catalog() -> TranscriptCatalog:
+    """Return the process-wide transcript catalog."""
+    global _shared_catalog
+    with _shared_lock:
+        if _shared_catalog is None:
+            _shared_catalog = TranscriptCatalog()
+        return _shared_catalog
+
+
+def catalog_transcript(filename: str, data: Any, path: Optional[str] = None):
+    """Record a freshly written transcript in the catalog; failures are logged, never raised."""
+    try:
+        get_transcript_catalog().record(filename, data, path)
+    except Exception as e:
+        print(f"⚠️ Failed to update transcript catalog for {filename}: {e}")
@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+from ..config import TRANSCRIPT_READY_CONFIG
+
+T = TypeVar("T")
+
+
+class TranscriptEvents:
+    """
+    In-process notifications for transcripts that were just published.
+
+    Writers publish a transcript after its atomic rename, so a published file is always complete.
+    Readers waiting for a file block on a condition variable and wake up the moment it is
+    published. Files written by other processes are published by the transcript watcher for the
+    directories it watches. In any other directory they produce no event, so the wait there
+    falls back to polling: `ready()` is rechecked every `external_recheck_seconds` (1s by default).
+
+    Methods:
+        - publish(path): Announce that `path` now holds a complete transcript.
+        - generation(path): How many times `path` has been published in this process.
+        - watch_directory(directory) / unwatch_directory(directory): Register a directory whose
+          external writes are published (by the transcript watcher).
+        - wait_for(path, ready, timeout): Block until `ready()` returns a value or the timeout expires.
+    """
+
+    def __init__(self, external_recheck_seconds: Optional[float] = None):
+        self.external_recheck_seconds = (
+            external_recheck_seconds
+            if external_recheck_seconds is not None
+            else TRANSCRIPT_READY_CONFIG["external_recheck_seconds"]
+        )
+        self._condition = threading.Condition()
+        self._generations: Dict[str, int] = {}
+        # directory -> number of active watchers publishing its external writes
+        self._watched: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def publish(self, path: str):
+        """Wake every reader waiting for `path`."""
+        with self._condition:
+            key = self._key(path)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._condition.notify_all()
+
+    def watch_directory(self, directory: str):
+        """Mark `directory` as watched: its external writes will be published, so waits there do not poll."""
+        with self._condition:
+            key = self._key(directory)
+            self._watched[key] = self._watched.get(key, 0) + 1
+
+    def unwatch_directory(self, directory: str):
+        with self._condition:
+            key = self._key(directory)
+            if self._watched.get(key, 0) <= 1:
+                self._watched.pop(key, None)
+            else:
+                self._watched[key] -= 1
+            # Waiters in this directory must go back to rechecking
+            self._condition.notify_all()
+
+    def generation(self, path: str) -> int:
+        with self._condition:
+            return self._generations.get(self._key(path), 0)
+
+    def wait_for(
+        self, path: str, ready: Callable[[], Optional[T]], timeout: Optional[float] = None
+    ) -> Optional[T]:
+        """
+            Return `ready()` as soon as it is not None, waiting for publish events in between.
+
+            In a watched directory `ready()` is only rerun on a publish event. Elsewhere it is also
+            rerun every `external_recheck_seconds`, the polling fallback for external writers.
+
+            Args:
+                path (str): The file being waited for.
+                ready (Callable): Returns the loaded value, or None while the file is not there yet.
+                timeout (float, optional): Seconds to wait; defaults to TRANSCRIPT_READY_CONFIG.
+
+            Returns:
+                The value from `ready()`, or None if the timeout expired first.
+        """
+        timeout = TRANSCRIPT_READY_CONFIG["timeout_seconds"] if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        key = self._key(path)
+        while True:
+            with self._condition:
+                seen = self._generations.get(key, 0)
+            value = ready()
+            if value is not None:
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            with self._condition:
+                # Skip the wait if the file was published while ready() ran
+                if self._generations.get(key, 0) == seen:
+                    if os.path.dirname(key) in self._watched:
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait(min(remaining, self.external_recheck_seconds))
+
+
+_events = TranscriptEvents()
+
+
+def get_transcript_events() -> TranscriptEvents:
+    """Return the process-wide transcript event hub."""
+    return _events
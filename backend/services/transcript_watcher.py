@@ -0,0 +1,277 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import DATA_DIR, TRANSCRIPT_WATCHER_CONFIG
+from ..file_utils import atomic_write_json
+from ..semantic import index_transcripts
+from ..transcript_format import loads_transcript
+from ..transcript_model import Transcript
+from .near_duplicates import NearDuplicateIndex, get_near_duplicate_index
+from .transcript_catalog import TranscriptCatalog, get_transcript_catalog
+from .transcript_events import get_transcript_events
+
+
+class TranscriptWatcher:
+    """
+    Incrementally index transcripts that appear or change in the data directory.
+
+    Each scan stats the directory and compares every transcript against a persistent checkpoint
+    of (mtime, size, content hash). Changed files are debounced until their size and mtime stop
+    moving, then processed in batches: the catalog row is refreshed, near-duplicates of an
+    earlier transcript are linked to it, and the remaining texts are embedded (one embedding
+    request per batch, skipped when the index already holds the same text) and written to the
+    vector index with a single atomic write. Files whose bytes did not change (e.g. a
+    touch) only have their checkpoint refreshed; deleted files leave the catalog and the index.
+
+    Methods:
+        - scan(): Return (files ready to process, files that were deleted).
+        - process(filenames, removed): Index a batch of changes and return a report.
+        - run_once(): One scan and the resulting processing.
+        - start() / stop(): Run scans on a background thread.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = DATA_DIR,
+        checkpoint_path: Optional[str] = None,
+        catalog: Optional[TranscriptCatalog] = None,
+        duplicates: Optional[NearDuplicateIndex] = None,
+        interval_seconds: Optional[float] = None,
+        debounce_seconds: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.data_dir = data_dir
+        self.checkpoint_path = checkpoint_path or TRANSCRIPT_WATCHER_CONFIG["checkpoint_path"]
+        self.catalog = catalog
+        self.duplicates = duplicates
+        self.interval_seconds = interval_seconds or TRANSCRIPT_WATCHER_CONFIG["interval_seconds"]
+        self.debounce_seconds = (
+            debounce_seconds if debounce_seconds is not None else TRANSCRIPT_WATCHER_CONFIG["debounce_seconds"]
+        )
+        self.batch_size = batch_size or TRANSCRIPT_WATCHER_CONFIG["batch_size"]
+        self.clock = clock
+        self.checkpoint = self._load_checkpoint()
+        # filename -> ((mtime_ns, size), time the signature was first seen)
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.checkpoint_path):
+            return {}
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable watcher checkpoint: {e}")
+            return {}
+
+    @staticmethod
+    def _is_transcript(name: str) -> bool:
+        return name.endswith(".json") and not name.startswith(".") and not name.endswith("_summary.json")
+
+    def scan(self) -> Tuple[List[str], List[str]]:
+        """
+            Stat the data directory once.
+
+            Returns:
+                Tuple[List[str], List[str]]: Changed files whose signature has been stable for the
+                debounce period, and checkpointed files that no longer exist.
+        """
+        now = self.clock()
+        ready, seen = [], set()
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if not self._is_transcript(entry.name) or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                known = self.checkpoint.get(entry.name)
+                if known and (known["mtime_ns"], known["size"]) == signature:
+                    self._pending.pop(entry.name, None)
+                    continue
+                pending = self._pending.get(entry.name)
+                if pending is None or pending[0] != signature:
+                    self._pending[entry.name] = (signature, now)
+                elif now - pending[1] >= self.debounce_seconds:
+                    ready.append(entry.name)
+
+        for name in set(self._pending) - seen:
+            del self._pending[name]
+        removed = sorted(set(self.checkpoint) - seen)
+        return sorted(ready), removed
+
+    def _catalog(self) -> TranscriptCatalog:
+        if self.catalog is None:
+            self.catalog = get_transcript_catalog()
+        return self.catalog
+
+    def _duplicates(self) -> NearDuplicateIndex:
+        if self.duplicates is None:
+            self.duplicates = get_near_duplicate_index()
+        return self.duplicates
+
+    def process(self, filenames: List[str], removed: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+            Index changed transcripts in batches and drop removed ones.
+
+            Returns:
+                Dict[str, Any]: Counts of indexed, embedded, duplicate, unchanged, removed and failed files.
+        """
+        removed = removed or []
+        report = {"indexed": 0, "embedded": 0, "duplicates": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        for name in removed:
+            self._catalog().remove(name)
+            self._duplicates().remove(name)
+            self.checkpoint.pop(name, None)
+        if removed:
+            index_transcripts.update_index([], removed)
+            report["removed"] = len(removed)
+
+        for start in range(0, len(filenames), self.batch_size):
+            self._process_batch(filenames[start : start + self.batch_size], report)
+            atomic_write_json(self.checkpoint_path, self.checkpoint)
+
+        if removed and not filenames:
+            atomic_write_json(self.checkpoint_path, self.checkpoint)
+        return report
+
+    def _process_batch(self, filenames: List[str], report: Dict[str, Any]):
+        existing_texts = index_transcripts.indexed_texts()
+        to_embed: List[Tuple[str, str, Dict[str, Any]]] = []
+
+        for name in filenames:
+            path = os.path.join(self.data_dir, name)
+            try:
+                stat = os.stat(path)
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except OSError as e:
+                print(f"⚠️ Watcher could not read {name}: {e}")
+                continue
+
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": hashlib.sha256(raw).hexdigest(),
+            }
+            known = self.checkpoint.get(name)
+            if known and known.get("sha256") == entry["sha256"] and not known.get("error"):
+                self.checkpoint[name] = entry
+                report["unchanged"] += 1
+                continue
+
+            try:
+                transcript = Transcript.from_data(loads_transcript(raw))
+                self._catalog().record(name, transcript, path)
+            except Exception as e:
+                # Not retried until the file changes again
+                print(f"❌ Watcher failed to index {name}: {e}")
+                self.checkpoint[name] = {**entry, "error": str(e)}
+                report["failed"] += 1
+                continue
+
+            get_transcript_events().publish(path)
+            text = index_transcripts.indexable_text(transcript, name)
+            original = (
+                self._duplicates().register(name, transcript.full_text)
+                if text is not None
+                else None
+            )
+            if original:
+                # Copies are linked to the original instead of being embedded again
+                print(f"🔗 {name} is a near-duplicate of {original[0]}; not embedding it")
+                self.checkpoint[name] = entry
+                report["duplicates"] += 1
+            elif text is None or existing_texts.get(name) == text:
+                self.checkpoint[name] = entry
+                report["indexed"] += 1
+            else:
+                to_embed.append((name, text, entry))
+
+        if not to_embed:
+            return
+        model = index_transcripts.active_generation()["model"]
+        embeddings = index_transcripts.get_embeddings([text for _, text, _ in to_embed], model)
+        if embeddings is None:
+            # Left out of the checkpoint, so the next scan retries them
+            report["failed"] += len(to_embed)
+            return
+
+        index_transcripts.update_index(
+            [
+                {"embedding": embedding, "text": text, "source": name}
+                for (name, text, _), embedding in zip(to_embed, embeddings)
+            ],
+            model=model,
+        )
+        for name, _, entry in to_embed:
+            self.checkpoint[name] = entry
+        report["indexed"] += len(to_embed)
+        report["embedded"] += len(to_embed)
+        print(f"🔍 Watcher embedded {len(to_embed)} transcript(s)")
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        """Scan once and process whatever is ready. Returns the report, or None if nothing changed."""
+        ready, removed = self.scan()
+        if not ready and not removed:
+            return None
+        return self.process(ready, removed)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ Transcript watcher error: {e}")
+            self._stop.wait(self.interval_seconds)
+
+    def start(self):
+        """Start scanning on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="transcript-watcher", daemon=True)
+        self._thread.start()
+        # Waits for files in data_dir can rely on this watcher's publish events instead of polling
+        get_transcript_events().watch_directory(self.data_dir)
+        print(f"👀 Watching {self.data_dir} for new transcripts")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+            get_transcript_events().unwatch_directory(self.data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index transcripts added to the data directory by other tools.")
+    parser.add_argument("--once", action="store_true", help="Scan once, process stable changes and exit")
+    args = parser.parse_args()
+
+    if args.once:
+        # A one-off run has no earlier scan to debounce against
+        watcher = TranscriptWatcher(debounce_seconds=0)
+        watcher.scan()
+        print(json.dumps(watcher.run_once() or {}, indent=2))
+        return
+
+    watcher = TranscriptWatcher()
+    watcher.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from ..config import ASSEMBLYAI_API_KEY, ASSEMBLYAI_CONFIG, TRANSCRIPTION_CONFIG
+
+SYNTHETIC_WORDS = {
+    "en": [
+        "agenda", "budget", "client", "deadline", "team", "review", "report",
+        "project", "schedule", "update", "next", "week", "we", "should", "the",
+        "plan", "launch", "meeting", "follow", "up", "on", "marketing", "goals",
+    ],
+    "ka": [
+        "შეხვედრა", "ბიუჯეტი", "გეგმა", "კლიენტი", "ვადა", "გუნდი", "ანგარიში",
+        "პროექტი", "განრიგი", "შემდეგ", "კვირას", "ჩვენ", "უნდა", "განვიხილოთ",
+    ],
+}
+
+
+def file_fingerprint(file_path: str, language: str) -> str:
+    """Return a stable key for an audio file's content and the requested language."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(f"|{language}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TranscriptionBackend(ABC):
+    """
+        Interface for transcription providers used by TranscriptionService.
+
+        Implementations return a dictionary with:
+            - 'transcript' (List[Dict[str, Any]]): Utterances with speaker, text, start, end.
+            - 'language' (str): Detected or specified language code.
+            - 'duration' (float or None): Duration of the audio in seconds.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def transcribe(self, file_path: str, language: str = "en") -> Dict[str, Any]:
+        """Transcribe the audio at `file_path` in `language` ("auto" to detect it)."""
+
+
+class AssemblyAIBackend(TranscriptionBackend):
+    """Transcribe audio through the AssemblyAI API (the production backend)."""
+
+    name = "assemblyai"
+
+    def __init__(self):
+        import assemblyai as aai
+
+        self.aai = aai
+        aai.settings.api_key = ASSEMBLYAI_API_KEY
+
+    def transcribe(self, file_path: str, language: str = "en") -> Dict[str, Any]:
+        aai = self.aai
+        try:
+            use_speaker_labels = (
+                ASSEMBLYAI_CONFIG["speaker_labels"] if language != "ka" else False
+            )
+
+            # "auto" (the upload form's default) lets AssemblyAI detect the spoken language
+            detect_language = language in (None, "", "auto")
+            config = aai.TranscriptionConfig(
+                speech_model=ASSEMBLYAI_CONFIG["model"],
+                speaker_labels=use_speaker_labels,
+                language_code=None if detect_language else language,
+                language_detection=detect_language,
+            )
+
+            transcriber = aai.Transcriber(config=config)
+            transcript = transcriber.transcribe(file_path)
+
+            if transcript.status == aai.TranscriptStatus.error:
+                raise Exception(transcript.error)
+
+            speaker_output = []
+            if hasattr(transcript, "utterances") and transcript.utterances:
+                for utterance in transcript.utterances:
+                    speaker_output.append(
+                        {
+                            "speaker": utterance.speaker,
+                            "text": utterance.text,
+                            "start": utterance.start,
+                            "end": utterance.end,
+                        }
+                    )
+            else:
+                speaker_output.append(
+                    {
+                        "speaker": "Speaker A",
+                        "text": transcript.text or "",
+                        "start": 0,
+                        "end": 0,
+                    }
+                )
+
+            return {
+                "transcript": speaker_output,
+                "language": getattr(transcript, "language_code", "en"),
+                "duration": getattr(transcript, "audio_duration", None),
+            }
+
+        except Exception as e:
+            raise Exception(f"AssemblyAI transcription failed: {str(e)}")
+
+
+class LocalBackend(TranscriptionBackend):
+    """
+        Offline stand-in that returns deterministic synthetic utterances.
+
+        The output is seeded from the audio file's content, so the same file always produces the
+        same transcript. An optional fixed latency simulates provider response time for load tests.
+    """
+
+    name = "local"
+
+    def __init__(self, latency_seconds: Optional[float] = None, utterances: Optional[int] = None):
+        self.latency_seconds = (
+            TRANSCRIPTION_CONFIG["local_latency_seconds"]
+            if latency_seconds is None
+            else latency_seconds
+        )
+        self.utterances = utterances or TRANSCRIPTION_CONFIG["local_utterances"]
+
+    def transcribe(self, file_path: str, language: str = "en") -> Dict[str, Any]:
+        if not os.path.exists(file_path):
+            raise Exception(f"Local transcription failed: file not found: {file_path}")
+
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+
+        resolved_language = language if language in SYNTHETIC_WORDS else "en"
+        words = SYNTHETIC_WORDS[resolved_language]
+        rng = random.Random(file_fingerprint(file_path, resolved_language))
+
+        speakers = ["A", "B", "C"][: rng.randint(2, 3)]
+        transcript = []
+        cursor = 0
+        for _ in range(self.utterances):
+            length = rng.randint(4, 16)
+            text = " ".join(rng.choice(words) for _ in range(length)).capitalize() + "."
+            duration_ms = length * rng.randint(280, 420)
+            transcript.append(
+                {
+                    "speaker": rng.choice(speakers),
+                    "text": text,
+                    "start": cursor,
+                    "end": cursor + duration_ms,
+                }
+            )
+            cursor += duration_ms + rng.randint(100, 800)
+
+        return {
+            "transcript": transcript,
+            "language": resolved_language,
+            "duration": round(cursor / 1000, 2),
+        }
+
+
+class RecordReplayBackend(TranscriptionBackend):
+    """
+        Capture and serve provider responses keyed by audio content and language.
+
+        In "record" mode every call goes to the wrapped backend and its response is saved to
+        `recordings_dir`. In "replay" mode responses are served from disk only, and a missing
+        recording raises an error instead of reaching the network.
+    """
+
+    def __init__(
+        self,
+        mode: str = "replay",
+        inner: Optional[TranscriptionBackend] = None,
+        recordings_dir: Optional[str] = None,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown record/replay mode: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode requires a backend to record from")
+
+        self.mode = mode
+        self.name = mode
+        self.inner = inner
+        self.recordings_dir = recordings_dir or TRANSCRIPTION_CONFIG["recordings_dir"]
+
+    def _recording_path(self, file_path: str, language: str) -> str:
+        return os.path.join(
+            self.recordings_dir, f"{file_fingerprint(file_path, language)}.json"
+        )
+
+    def transcribe(self, file_path: str, language: str = "en") -> Dict[str, Any]:
+        recording_path = self._recording_path(file_path, language)
+
+        if self.mode == "replay":
+            if not os.path.exists(recording_path):
+                raise Exception(
+                    f"Replay transcription failed: no recording for {os.path.basename(file_path)} ({language})"
+                )
+            with open(recording_path, "r", encoding="utf-8") as f:
+                return json.load(f)["response"]
+
+        response = self.inner.transcribe(file_path, language)
+
+        os.makedirs(self.recordings_dir, exist_ok=True)
+        with open(recording_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source_file": os.path.basename(file_path),
+                    "language": language,
+                    "backend": self.inner.name,
+                    "response": response,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"📼 Recorded transcription for {os.path.basename(file_path)}")
+        return response
+
+
+def create_backend(name: Optional[str] = None) -> TranscriptionBackend:
+    """Build the transcription backend named in TRANSCRIPTION_CONFIG (or the given name)."""
+    name = name or TRANSCRIPTION_CONFIG["backend"]
+
+    if name == "assemblyai":
+        return AssemblyAIBackend()
+    if name == "local":
+        return LocalBackend()
+    if name == "record":
+        return RecordReplayBackend(mode="record", inner=AssemblyAIBackend())
+    if name == "replay":
+        return RecordReplayBackend(mode="replay")
+
+    raise ValueError(f"Unknown transcription backend: {name}")
@@ -1,33 +1,38 @@
-import json
 import os
+import uuid
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import assemblyai as aai
-
-from ..config import ASSEMBLYAI_API_KEY, ASSEMBLYAI_CONFIG, DATA_DIR
+from ..config import DATA_DIR
 from ..semantic.index_transcripts import append_single_embedding
+from ..transcript_format import write_transcript
+from ..transcript_model import Transcript
+from .language_id import LANGUAGE_NAMES, transcript_language
+from .near_duplicates import get_near_duplicate_index, register_transcript
+from .transcript_catalog import catalog_transcript
+from .transcription_backends import TranscriptionBackend, create_backend
 
 
 class TranscriptionService:
     """
         A service for handling audio transcription and saving transcript data.
 
-        This class integrates with AssemblyAI to transcribe audio files and provides
+        This class delegates transcription to a pluggable backend (AssemblyAI by default, or the
+        local/record/replay backends configured in TRANSCRIPTION_CONFIG) and provides
         functionality to save the resulting transcript data to a file. It also supports
         embedding logic for English or translated transcripts.
 
         Methods:
-            - __init__: Initializes the service with the AssemblyAI API key.
+            - __init__: Initializes the service with the configured (or given) backend.
             - transcribe: Transcribes an audio file and returns structured transcript data.
             - save_transcript: Saves transcript data to a JSON file and triggers embedding logic.
     """
-    def __init__(self):
-        aai.settings.api_key = ASSEMBLYAI_API_KEY
+    def __init__(self, backend: Optional[TranscriptionBackend] = None):
+        self.backend = backend or create_backend()
 
     def transcribe(self, file_path: str, language: str = "en") -> Dict[str, Any]:
         """
-           Transcribe an audio file using AssemblyAI and return a structured transcript.
+           Transcribe an audio file using the configured backend and return a structured transcript.
 
            Args:
                file_path (str): Absolute path to the audio file to be transcribed.
@@ -41,59 +46,17 @@ class TranscriptionService:
                    - 'duration' (float or None): Duration of the audio in seconds.
 
            Raises:
-               Exception: If AssemblyAI returns an error or transcription fails.
+               Exception: If the backend returns an error or transcription fails.
         """
-        try:
-            use_speaker_labels = (
-                ASSEMBLYAI_CONFIG["speaker_labels"] if language != "ka" else False
-            )
-
-            config = aai.TranscriptionConfig(
-                speech_model=ASSEMBLYAI_CONFIG["model"],
-                speaker_labels=use_speaker_labels,
-                language_code=language,
-                language_detection=False,
-            )
-
-            transcriber = aai.Transcriber(config=config)
-            transcript = transcriber.transcribe(file_path)
-
-            if transcript.status == aai.TranscriptStatus.error:
-                raise Exception(transcript.error)
-
-            speaker_output = []
-            if hasattr(transcript, "utterances") and transcript.utterances:
-                for utterance in transcript.utterances:
-                    speaker_output.append(
-                        {
-                            "speaker": utterance.speaker,
-                            "text": utterance.text,
-                            "start": utterance.start,
-                            "end": utterance.end,
-                        }
-                    )
-            else:
-                speaker_output.append(
-                    {
-                        "speaker": "Speaker A",
-                        "text": transcript.text or "",
-                        "start": 0,
-                        "end": 0,
-                    }
-                )
-
-            return {
-                "transcript": speaker_output,
-                "language": getattr(transcript, "language_code", "en"),
-                "duration": getattr(transcript, "audio_duration", None),
-            }
-
-        except Exception as e:
-            raise Exception(f"AssemblyAI transcription failed: {str(e)}")
+        return self.backend.transcribe(file_path, language)
 
     def save_transcript(self, transcript_data: Dict[str, Any], filename: str) -> str:
         """
-        Save the transcript data as a JSON file and trigger embedding generation if applicable.
+        Save the transcript data atomically in the configured storage format (compact by default),
+        record it in the transcript catalog and trigger embedding generation if applicable.
+        The stored language comes from the text (offline language ID) when the backend's reported
+        language is missing, unsupported or in another script.
+        Near-duplicates of an earlier transcript are saved with `duplicate_of` set and not embedded.
 
         Args:
             transcript_data (dict): Transcript data, including language and transcript content.
@@ -105,19 +68,35 @@ class TranscriptionService:
         try:
             os.makedirs(DATA_DIR, exist_ok=True)
 
+            transcript = Transcript.from_data(transcript_data)
+            language = transcript_language(transcript)
+            if language != transcript_data.get("language"):
+                print(
+                    f"🌐 Transcript text is {LANGUAGE_NAMES[language]} "
+                    f"(backend reported: {transcript_data.get('language')})"
+                )
+                transcript_data["language"] = language
+
             base_name = os.path.splitext(filename)[0]
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            lang_suffix = "ge" if transcript_data["language"] == "ka" else "en"
-            output_filename = f"{base_name}_{lang_suffix}_{timestamp}.json"
+            lang_suffix = "ge" if language == "ka" else language
+            # The random part keeps same-named uploads finishing in the same second apart
+            output_filename = f"{base_name}_{lang_suffix}_{timestamp}_{uuid.uuid4().hex[:8]}.json"
 
             output_path = os.path.abspath(os.path.join(DATA_DIR, output_filename))
 
             print(f"💾 Saving transcript to: {output_path}")
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
+            # Checked before any paid processing: copies are linked to the original instead
+            match = register_transcript(output_filename, transcript.full_text)
+            if match:
+                transcript_data["duplicate_of"] = match[0]
+
+            try:
+                write_transcript(output_path, transcript_data)
+            except Exception:
+                get_near_duplicate_index().remove(output_filename)
+                raise
 
             if os.path.exists(output_path):
                 print(f"✅ Transcript saved successfully at: {output_path}")
@@ -126,10 +105,14 @@ class TranscriptionService:
                     "❌ Transcript file save failed: File not found after writing."
                 )
 
+            catalog_transcript(output_filename, transcript_data, output_path)
+
             is_translated = transcript_data.get("translated", False)
             language_code = transcript_data.get("language", "en")
 
-            if language_code == "en" or is_translated:
+            if match:
+                print(f"🔗 Skipping embedding for near-duplicate: {output_filename}")
+            elif language_code == "en" or is_translated:
                 print(f"🧠 Triggering embedding for: {output_filename}")
                 append_single_embedding(output_filename)
             else:
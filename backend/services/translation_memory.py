@@ -0,0 +1,188 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Callable, Dict, List, Optional
+
+from ..config import TRANSLATION_MEMORY_CONFIG
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a segment for lookup: Unicode NFC and collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def text_hash(text: str) -> str:
+    """Return the lookup hash of a segment's normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """
+    Persistent translation cache keyed by (source lang, target lang, engine, normalized text hash).
+
+    Entries live in a SQLite file so they survive restarts and are shared across processes.
+    The least recently used entries are evicted once `max_entries` is exceeded, and entries
+    unused for `max_age_days` are dropped on startup.
+
+    Methods:
+        - get(text, source, target, engine): Return a cached translation or None.
+        - get_many(texts, source, target, engine): Look up several segments at once.
+        - put(text, translation, source, target, engine): Store one translation.
+        - put_many(pairs, source, target, engine): Store several translations in one transaction.
+        - translate(text, source, target, engine, translate_fn): Cached wrapper around a translator call.
+        - stats(): Entry count, hits, misses and hit rate.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+    ):
+        self.path = path or TRANSLATION_MEMORY_CONFIG["path"]
+        self.max_entries = max_entries or TRANSLATION_MEMORY_CONFIG["max_entries"]
+        self.max_age_days = (
+            TRANSLATION_MEMORY_CONFIG["max_age_days"] if max_age_days is None else max_age_days
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS translations (
+                       source TEXT NOT NULL,
+                       target TEXT NOT NULL,
+                       engine TEXT NOT NULL,
+                       text_hash TEXT NOT NULL,
+                       translation TEXT NOT NULL,
+                       last_used REAL NOT NULL,
+                       PRIMARY KEY (source, target, engine, text_hash)
+                   )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)"
+            )
+            if self.max_age_days:
+                self._conn.execute(
+                    "DELETE FROM translations WHERE last_used < ?",
+                    (time.time() - self.max_age_days * 86400,),
+                )
+
+    def get(self, text: str, source: str, target: str, engine: str) -> Optional[str]:
+        """Return the cached translation of `text`, or None on a miss."""
+        return self.get_many([text], source, target, engine).get(0)
+
+    def get_many(
+        self, texts: List[str], source: str, target: str, engine: str
+    ) -> Dict[int, str]:
+        """Look up several segments; returns {index in `texts`: translation} for the hits."""
+        hashes = [text_hash(text) for text in texts]
+        found = {}
+        with self._lock, self._conn:
+            for start in range(0, len(hashes), 500):
+                chunk = list(set(hashes[start : start + 500]))
+                rows = self._conn.execute(
+                    f"""SELECT text_hash, translation FROM translations
+                        WHERE source = ? AND target = ? AND engine = ?
+                        AND text_hash IN ({",".join("?" * len(chunk))})""",
+                    (source, target, engine, *chunk),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    """UPDATE translations SET last_used = ?
+                       WHERE source = ? AND target = ? AND engine = ? AND text_hash = ?""",
+                    [(now, source, target, engine, h) for h in found],
+                )
+
+            results = {idx: found[h] for idx, h in enumerate(hashes) if h in found}
+            self.hits += len(results)
+            self.misses += len(texts) - len(results)
+        return results
+
+    def put(self, text: str, translation: str, source: str, target: str, engine: str):
+        """Store the translation of a single segment."""
+        self.put_many([(text, translation)], source, target, engine)
+
+    def put_many(self, pairs, source: str, target: str, engine: str):
+        """Store (text, translation) pairs and evict the least recently used overflow."""
+        now = time.time()
+        rows = [
+            (source, target, engine, text_hash(text), translation, now)
+            for text, translation in pairs
+            if normalize_text(text) and translation is not None
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO translations
+                   (source, target, engine, text_hash, translation, last_used)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    """DELETE FROM translations WHERE rowid IN (
+                           SELECT rowid FROM translations ORDER BY last_used ASC LIMIT ?
+                       )""",
+                    (count - self.max_entries,),
+                )
+
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        engine: str,
+        translate_fn: Callable[[str], Optional[str]],
+    ) -> Optional[str]:
+        """Return the cached translation of `text`, calling `translate_fn` and caching on a miss."""
+        cached = self.get(text, source, target, engine)
+        if cached is not None:
+            return cached
+
+        translation = translate_fn(text)
+        if translation:
+            self.put(text, translation, source, target, engine)
+        return translation
+
+    def stats(self) -> Dict[str, float]:
+        """Return entry count, hit/miss counters (since startup) and the hit rate."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_shared_memory: Optional[TranslationMemory] = None
+_shared_lock = threading.Lock()
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """Return the process-wide translation memory, or None if it is disabled in config."""
+    global _shared_memory
+    if not TRANSLATION_MEMORY_CONFIG["enabled"]:
+        return None
+    with _shared_lock:
+        if _shared_memory is None:
+            _shared_memory = TranslationMemory()
+        return _shared_memory
@@ -1,6 +1,69 @@
-from typing import Any, Dict
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
-from deep_translator import GoogleTranslator
+from ..config import TRANSLATION_BATCH_CONFIG
+from .api_clients import google_translator
+from .translation_memory import TranslationMemory, get_translation_memory
+
+TRANSLATION_ENGINE = "google"
+FAILED_PREFIX = "[Translation failed] "
+
+BATCH_SEPARATOR = "\n|||\n"
+_SEPARATOR_PATTERN = re.compile(r"\s*\|\s*\|\s*\|\s*")
+
+
+def pack_batches(texts: List[str], max_chars: int) -> List[List[int]]:
+    """
+    Group the indices of non-empty texts into batches whose joined length stays under `max_chars`.
+
+    A text that is longer than `max_chars` on its own is placed in a batch by itself.
+    """
+    batches = []
+    current: List[int] = []
+    current_len = 0
+    for idx, text in enumerate(texts):
+        if not text.strip():
+            continue
+        added_len = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and current_len + added_len > max_chars:
+            batches.append(current)
+            current, current_len = [], 0
+            added_len = len(text)
+        current.append(idx)
+        current_len += added_len
+    if current:
+        batches.append(current)
+    return batches
+
+
+def split_long_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split `text` into pieces of at most `max_chars` characters, preferring sentence and word boundaries.
+    """
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?。])\s+", text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
 
 
 class TranslationService:
@@ -9,25 +72,146 @@ class TranslationService:
 
     Methods:
         - translate_to_english(text, source_lang): Translate a single text segment to English.
+        - translate_texts(texts, source_lang): Translate many segments using size-limited, concurrent batches.
         - translate_transcript(transcript_data): Translate a full speaker-separated transcript to English,
           preserving structure.
 
     Uses:
-        - GoogleTranslator from deep_translator for machine translation.
+        - GoogleTranslator from deep_translator (through the shared rate-limited client layer) for machine translation.
     """
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_batch_chars: Optional[int] = None,
+        translator_factory: Optional[Callable[[str], Any]] = None,
+        memory: Optional[TranslationMemory] = None,
+    ):
+        self.max_workers = max_workers or TRANSLATION_BATCH_CONFIG["max_workers"]
+        self.max_batch_chars = max_batch_chars or TRANSLATION_BATCH_CONFIG["max_chars"]
+        self.translator_factory = translator_factory or (
+            lambda source_lang: google_translator(source=source_lang, target="en")
+        )
+        self.memory = memory or get_translation_memory()
+        self._local = threading.local()
+
+    def _translator(self, source_lang: str):
+        """Return a translator for `source_lang`, reused within the calling thread."""
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        if source_lang not in translators:
+            translators[source_lang] = self.translator_factory(source_lang)
+        return translators[source_lang]
 
     def translate_to_english(self, text: str, source_lang: str) -> str:
         """Translate a single text segment to English."""
         try:
             if source_lang == "en":
                 return text
-            return GoogleTranslator(source=source_lang, target="en").translate(text)
+            return self._translator(source_lang).translate(text)
         except Exception as e:
             raise Exception(f"Translation failed for text: '{text[:30]}...': {str(e)}")
 
+    def _translate_batch(self, texts: List[str], source_lang: str) -> List[str]:
+        """Translate a batch in one request and split it back on the boundary markers."""
+        if len(texts) == 1:
+            return [self.translate_to_english(texts[0], source_lang)]
+
+        translated = self.translate_to_english(BATCH_SEPARATOR.join(texts), source_lang)
+        parts = _SEPARATOR_PATTERN.split((translated or "").strip())
+        if len(parts) != len(texts):
+            raise ValueError(
+                f"Batch boundary mismatch: sent {len(texts)} segments, got {len(parts)}"
+            )
+        return parts
+
+    def _translate_batch_with_fallback(self, texts: List[str], source_lang: str) -> List[str]:
+        """Translate a batch, falling back to one request per segment if the batch fails."""
+        try:
+            return self._translate_batch(texts, source_lang)
+        except Exception as e:
+            if len(texts) > 1:
+                print(f"⚠️ Batch of {len(texts)} segments failed ({e}), retrying per segment")
+
+        results = []
+        for text in texts:
+            try:
+                results.append(self.translate_to_english(text, source_lang))
+            except Exception:
+                results.append(f"{FAILED_PREFIX}{text}")
+        return results
+
+    def translate_texts(self, texts: List[str], source_lang: str) -> List[str]:
+        """
+        Translate many text segments to English, returning results in the same order.
+
+        Segments already in the translation memory are served from it and repeated segments are
+        translated once. Segments longer than `max_batch_chars` are split at sentence boundaries,
+        and the rest are packed into batches of at most `max_batch_chars` characters,
+        joined with boundary markers, and the batches are translated concurrently on a bounded pool.
+        Empty segments are returned unchanged.
+        """
+        if source_lang == "en":
+            return list(texts)
+
+        results = list(texts)
+        pending = [idx for idx, text in enumerate(texts) if text.strip()]
+
+        if self.memory and pending:
+            cached = self.memory.get_many(
+                [texts[idx] for idx in pending], source_lang, "en", TRANSLATION_ENGINE
+            )
+            for pos, translation in cached.items():
+                results[pending[pos]] = translation
+            pending = [idx for pos, idx in enumerate(pending) if pos not in cached]
+
+        # Segments longer than one request are split and translated piece by piece
+        pieces_by_text = {
+            text: split_long_text(text, self.max_batch_chars)
+            for text in dict.fromkeys(texts[idx] for idx in pending)
+        }
+        unique_texts = list(
+            dict.fromkeys(piece for pieces in pieces_by_text.values() for piece in pieces)
+        )
+        batches = pack_batches(unique_texts, self.max_batch_chars)
+        if not batches:
+            return results
+
+        translations: Dict[str, str] = {}
+        workers = max(1, min(self.max_workers, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            translated_batches = executor.map(
+                lambda batch: self._translate_batch_with_fallback(
+                    [unique_texts[i] for i in batch], source_lang
+                ),
+                batches,
+            )
+            for batch, translated in zip(batches, translated_batches):
+                for i, text in zip(batch, translated):
+                    translations[unique_texts[i]] = text
+
+        for text, pieces in pieces_by_text.items():
+            if len(pieces) > 1:
+                translations[text] = " ".join(translations[piece] for piece in pieces)
+
+        for idx in pending:
+            results[idx] = translations[texts[idx]]
+
+        if self.memory:
+            self.memory.put_many(
+                [
+                    (text, translation)
+                    for text, translation in translations.items()
+                    if translation and FAILED_PREFIX not in translation
+                ],
+                source_lang,
+                "en",
+                TRANSLATION_ENGINE,
+            )
+
+        return results
+
     def translate_transcript(self, transcript_data: Dict[str, Any]) -> Dict[str, Any]:
         """Translate a full speaker-separated transcript to English."""
         lang = transcript_data.get("language", "en")
@@ -35,15 +219,13 @@ class TranslationService:
         if lang == "en":
             return {**transcript_data, "original_language": "en"}
 
-        translated_output = []
-        for entry in transcript_data.get("transcript", []):
-            try:
-                translated_text = self.translate_to_english(entry.get("text", ""), lang)
-                translated_output.append({**entry, "text": translated_text})
-            except Exception as e:
-                translated_output.append(
-                    {**entry, "text": f"[Translation failed] {entry.get('text', '')}"}
-                )
+        entries = transcript_data.get("transcript", [])
+        translated_texts = self.translate_texts(
+            [entry.get("text", "") for entry in entries], lang
+        )
+        translated_output = [
+            {**entry, "text": text} for entry, text in zip(entries, translated_texts)
+        ]
 
         return {
             **transcript_data,
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from backend.config import DATA_DIR, SUMMARY_CONFIG, SUMMARY_DIR
+from backend.file_utils import atomic_write_json
+from backend.transcript_model import TranscriptLike, as_transcript
+
+DATE_PATTERN = r"\d{4}-\d{2}-\d{2}"
+_ITEM_PREFIX = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+_OWNER_PATTERNS = [
+    re.compile(r"\b(?:owner|assigned to|responsible|assignee)\s*[:\-]?\s*\**\s*([A-Z][\w .']*?)(?=\s*[,;()\-–|]|\s+by\b|\s+due\b|\s*$)", re.IGNORECASE),
+    re.compile(r"\b(Speaker [A-Z0-9]+)\b"),
+    re.compile(r"\b([A-Z][a-z]+) (?:will|should|to)\b"),
+]
+
+
+def summary_key(utterances: TranscriptLike, original_language: str = "en") -> str:
+    """
+        Return the cache key of a transcript's summary: a hash of its utterance content,
+        language, summary model and prompt version. Filenames and timestamps do not affect it.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "prompt_version": SUMMARY_CONFIG["prompt_version"],
+                "model": SUMMARY_CONFIG["model"],
+                "language": original_language,
+                "utterances": list(as_transcript(utterances).speaker_text_pairs()),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+def _parse_action_item(line: str) -> Dict[str, Optional[str]]:
+    text = _ITEM_PREFIX.sub("", line).replace("**", "").strip()
+    dates = re.findall(DATE_PATTERN, text)
+
+    owner = None
+    for pattern in _OWNER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            owner = match.group(1).strip(" .")
+            break
+
+    task = re.split(r"\s*[-–|(]?\s*\b(?:owner|assigned to|responsible|assignee|due|date|deadline)\b", text, maxsplit=1, flags=re.IGNORECASE)[0]
+    return {
+        "task": task.strip(" -–:,.;") or text,
+        "owner": owner,
+        "date": dates[0] if dates else None,
+    }
+
+
+def parse_summary(summary_text: str) -> Dict[str, Any]:
+    """
+        Parse a free-text GPT summary once, at write time, into structured fields.
+
+        Returns:
+            Dict[str, Any]: 'overview' (text before the action items), 'action_items'
+                            (task/owner/date dicts), unique 'owners' and 'dates'.
+    """
+    lines = summary_text.splitlines()
+    overview_lines, action_items = [], []
+    in_actions = False
+
+    for line in lines:
+        stripped = line.strip().replace("**", "").replace("#", "").strip()
+        if re.match(r"^(?:\d+[.)]\s*)?(?:list of )?(?:clear )?action items?\b", stripped, re.IGNORECASE):
+            in_actions = True
+            continue
+        if in_actions and re.match(r"^[A-Z][\w ]+:$", stripped) and not _ITEM_PREFIX.match(line):
+            in_actions = False
+        if in_actions and _ITEM_PREFIX.match(line):
+            action_items.append(_parse_action_item(line))
+        elif not in_actions and not action_items:
+            overview_lines.append(line)
+
+    owners = list(dict.fromkeys(item["owner"] for item in action_items if item["owner"]))
+    dates = list(dict.fromkeys(re.findall(DATE_PATTERN, summary_text)))
+
+    return {
+        "overview": "\n".join(overview_lines).strip(),
+        "action_items": action_items,
+        "owners": owners,
+        "dates": dates,
+    }
+
+
+def _record_path(key: str) -> str:
+    return os.path.join(SUMMARY_DIR, f"{key}.json")
+
+
+def load_summary_record(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached summary record for `key`, or None."""
+    try:
+        with open(_record_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable summary record {key}: {e}")
+        return None
+
+
+def save_summary_record(
+    key: str, source_file: str, result: Dict[str, Any], original_language: str = "en"
+) -> Dict[str, Any]:
+    """
+        Build and atomically store the structured summary record for a summarization result.
+
+        Args:
+            key (str): Content hash from `summary_key`.
+            source_file (str): Transcript filename the summary was generated from.
+            result (Dict[str, Any]): Output of `summarize_utterances`.
+            original_language (str, optional): Language the meeting was held in.
+
+        Returns:
+            Dict[str, Any]: The stored record.
+    """
+    record = {
+        "key": key,
+        "source_file": source_file,
+        "original_language": original_language,
+        "prompt_version": SUMMARY_CONFIG["prompt_version"],
+        "model": SUMMARY_CONFIG["model"],
+        "summary": result["summary"],
+        **parse_summary(result["summary"]),
+        "calendar_events": [
+            {"title": title, "date": date} for title, date in result["calendar_events"]
+        ],
+        "mode": result.get("mode"),
+        "tokens": result.get("tokens", 0),
+        "created_at": datetime.now().isoformat(),
+    }
+    for event in record["calendar_events"]:
+        if event["date"] not in record["dates"]:
+            record["dates"].append(event["date"])
+
+    atomic_write_json(_record_path(key), record)
+    return record
+
+
+def legacy_summary_path(filename: str, data_dir: Optional[str] = None) -> str:
+    """Return where the pre-record cache stored a transcript's summary (`summary_<name>.txt`)."""
+    return os.path.join(data_dir or DATA_DIR, f"summary_{filename.replace('.json', '.txt')}")
+
+
+def _legacy_record(summary_text: str, source_file: str, original_language: str, key: str) -> Dict[str, Any]:
+    return {
+        "key": key,
+        "source_file": source_file,
+        "original_language": original_language,
+        "prompt_version": "legacy",
+        "model": None,
+        "summary": summary_text,
+        **parse_summary(summary_text),
+        "calendar_events": [],
+        "mode": "legacy",
+        "tokens": 0,
+        "created_at": datetime.now().isoformat(),
+    }
+
+
+def _read_legacy_summary(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable legacy summary {path}: {e}")
+        return None
+
+
+def _legacy_summary_is_current(legacy_path: str, transcript_path: str) -> bool:
+    # Legacy files carry no prompt version or content hash: trust them only under the prompt they
+    # were written with and while the transcript is no newer than the summary
+    if SUMMARY_CONFIG["prompt_version"] != SUMMARY_CONFIG["legacy_prompt_version"]:
+        return False
+    try:
+        return os.path.getmtime(transcript_path) <= os.path.getmtime(legacy_path)
+    except OSError:
+        return False
+
+
+def find_summary_record(
+    key: str,
+    filename: str,
+    original_language: str = "en",
+    data_dir: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+        Return the summary record for `key`, falling back to the transcript's legacy
+        `summary_<name>.txt` file so summaries written before the record cache are not regenerated.
+
+        The legacy file is only a fallback: it is ignored once `SUMMARY_CONFIG["prompt_version"]`
+        moves past `legacy_prompt_version` or the transcript is modified after it. An accepted file
+        is stored under `key` with prompt_version "legacy".
+
+        Args:
+            key (str): Content hash from `summary_key`.
+            filename (str): Transcript filename, used to locate the legacy summary.
+            original_language (str, optional): Language the meeting was held in.
+            data_dir (str, optional): Directory holding the transcript and its legacy summary; defaults to DATA_DIR.
+
+        Returns:
+            Optional[Dict[str, Any]]: The record, or None if neither cache has a current summary.
+    """
+    record = load_summary_record(key)
+    if record:
+        return record
+
+    legacy_path = legacy_summary_path(filename, data_dir)
+    if not _legacy_summary_is_current(legacy_path, os.path.join(data_dir or DATA_DIR, filename)):
+        return None
+    summary_text = _read_legacy_summary(legacy_path)
+    if not summary_text:
+        return None
+    record = _legacy_record(summary_text, filename, original_language, key)
+    atomic_write_json(_record_path(key), record)
+    print(f"📦 Migrated legacy summary for {filename}")
+    return record
+
+
+def latest_summary_record() -> Optional[Dict[str, Any]]:
+    """
+        Return the most recently written summary record, or None if there are none.
+        A current legacy `summary_<name>.txt` newer than every record is returned as a record.
+    """
+    candidates = []
+    if os.path.isdir(SUMMARY_DIR):
+        candidates += [
+            entry
+            for entry in os.scandir(SUMMARY_DIR)
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    if os.path.isdir(DATA_DIR):
+        candidates += [
+            entry
+            for entry in os.scandir(DATA_DIR)
+            if entry.name.startswith("summary_") and entry.name.endswith(".txt") and entry.is_file()
+        ]
+    if not candidates:
+        return None
+    latest = max(candidates, key=lambda entry: entry.stat().st_mtime)
+    if latest.name.endswith(".json"):
+        return load_summary_record(latest.name[: -len(".json")])
+
+    source_file = latest.name[len("summary_"): -len(".txt")] + ".json"
+    if not _legacy_summary_is_current(latest.path, os.path.join(DATA_DIR, source_file)):
+        return None
+    summary_text = _read_legacy_summary(latest.path)
+    if not summary_text:
+        return None
+    key = hashlib.sha256(summary_text.encode("utf-8")).hexdigest()
+    return _legacy_record(summary_text, source_file, "en", key)
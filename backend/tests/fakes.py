@@ -0,0 +1,33 @@
+"""Fakes shared by the summary tests."""
+
+import threading
+from types import SimpleNamespace
+
+
+class FakeChat:
+    """Stands in for create_chat_completion and records every request."""
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, model, messages, **kwargs):
+        with self.lock:
+            self.requests.append({"messages": messages, **kwargs})
+        function_call = None
+        if "functions" in kwargs:
+            function_call = SimpleNamespace(
+                name="add_calendar_event",
+                arguments='{"title": "Budget review", "date": "2025-03-01"}',
+            )
+        message = SimpleNamespace(content="Summary text.", function_call=function_call)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            usage=SimpleNamespace(total_tokens=100),
+        )
+
+
+def make_utterances(count, words=50):
+    return [
+        {"speaker": f"S{i % 3}", "text": " ".join(["word"] * words)} for i in range(count)
+    ]
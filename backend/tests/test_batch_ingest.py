@@ -0,0 +1,98 @@
+import io
+import os
+import threading
+import time
+
+import pytest
+
+from backend import app as app_module
+from backend import batch_ingest
+from backend.config import BATCH_INGEST_CONFIG
+from backend.services import transcription_service
+from backend.services.transcription_backends import LocalBackend
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """The Flask test client with a temporary upload dir and a pipeline that records what it ingests."""
+    monkeypatch.setattr(app_module, "TEMP_DIR", str(tmp_path / "temp"))
+    ingested = []
+    lock = threading.Lock()
+
+    def fake_process(file_path, filename, language):
+        with open(file_path, "rb") as f:
+            content = f.read()
+        with lock:
+            ingested.append((filename, content))
+        return {"filename": f"{filename}.json", "language": "en"}
+
+    monkeypatch.setattr(batch_ingest, "process_audio_file", fake_process)
+    client = app_module.app.test_client()
+    client.ingested = ingested
+    return client
+
+
+def wait_for_report(client, response, timeout=5.0):
+    assert response.status_code == 202, response.get_json()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = client.get(response.get_json()["status_url"]).get_json()
+        if status["state"] in ("done", "failed"):
+            return status
+        time.sleep(0.02)
+    raise AssertionError("Batch job did not finish")
+
+
+def test_batch_runs_as_a_job_and_keeps_same_named_uploads(client):
+    """Uploads sharing a filename are both ingested under their original name; the report is polled."""
+    response = client.post(
+        "/api/transcribe-batch",
+        data={"files": [(io.BytesIO(b"first"), "meeting.wav"), (io.BytesIO(b"second"), "meeting.wav")]},
+        content_type="multipart/form-data",
+    )
+
+    status = wait_for_report(client, response)
+
+    assert status["state"] == "done" and status["done"] == 2
+    assert sorted(client.ingested) == [("meeting.wav", b"first"), ("meeting.wav", b"second")]
+    assert [r["file"] for r in status["report"]["results"]] == ["meeting.wav", "meeting.wav"]
+    assert client.get("/api/transcribe-batch/unknown").status_code == 404
+
+
+def test_directory_ingest_is_confined_to_the_ingest_root(client, tmp_path, monkeypatch):
+    """Directories outside BATCH_INGEST_ROOT (or any, when it is unset) are refused."""
+    root, outside = tmp_path / "ingest", tmp_path / "private"
+    (root / "week1").mkdir(parents=True)
+    outside.mkdir()
+    (root / "week1" / "a.wav").write_bytes(b"a")
+    (outside / "b.wav").write_bytes(b"b")
+    os.symlink(outside / "b.wav", root / "week1" / "link.wav")
+
+    monkeypatch.setitem(BATCH_INGEST_CONFIG, "ingest_root", None)
+    assert client.post("/api/transcribe-batch", json={"directory": str(root)}).status_code == 403
+
+    monkeypatch.setitem(BATCH_INGEST_CONFIG, "ingest_root", str(root))
+    assert client.post("/api/transcribe-batch", json={"directory": str(outside)}).status_code == 403
+    assert client.post("/api/transcribe-batch", json={"directory": "../private"}).status_code == 403
+
+    status = wait_for_report(client, client.post("/api/transcribe-batch", json={"directory": "week1"}))
+    assert client.ingested == [("a.wav", b"a")], "Symlinks leading out of the root are skipped"
+    assert status["report"]["total"] == 1
+
+
+def test_same_named_transcripts_saved_in_one_second_are_kept_apart(tmp_path, monkeypatch):
+    """Transcripts of two uploads sharing a filename get distinct names even within the same second."""
+    monkeypatch.setattr(transcription_service, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(transcription_service, "register_transcript", lambda filename, text: None)
+    monkeypatch.setattr(transcription_service, "catalog_transcript", lambda *args: None)
+    monkeypatch.setattr(transcription_service, "append_single_embedding", lambda filename: None)
+    service = transcription_service.TranscriptionService(backend=LocalBackend(latency_seconds=0))
+
+    names = {
+        service.save_transcript(
+            {"transcript": [{"speaker": "A", "text": text}], "language": "en"}, "meeting.wav"
+        )
+        for text in ("We agreed on the budget.", "We agreed on the launch date.")
+    }
+
+    assert len(names) == 2 and len(os.listdir(tmp_path)) == 2
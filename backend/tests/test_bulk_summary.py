@@ -0,0 +1,95 @@
+import json
+
+import backend.generate_summary as generate_summary
+import backend.summary_store as summary_store
+from backend.bulk_summary import list_transcripts, run_bulk_summaries
+from backend.tests.fakes import FakeChat, make_utterances
+
+
+def write_transcripts(data_dir):
+    (data_dir / "a.json").write_text(json.dumps({"utterances": make_utterances(3)}))
+    (data_dir / "b.json").write_text(json.dumps(make_utterances(4)))
+    (data_dir / "empty.json").write_text(json.dumps({"utterances": []}))
+    (data_dir / "broken.json").write_text("{not json")
+
+
+def test_bulk_run_skips_up_to_date_summaries(monkeypatch, tmp_path):
+    """A second run only reports the summaries the first one stored as up to date."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write_transcripts(data_dir)
+    fake = FakeChat()
+    monkeypatch.setattr(generate_summary, "create_chat_completion", fake)
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+
+    filenames = list_transcripts(str(data_dir))
+    first = run_bulk_summaries(filenames, data_dir=str(data_dir), max_workers=2)
+
+    assert first["generated"] == 2
+    assert first["skipped"] == 1, "Transcripts without utterances are skipped"
+    assert first["failed"] == 1 and first["failures"][0]["file"] == "broken.json"
+    assert first["tokens_used"] == 200
+
+    second = run_bulk_summaries(filenames, data_dir=str(data_dir), max_workers=2)
+    assert second["generated"] == 0
+    assert second["up_to_date"] == 2
+    assert len(fake.requests) == 2, "Up-to-date summaries must not call the model again"
+
+
+def test_dry_run_lists_stale_transcripts_without_calling_the_model(monkeypatch, tmp_path):
+    """A dry run reports stale transcripts and leaves the summary store untouched."""
+    write_transcripts(tmp_path)
+    fake = FakeChat()
+    monkeypatch.setattr(generate_summary, "create_chat_completion", fake)
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+
+    report = run_bulk_summaries(list_transcripts(str(tmp_path)), data_dir=str(tmp_path), dry_run=True)
+
+    assert report["stale"] == ["a.json", "b.json"]
+    assert fake.requests == []
+
+
+def test_progress_goes_to_the_callback_not_stdout(monkeypatch, tmp_path, capsys):
+    """The library function prints nothing; each transcript is reported once to the callback."""
+    write_transcripts(tmp_path)
+    monkeypatch.setattr(generate_summary, "create_chat_completion", FakeChat())
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+    seen = []
+
+    run_bulk_summaries(
+        list_transcripts(str(tmp_path)),
+        data_dir=str(tmp_path),
+        on_progress=lambda done, total, status, filename: seen.append((filename, status, total)),
+    )
+
+    assert capsys.readouterr().out == ""
+    assert sorted(seen) == [
+        ("a.json", "generated", 4),
+        ("b.json", "generated", 4),
+        ("broken.json", "failed", 4),
+        ("empty.json", "skipped", 4),
+    ]
+
+
+def test_legacy_and_outdated_summaries_are_regenerated(monkeypatch, tmp_path):
+    """Legacy text summaries and records from an older prompt version do not count as up to date."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "a.json").write_text(json.dumps(make_utterances(3)))
+    (data_dir / "summary_a.txt").write_text("Meeting Summary:\nOld summary.")
+    fake = FakeChat()
+    monkeypatch.setattr(generate_summary, "create_chat_completion", fake)
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+    monkeypatch.setattr(summary_store, "DATA_DIR", str(data_dir))
+
+    generate_summary.ensure_summary("a.json", make_utterances(3))
+    assert fake.requests == [], "Interactive lookups may serve the current legacy summary"
+
+    first = run_bulk_summaries(["a.json"], data_dir=str(data_dir))
+    assert first["generated"] == 1 and len(fake.requests) == 1, "Bulk runs replace legacy summaries"
+
+    monkeypatch.setitem(summary_store.SUMMARY_CONFIG, "prompt_version", "test-next")
+    assert run_bulk_summaries(["a.json"], data_dir=str(data_dir), dry_run=True)["stale"] == ["a.json"]
+    second = run_bulk_summaries(["a.json"], data_dir=str(data_dir))
+    assert second["generated"] == 1 and len(fake.requests) == 2
+    assert run_bulk_summaries(["a.json"], data_dir=str(data_dir))["up_to_date"] == 1
@@ -0,0 +1,87 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.services.calendar_store import CalendarStore
+
+
+def test_duplicates_are_ignored_and_inserts_write_no_snapshot(tmp_path):
+    """(title, date) is unique, and inserts leave the JSON file alone."""
+    snapshot = tmp_path / "calendar_events.json"
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"), str(snapshot))
+
+    added = store.add_events([("Budget review", "2025-03-01"), ("Budget review", "2025-03-01")])
+    assert added == 1
+    assert store.add_events([("Budget review", "2025-03-01")]) == 0
+
+    assert [(e["title"], e["date"]) for e in store.all_events()] == [("Budget review", "2025-03-01")]
+    assert not snapshot.exists(), "The snapshot is built on request, not rewritten on insert"
+
+
+def test_concurrent_batches_do_not_lose_events(tmp_path):
+    """Events from summaries finishing at the same time all end up in the store."""
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"), str(tmp_path / "events.json"))
+    batches = [[(f"Meeting {i}-{j}", f"2025-04-{j + 1:02d}") for j in range(5)] for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(store.add_events, batches))
+
+    assert len(store.all_events()) == 40
+
+
+def test_date_range_query_is_paginated(tmp_path):
+    """Range queries return one ordered page plus the total number of matches."""
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"), snapshot_path="")
+    store.add_events([(f"Standup {day}", f"2025-05-{day:02d}") for day in range(1, 31)])
+    store.add_events([("Retro", "2025-06-02")])
+
+    page, total = store.query(start="2025-05-01", end="2025-05-31", limit=10, offset=10)
+
+    assert total == 30
+    assert [e["date"] for e in page] == [f"2025-05-{day:02d}" for day in range(11, 21)]
+
+
+def test_legacy_json_file_is_imported(tmp_path):
+    """An existing calendar_events.json seeds a new store, keeping extra fields."""
+    snapshot = tmp_path / "calendar_events.json"
+    snapshot.write_text(
+        json.dumps([{"id": 1, "title": "Weekly Team Meeting", "date": "2024-01-15", "time": "10:00 AM"}])
+    )
+
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"), str(snapshot))
+
+    [event] = store.all_events()
+    assert event["title"] == "Weekly Team Meeting"
+    assert event["time"] == "10:00 AM"
+
+
+def test_snapshot_endpoint_is_built_from_the_store(tmp_path, monkeypatch):
+    """/data/calendar_events.json reflects new events and revalidates by store version."""
+    from backend import app as app_module
+
+    store = CalendarStore(str(tmp_path / "calendar.sqlite3"), str(tmp_path / "calendar_events.json"))
+    monkeypatch.setattr(app_module, "get_calendar_store", lambda: store)
+    client = app_module.app.test_client()
+    store.add_events([("Budget review", "2025-03-01")])
+
+    first = client.get("/data/calendar_events.json")
+    assert [e["title"] for e in first.get_json()] == ["Budget review"]
+    assert client.get("/data/calendar_events.json", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    store.add_events([("Launch", "2025-03-02")])
+    second = client.get("/data/calendar_events.json", headers={"If-None-Match": first.headers["ETag"]})
+    assert [e["title"] for e in second.get_json()] == ["Budget review", "Launch"]
+
+
+def test_recreated_store_never_reuses_a_version(tmp_path):
+    """Same events in a recreated database still get a different version, so old ETags cannot match."""
+    path = tmp_path / "calendar.sqlite3"
+    store = CalendarStore(str(path), snapshot_path="")
+    store.add_events([("Budget review", "2025-03-01")])
+    first = store.version()[0]
+    assert CalendarStore(str(path), snapshot_path="").version()[0] == first
+
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / f"calendar.sqlite3{suffix}").unlink(missing_ok=True)
+    recreated = CalendarStore(str(path), snapshot_path="")
+    recreated.add_events([("Budget review", "2025-03-01")])
+    assert recreated.version()[0] != first
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import backend.generate_summary as generate_summary
+from backend.generate_summary import (
+    chunk_lines,
+    stream_summarize_utterances,
+    summarize_utterances,
+)
+from backend.tests.fakes import FakeChat, make_utterances
+
+
+def test_chunk_lines_cuts_between_utterances():
+    """Chunks stay under the token budget and never split an utterance."""
+    lines = [f"S: {'x' * 40}" for _ in range(10)]
+    chunks = chunk_lines(lines, max_tokens=30)
+
+    assert len(chunks) == 5
+    assert sum(chunk.count("\n") + 1 for chunk in chunks) == 10
+
+
+def test_short_transcript_uses_single_request(monkeypatch):
+    """Transcripts under the threshold are summarized in one request."""
+    fake = FakeChat()
+    monkeypatch.setattr(generate_summary, "create_chat_completion", fake)
+
+    result = summarize_utterances(make_utterances(5))
+
+    assert result["mode"] == "single"
+    assert len(fake.requests) == 1
+    assert result["calendar_events"] == [("Budget review", "2025-03-01")]
+
+
+def test_long_transcript_switches_to_map_reduce(monkeypatch):
+    """Long transcripts are chunked, mapped in parallel and reduced with function calling."""
+    fake = FakeChat()
+    monkeypatch.setattr(generate_summary, "create_chat_completion", fake)
+    monkeypatch.setitem(generate_summary.SUMMARY_CONFIG, "map_reduce_threshold_tokens", 500)
+    monkeypatch.setitem(generate_summary.SUMMARY_CONFIG, "chunk_tokens", 300)
+
+    result = summarize_utterances(make_utterances(40))
+
+    map_requests = [r for r in fake.requests if "functions" not in r]
+    reduce_requests = [r for r in fake.requests if "functions" in r]
+    assert result["mode"] == "map_reduce"
+    assert len(map_requests) > 1, "Chunks should be summarized separately"
+    assert len(reduce_requests) == 1, "Exactly one merge request should carry the functions"
+    assert result["calendar_events"] == [("Budget review", "2025-03-01")]
+    assert result["tokens"] == 100 * len(fake.requests)
+
+
+def test_stream_accumulates_tokens_and_function_call_deltas(monkeypatch):
+    """Content deltas are streamed; function-call fragments are joined before parsing."""
+
+    def delta(content=None, name=None, arguments=None):
+        function_call = (
+            SimpleNamespace(name=name, arguments=arguments) if name or arguments else None
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=content, function_call=function_call))]
+        )
+
+    chunks = [
+        delta(content="The team "),
+        delta(content="met."),
+        delta(name="add_calendar_event", arguments='{"title": "Bud'),
+        delta(arguments='get review", "date": "2025-03-01"}'),
+    ]
+    monkeypatch.setattr(
+        generate_summary, "create_chat_completion", lambda **kwargs: iter(chunks)
+    )
+
+    events = list(stream_summarize_utterances(make_utterances(3)))
+    tokens = [payload for kind, payload in events if kind == "token"]
+    kind, result = events[-1]
+
+    assert tokens == ["The team ", "met."]
+    assert kind == "result"
+    assert result["summary"] == "The team met."
+    assert result["calendar_events"] == [("Budget review", "2025-03-01")]
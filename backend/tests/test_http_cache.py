@@ -0,0 +1,56 @@
+import gzip
+import json
+
+from flask import Flask
+
+import backend.http_cache as http_cache
+from backend.http_cache import cached_response
+
+
+def make_app(state):
+    app = Flask(__name__)
+
+    @app.route("/items")
+    def items():
+        def build():
+            state["builds"] += 1
+            return {"items": ["meeting"] * 500}
+
+        return cached_response(state["version"], build, last_modified=1700000000.0)
+
+    return app
+
+
+def test_unchanged_version_is_answered_with_304(monkeypatch):
+    """A matching ETag or Last-Modified skips the body; a new version sends it again."""
+    monkeypatch.setattr(http_cache, "_body_cache", http_cache.OrderedDict())
+    state = {"version": "v1", "builds": 0}
+    client = make_app(state).test_client()
+
+    first = client.get("/items")
+    etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+
+    assert client.get("/items", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/items", headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert state["builds"] == 1, "Revalidation must not rebuild the body"
+
+    state["version"] = "v2"
+    changed = client.get("/items", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_large_bodies_are_gzip_encoded(monkeypatch):
+    """Clients accepting gzip get a compressed body that decodes to the same JSON."""
+    monkeypatch.setattr(http_cache, "_body_cache", http_cache.OrderedDict())
+    monkeypatch.setattr(http_cache, "brotli", None)
+    client = make_app({"version": "v1", "builds": 0}).test_client()
+
+    plain = client.get("/items")
+    compressed = client.get("/items", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.headers.get("Content-Encoding") is None
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert len(compressed.data) < len(plain.data)
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert "Accept-Encoding" in compressed.headers["Vary"]
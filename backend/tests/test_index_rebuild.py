@@ -0,0 +1,54 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.semantic import index_transcripts
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    """Seven English transcripts, a temporary index and an embedding client that can be made to fail."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(7):
+        (data_dir / f"m{i}.json").write_text(
+            json.dumps({"transcript": [{"speaker": "A", "text": f"meeting {i}"}], "language": "en"})
+        )
+    monkeypatch.setattr(index_transcripts, "DATA_FOLDER", data_dir)
+    monkeypatch.setattr(index_transcripts, "INDEX_FILE", tmp_path / "vector_index.json")
+    state = SimpleNamespace(requests=[], fail_on=None, build_dir=str(tmp_path / "build"), tmp_path=tmp_path)
+
+    def fake_embedding(input, model):
+        state.requests.append(list(input))
+        if len(state.requests) == state.fail_on:
+            raise RuntimeError("provider down")
+        return SimpleNamespace(data=[SimpleNamespace(index=i, embedding=[1.0]) for i in range(len(input))])
+
+    monkeypatch.setattr(index_transcripts, "create_embedding", fake_embedding)
+    return state
+
+
+def test_rebuild_streams_batches_into_the_index(corpus):
+    """Every transcript is embedded once, in batches, and the assembled index is valid JSON."""
+    assert index_transcripts.build_vector_index(batch_size=3, build_dir=corpus.build_dir)
+
+    assert [len(batch) for batch in corpus.requests] == [3, 3, 1]
+    index = json.loads((corpus.tmp_path / "vector_index.json").read_text())
+    assert [item["source"] for item in index] == [f"m{i}.json" for i in range(7)]
+    assert not (corpus.tmp_path / "build").exists(), "The build directory is removed after publishing"
+
+
+def test_interrupted_rebuild_resumes_from_the_checkpoint(corpus):
+    """A failure keeps the published index untouched and a re-run embeds only what is left."""
+    corpus.fail_on = 2
+    assert not index_transcripts.build_vector_index(batch_size=3, build_dir=corpus.build_dir)
+    assert not (corpus.tmp_path / "vector_index.json").exists()
+
+    corpus.fail_on = None
+    corpus.requests.clear()
+    assert index_transcripts.build_vector_index(batch_size=3, build_dir=corpus.build_dir)
+
+    assert corpus.requests == [["meeting 3", "meeting 4", "meeting 5"], ["meeting 6"]]
+    index = json.loads((corpus.tmp_path / "vector_index.json").read_text())
+    assert len(index) == 7 and len({item["source"] for item in index}) == 7
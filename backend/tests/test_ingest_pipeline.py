@@ -0,0 +1,78 @@
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from backend import transcribe
+from backend.services import transcription_service
+
+SLOVAK = "Musíme prejsť rozpočet a dohodnúť sa na termíne vydania pred koncom mesiaca."
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """The ingest pipeline over a temporary data directory, with fake providers and post-processing."""
+    data_dir, temp_dir = tmp_path / "data", tmp_path / "temp"
+    data_dir.mkdir()
+    monkeypatch.setattr(transcribe, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(transcribe, "TEMP_DIR", str(temp_dir))
+    monkeypatch.setattr(transcription_service, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(transcription_service, "catalog_transcript", lambda *args, **kwargs: None)
+    monkeypatch.setattr(transcription_service, "register_transcript", lambda filename, text: None)
+    calls = SimpleNamespace(translated=[], embedded=[], summaries=[])
+    monkeypatch.setattr(transcription_service, "append_single_embedding", calls.embedded.append)
+    monkeypatch.setattr(
+        transcribe.requests,
+        "post",
+        lambda url, json: calls.summaries.append(json["filename"]) or SimpleNamespace(raise_for_status=lambda: None),
+    )
+    monkeypatch.setattr(
+        transcribe.transcription_service,
+        "transcribe",
+        lambda file_path, language: {
+            "transcript": [{"speaker": "A", "text": SLOVAK, "start": 0, "end": 4000}],
+            "language": language,
+            "duration": 4.0,
+        },
+    )
+
+    def fake_translate(data):
+        calls.translated.append(data["language"])
+        return {
+            **data,
+            "transcript": [{**entry, "text": "We need to go through the budget."} for entry in data["transcript"]],
+            "original_language": data["language"],
+            "language": "en",
+        }
+
+    monkeypatch.setattr(transcribe.translation_service, "translate_transcript", fake_translate)
+    return SimpleNamespace(data_dir=data_dir, calls=calls)
+
+
+def test_slovak_transcript_is_translated_once_and_named(pipeline):
+    """A Slovak transcript is stored, translated and summarized in English, and the result names both files."""
+    result = transcribe.process_audio_file("meeting.wav", "meeting.wav", "auto")
+
+    assert result["filename"] == result["original_filename"], "Every branch reports the stored filename"
+    assert "_sk_" in result["filename"] and "_en_" in result["translated_filename"]
+    assert os.path.exists(pipeline.data_dir / result["filename"])
+    assert pipeline.calls.translated == ["sk"], "Detected language routes to translation exactly once"
+    assert pipeline.calls.summaries == [result["translated_filename"]]
+    assert pipeline.calls.embedded == [result["translated_filename"]]
+
+
+def test_transcribe_endpoint_accepts_slovak_uploads(pipeline):
+    """/api/transcribe returns the pipeline result for a Slovak upload without translating it again."""
+    from backend.app import app
+
+    response = app.test_client().post(
+        "/api/transcribe",
+        data={"file": (io.BytesIO(b"RIFF"), "meeting.wav"), "language": "auto"},
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 200, response.get_json()
+    data = response.get_json()
+    assert data["filename"] and data["translated_filename"]
+    assert pipeline.calls.translated == ["sk"]
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from backend.services.language_id import detect_language, transcript_language
+from backend.services.transcript_catalog import TranscriptCatalog, translated_name
+from backend.transcript_model import Transcript
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Who presented the quarterly sales numbers?", "en"),
+        ("Let's schedule a follow-up call with the vendor next Tuesday.", "en"),
+        ("Kto predstavil štvrťročné výsledky predaja?", "sk"),
+        ("Naplánujme ďalší hovor s dodávateľom na budúci utorok.", "sk"),
+        ("Kdo je predstavil četrtletne rezultate prodaje?", "sl"),
+        ("Dogovorimo se za nadaljnji klic z dobaviteljem naslednji torek.", "sl"),
+        ("Kurš prezentēja ceturkšņa pārdošanas rezultātus?", "lv"),
+        ("Ieplānosim nākamo zvanu ar piegādātāju nākamajā otrdienā.", "lv"),
+        ("ვინ წარადგინა კვარტალური გაყიდვების შედეგები?", "ka"),
+    ],
+)
+def test_detects_supported_languages(text, expected):
+    """Queries in each supported language are identified offline."""
+    assert detect_language(text) == expected, f"Expected {expected} for: {text}"
+
+
+def test_short_or_ambiguous_text_falls_back_to_default():
+    """Text with too few letters to call returns the caller's default."""
+    assert detect_language("ok", default="en") == "en"
+    assert detect_language("2024 Q3", default="en") == "en"
+    assert detect_language("", default=None) is None
+
+
+def test_transcript_language_prefers_text_over_a_wrong_report():
+    """A Georgian transcript reported as English is corrected; a missing report is filled in."""
+    georgian = Transcript.from_data({"transcript": [{"text": "გამარჯობა, დავიწყოთ შეხვედრა"}], "language": "en"})
+    slovak = Transcript.from_data([{"text": "Musíme prejsť rozpočet a dohodnúť sa na termíne vydania."}])
+
+    assert transcript_language(georgian) == "ka"
+    assert transcript_language(slovak) == "sk"
+
+
+def test_transcript_language_keeps_translations_and_reported_languages():
+    """Translations keep their stored language; a supported report in the same script is trusted."""
+    translation = Transcript.from_data(
+        {"transcript": [{"text": "გამარჯობა"}], "language": "en", "original_language": "ka"}
+    )
+    reported = Transcript.from_data({"transcript": [{"text": "Kdo je predstavil rezultate?"}], "language": "sk"})
+
+    assert transcript_language(translation) == "en"
+    assert transcript_language(reported) == "sk"
+
+
+def test_catalog_classifies_transcripts_by_content(tmp_path):
+    """A Georgian transcript is listed as Georgian even without the `_ge_` filename convention."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    catalog = TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir))
+    data = {"transcript": [{"speaker": "A", "text": "დღეს ბიუჯეტს განვიხილავთ"}]}
+    (data_dir / "meeting.json").write_text(json.dumps(data))
+
+    catalog.record("meeting.json", data, str(data_dir / "meeting.json"))
+
+    rows = catalog.query(language="Georgian")["transcripts"]
+    assert [row["filename"] for row in rows] == ["meeting.json"]
+    assert translated_name("meeting.json") == "meeting_en.json", "Translations never overwrite the source"
+    assert translated_name("m_ge_1.json") == "m_en_1.json"
+
+
+def test_translate_endpoint_reads_catalogued_files_from_the_data_dir(monkeypatch):
+    """/api/translate-georgian translates catalogued transcripts where the catalog found them."""
+    from backend import app as app_module
+
+    calls = []
+    monkeypatch.setattr(app_module, "georgian_transcripts", lambda: ["m_ge_1.json"])
+    monkeypatch.setattr(
+        app_module,
+        "translate_georgian_batch",
+        lambda data_dir, filenames: calls.append((data_dir, filenames)) or iter([{"progress": 100}]),
+    )
+
+    response = app_module.app.test_client().post("/api/translate-georgian")
+
+    assert response.status_code == 200 and response.get_data(as_text=True)
+    assert calls == [(app_module.DATA_DIR, ["m_ge_1.json"])]
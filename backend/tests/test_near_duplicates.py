@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from backend.semantic.search_query import distinct_matches
+from backend.services.near_duplicates import NearDuplicateIndex, minhash, similarity
+
+MEETING = (
+    "Good morning everyone, let's start with the quarterly budget review. Marketing spent slightly "
+    "more than planned on the spring campaign, so we need to decide whether to cut the summer events "
+    "or move money from the hiring budget. Nino will prepare two scenarios by Friday and we will vote "
+    "on them next week. Any questions before we move on to the product roadmap?"
+)
+# The same meeting re-uploaded: a re-encode changed a couple of words at the start
+MEETING_COPY = MEETING.replace("Good morning everyone", "Morning everybody")
+OTHER = (
+    "The design team presented three options for the new onboarding flow. Users struggled with the "
+    "second step in testing, so the team will simplify the form and run another round of interviews "
+    "with five customers before the next sprint planning session on Tuesday afternoon."
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    return NearDuplicateIndex(str(tmp_path / "duplicates.sqlite3"), str(data_dir))
+
+
+def test_signatures_estimate_similarity():
+    """Near-copies score high, unrelated meetings low, and identical text scores 1."""
+    assert similarity(minhash(MEETING), minhash(MEETING)) == 1.0
+    assert similarity(minhash(MEETING), minhash(MEETING_COPY)) >= 0.8
+    assert similarity(minhash(MEETING), minhash(OTHER)) < 0.2
+    assert minhash("") is None, "Empty transcripts have no signature"
+
+
+def test_near_copy_is_linked_to_the_original(index):
+    """A re-upload resolves to the first transcript; a different meeting stays independent."""
+    assert index.register("a.json", MEETING) is None
+    assert index.register("b.json", OTHER) is None
+    match = index.register("a_copy.json", MEETING_COPY)
+
+    assert match and match[0] == "a.json", "The copy should be linked to the original"
+    assert index.canonical("a_copy.json") == "a.json"
+    assert index.canonical("b.json") == "b.json"
+    assert index.duplicates() == {"a_copy.json": "a.json"}
+
+
+def test_register_is_idempotent_and_rematches_changed_content(index):
+    """Registering unchanged content again keeps the link; new content is matched afresh."""
+    index.register("a.json", MEETING)
+    first = index.register("a_copy.json", MEETING_COPY)
+    assert index.register("a_copy.json", MEETING_COPY) == first
+    assert index.register("a_copy.json", OTHER) is None, "Rewritten content is no longer a copy"
+    assert index.canonical("a_copy.json") == "a_copy.json"
+
+
+def test_removing_an_original_promotes_its_oldest_copy(index):
+    """Later copies are relinked to the promoted transcript."""
+    index.register("a.json", MEETING)
+    index.register("copy1.json", MEETING_COPY)
+    index.register("copy2.json", MEETING)
+
+    index.remove("a.json")
+
+    assert index.canonical("copy1.json") == "copy1.json"
+    assert index.canonical("copy2.json") == "copy1.json"
+    assert index.register("copy3.json", MEETING)[0] == "copy1.json"
+
+
+def test_index_is_built_from_existing_transcripts_oldest_first(tmp_path):
+    """Opening an empty index scans the data directory; the older file is the original."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name, text, mtime in [("new.json", MEETING_COPY, 200), ("old.json", MEETING, 100)]:
+        path = data_dir / name
+        path.write_text(json.dumps({"transcript": [{"speaker": "A", "text": text}], "language": "en"}))
+        os.utime(path, (mtime, mtime))
+
+    index = NearDuplicateIndex(str(tmp_path / "duplicates.sqlite3"), str(data_dir))
+
+    assert index.duplicates() == {"new.json": "old.json"}
+
+
+def test_search_results_skip_near_duplicates(index):
+    """Copies of a meeting already in the results give their slot to the next distinct meeting."""
+    index.register("a.json", MEETING)
+    index.register("b.json", OTHER)
+    scored = [
+        (MEETING, "a.json", 0.9),
+        (MEETING_COPY, "unlinked_copy.json", 0.89),
+        (OTHER, "b.json", 0.5),
+    ]
+
+    picked = distinct_matches(scored, 2, index)
+
+    assert [source for _, source, _ in picked] == ["a.json", "b.json"]
@@ -0,0 +1,48 @@
+from backend.services.rate_limiter import ModelRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manual clock; sleeping advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_queues_instead_of_failing():
+    """Requests beyond the burst capacity wait for refill rather than raising."""
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=2, refill_per_second=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    waited = bucket.acquire()
+
+    assert waited > 0, "Third request should be delayed"
+    assert abs(clock.now - 1.0) < 1e-6, "Delay should match the refill rate"
+
+
+def test_oversized_request_is_clamped_to_capacity():
+    """A request larger than the bucket still completes once the bucket is full."""
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=10, refill_per_second=5, clock=clock, sleep=clock.sleep)
+    bucket.acquire(10)
+
+    bucket.acquire(50)
+    assert abs(clock.now - 2.0) < 1e-6
+
+
+def test_model_limiter_tracks_usage():
+    """The per-model limiter records requests and estimated tokens."""
+    limiter = ModelRateLimiter("test-model", rpm=600, tpm=100000)
+    limiter.acquire(120)
+    limiter.acquire(80)
+
+    stats = limiter.stats()
+    assert stats["requests"] == 2
+    assert stats["estimated_tokens"] == 200
@@ -0,0 +1,99 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.semantic import index_transcripts, search_query
+from backend.semantic.reembed import ReembedJob
+
+NEW_MODEL = "text-embedding-3-small"
+
+
+@pytest.fixture
+def legacy_index(tmp_path, monkeypatch):
+    """A pre-generation index of five records and an embedding client that tags vectors with their model."""
+    monkeypatch.setattr(index_transcripts, "INDEX_FILE", tmp_path / "vector_index.json")
+    records = [{"embedding": [0.0], "text": f"meeting {i}", "source": f"m{i}.json"} for i in range(5)]
+    (tmp_path / "vector_index.json").write_text(json.dumps(records))
+    state = SimpleNamespace(calls=[], on_call=None, tmp_path=tmp_path)
+
+    def fake_embedding(input, model):
+        texts = [input] if isinstance(input, str) else list(input)
+        state.calls.append((model, texts))
+        if state.on_call:
+            state.on_call(len(state.calls))
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=[float(len(model))]) for i in range(len(texts))]
+        )
+
+    monkeypatch.setattr(index_transcripts, "create_embedding", fake_embedding)
+    monkeypatch.setattr(search_query, "create_embedding", fake_embedding)
+    return state
+
+
+def make_job(tmp_path, **kwargs):
+    return ReembedJob(NEW_MODEL, batch_size=2, requests_per_minute=0, build_dir=str(tmp_path / "build"), **kwargs)
+
+
+def test_job_builds_a_new_generation_and_switches_queries(legacy_index):
+    """Search reads the old generation until the switch, then queries use the new model."""
+    assert index_transcripts.active_generation()["model"] == index_transcripts.LEGACY_EMBEDDING_MODEL
+
+    assert make_job(legacy_index.tmp_path).run()
+
+    active = index_transcripts.active_generation()
+    assert active["model"] == NEW_MODEL and active["file"] == index_transcripts.generation_file(NEW_MODEL)
+    assert {tuple(item["embedding"]) for item in index_transcripts.load_index()} == {(float(len(NEW_MODEL)),)}
+    assert len(json.loads((legacy_index.tmp_path / "vector_index.json").read_text())) == 5, "Old generation is kept"
+
+    search_query.get_query_embedding("what was decided?")
+    assert legacy_index.calls[-1][0] == NEW_MODEL, "Queries must be embedded with the active generation's model"
+
+
+def test_records_indexed_during_the_job_are_caught_up(legacy_index):
+    """A transcript added to the old generation mid-job is in the new one after the switch."""
+
+    def add_record(call):
+        if call == 1:
+            index_transcripts.update_index(
+                [{"embedding": [0.0], "text": "late meeting", "source": "late.json"}],
+                model=index_transcripts.LEGACY_EMBEDDING_MODEL,
+            )
+
+    legacy_index.on_call = add_record
+    assert make_job(legacy_index.tmp_path).run()
+
+    sources = {item["source"] for item in index_transcripts.load_index()}
+    assert sources == {f"m{i}.json" for i in range(5)} | {"late.json"}
+
+
+def test_writes_embedded_with_the_old_model_after_the_switch_are_re_embedded(legacy_index):
+    """A writer that embedded before the switch cannot put old-model vectors into the new generation."""
+    assert make_job(legacy_index.tmp_path).run()
+
+    index_transcripts.update_index(
+        [{"embedding": [0.0], "text": "racing writer", "source": "race.json"}],
+        model=index_transcripts.LEGACY_EMBEDDING_MODEL,
+    )
+
+    record = next(item for item in index_transcripts.load_index() if item["source"] == "race.json")
+    assert record["embedding"] == [float(len(NEW_MODEL))]
+
+
+def test_status_reports_progress_and_eta(legacy_index):
+    """Progress, rate and ETA are reported while the job runs."""
+    now = [0.0]
+    job = make_job(legacy_index.tmp_path, clock=lambda: now[0])
+    snapshots = []
+
+    def tick(call):
+        now[0] += 30
+        snapshots.append(job.status())
+
+    legacy_index.on_call = tick
+    job.run()
+
+    mid = snapshots[1]
+    assert mid["state"] == "running" and mid["done"] == 2 and mid["total"] == 5
+    assert mid["rate_per_minute"] == 2.0 and mid["eta_seconds"] == 90
+    assert job.status()["state"] == "done" and job.status()["percent"] == 100.0
@@ -0,0 +1,156 @@
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.resilience import (
+    DeadlineExceeded,
+    ProviderUnavailable,
+    ResilientProvider,
+    is_provider_failure,
+)
+
+
+class FakeProviderServer:
+    """Local HTTP server whose responses are delayed or failed on demand."""
+
+    def __init__(self):
+        self.delays = []  # per-request delays in seconds; the last one repeats
+        self.status = 200
+        self.requests = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server.lock:
+                    index = server.requests
+                    server.requests += 1
+                if server.delays:
+                    time.sleep(server.delays[min(index, len(server.delays) - 1)])
+                self.send_response(server.status)
+                self.end_headers()
+                self.wfile.write(b'{"ok": true}')
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1/embeddings"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def get(self):
+        with urllib.request.urlopen(self.url, timeout=5) as response:
+            return response.read()
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeProviderServer()
+    yield server
+    server.httpd.shutdown()
+
+
+def test_deadline_cuts_off_slow_calls(fake_server):
+    """A call slower than its deadline raises instead of blocking the request."""
+    fake_server.delays = [1.0]
+    provider = ResilientProvider("fake", deadline_seconds=0.2)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        provider.call(fake_server.get)
+
+    assert time.monotonic() - started < 0.8, "Caller should be released at the deadline"
+    assert provider.stats.snapshot()["timeouts"] == 1
+
+
+def test_hedged_call_returns_faster_attempt(fake_server):
+    """For idempotent calls a hedge attempt hides a slow first response."""
+    fake_server.delays = [1.5, 0.0]
+    provider = ResilientProvider("fake", deadline_seconds=1.0, hedge_after_seconds=0.1)
+
+    assert provider.call(fake_server.get, idempotent=True) == b'{"ok": true}'
+    assert provider.stats.snapshot()["hedges"] == 1
+
+
+def test_circuit_breaker_fails_fast_then_recovers(fake_server):
+    """Consecutive failures open the breaker; after the reset timeout a trial call closes it."""
+    fake_server.status = 500
+    provider = ResilientProvider(
+        "fake", deadline_seconds=1.0, failure_threshold=2, reset_timeout_seconds=0.2
+    )
+    for _ in range(2):
+        with pytest.raises(Exception):
+            provider.call(fake_server.get)
+
+    requests_before = fake_server.requests
+    with pytest.raises(ProviderUnavailable):
+        provider.call(fake_server.get)
+    assert fake_server.requests == requests_before, "Open breaker must not reach the provider"
+
+    fake_server.status = 200
+    time.sleep(0.25)
+    provider.call(fake_server.get)
+    assert provider.breaker.state == "closed"
+
+
+def test_client_errors_do_not_trip_the_breaker(fake_server):
+    """4xx answers are re-raised without counting as failures; 429 and 5xx do count."""
+    provider = ResilientProvider("fake", deadline_seconds=1.0, failure_threshold=2)
+
+    fake_server.status = 400
+    for _ in range(3):
+        with pytest.raises(urllib.error.HTTPError):
+            provider.call(fake_server.get)
+    assert provider.breaker.state == "closed" and provider.breaker.failures == 0
+    assert provider.stats.snapshot()["errors"] == 3, "Client errors are still reported"
+
+    fake_server.status = 429
+    for _ in range(2):
+        with pytest.raises(urllib.error.HTTPError):
+            provider.call(fake_server.get)
+    assert provider.breaker.state == "open", "Rate limiting counts as a provider failure"
+
+
+def test_is_provider_failure_classification():
+    """Timeouts, connection errors, 429 and 5xx are provider failures; other errors are not."""
+    class StatusError(Exception):
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    class APIConnectionError(Exception):
+        pass
+
+    response_error = Exception("wrapped")
+    response_error.response = SimpleNamespace(status_code=503)
+
+    assert is_provider_failure(DeadlineExceeded())
+    assert is_provider_failure(TimeoutError())
+    assert is_provider_failure(ConnectionResetError())
+    assert is_provider_failure(APIConnectionError())
+    assert is_provider_failure(StatusError(429)) and is_provider_failure(StatusError(502))
+    assert is_provider_failure(response_error)
+    assert not is_provider_failure(StatusError(401))
+    assert not is_provider_failure(ValueError("bad JSON"))
+
+
+def test_local_queueing_does_not_count_against_the_deadline(fake_server):
+    """Waiting in `acquire` is outside the deadline and hedge, and happens once per call."""
+    provider = ResilientProvider("fake", deadline_seconds=0.2, hedge_after_seconds=0.05, failure_threshold=1)
+    acquired = []
+
+    def slow_acquire():
+        acquired.append(1)
+        time.sleep(0.4)
+
+    for idempotent in (False, True):
+        assert provider.call(fake_server.get, idempotent=idempotent, acquire=slow_acquire) == b'{"ok": true}'
+
+    assert len(acquired) == 2, "A hedge must not take limiter tokens again"
+    assert provider.breaker.state == "closed"
+    assert provider.stats.snapshot()["timeouts"] == 0
+    assert fake_server.requests == 2
@@ -0,0 +1,44 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """Callers arriving while the leader runs get the leader's result."""
+    flight = SingleFlight()
+    executions = []
+    started = threading.Event()
+
+    def expensive():
+        executions.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "summary"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "transcript-hash", expensive)
+        started.wait()
+        followers = [executor.submit(flight.do, "transcript-hash", expensive) for _ in range(3)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(executions) == 1, "The work should run once"
+    assert results[0] == ("summary", False)
+    assert all(result == ("summary", True) for result in results[1:])
+
+
+def test_errors_reach_followers_and_release_the_key():
+    """A failed flight raises for everyone and the next call starts fresh."""
+    flight = SingleFlight()
+    call, leader = flight.begin("key")
+    follower_call, follower_is_leader = flight.begin("key")
+
+    assert leader and not follower_is_leader and follower_call is call
+    flight.finish("key", call, error=ValueError("GPT failed"))
+
+    with pytest.raises(ValueError):
+        follower_call.wait(timeout=1)
+    assert flight.do("key", lambda: 42) == (42, False)
@@ -0,0 +1,118 @@
+import os
+import time
+
+import backend.summary_store as summary_store
+from backend.summary_store import (
+    find_summary_record,
+    latest_summary_record,
+    load_summary_record,
+    parse_summary,
+    save_summary_record,
+    summary_key,
+)
+
+SUMMARY_TEXT = """Meeting Summary:
+The team reviewed the Q3 budget and agreed to hire two developers.
+
+Action Items:
+1. Finalize the budget proposal - Owner: Speaker A - Date: 2024-07-15
+2. Post job ads for developers (Assigned to: Maria, due 2024-07-20)
+"""
+
+
+def test_summary_key_depends_on_content_and_prompt_version(monkeypatch):
+    """The key ignores filenames but changes with content or prompt version."""
+    utterances = [{"speaker": "A", "text": "Hello", "start": 0, "end": 10}]
+    moved = [{"speaker": "A", "text": "Hello", "start": 500, "end": 510}]
+    edited = [{"speaker": "A", "text": "Hello there"}]
+
+    key = summary_key(utterances)
+    assert key == summary_key(moved), "Timestamps should not invalidate the summary"
+    assert key != summary_key(edited), "Changed content must invalidate the summary"
+
+    monkeypatch.setitem(summary_store.SUMMARY_CONFIG, "prompt_version", "test-next")
+    assert key != summary_key(utterances), "A new prompt version must invalidate the summary"
+
+
+def test_parse_summary_extracts_structured_fields():
+    """Action items, owners and dates are parsed once at write time."""
+    parsed = parse_summary(SUMMARY_TEXT)
+
+    assert parsed["action_items"] == [
+        {"task": "Finalize the budget proposal", "owner": "Speaker A", "date": "2024-07-15"},
+        {"task": "Post job ads for developers", "owner": "Maria", "date": "2024-07-20"},
+    ]
+    assert parsed["owners"] == ["Speaker A", "Maria"]
+    assert parsed["overview"].endswith("hire two developers.")
+
+
+def test_record_round_trip(tmp_path, monkeypatch):
+    """Saved records are found again by key."""
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path))
+    result = {
+        "summary": SUMMARY_TEXT,
+        "calendar_events": [("Budget review", "2024-08-01")],
+        "tokens": 321,
+        "mode": "single",
+    }
+    save_summary_record("abc123", "meeting_en_1.json", result)
+
+    record = load_summary_record("abc123")
+    assert record["source_file"] == "meeting_en_1.json"
+    assert "2024-08-01" in record["dates"], "Calendar event dates are included"
+    assert load_summary_record("missing") is None
+
+
+def write_legacy_summary(tmp_path, transcript_age=60):
+    """A transcript and its legacy text summary, the transcript `transcript_age` seconds older."""
+    transcript = tmp_path / "meeting_en_1.json"
+    legacy = tmp_path / "summary_meeting_en_1.txt"
+    transcript.write_text("[]", encoding="utf-8")
+    legacy.write_text(SUMMARY_TEXT, encoding="utf-8")
+    now = time.time()
+    os.utime(transcript, (now - transcript_age, now - transcript_age))
+    os.utime(legacy, (now, now))
+
+
+def test_legacy_text_summaries_are_migrated_not_regenerated(tmp_path, monkeypatch):
+    """A current `summary_<name>.txt` from the old cache is served and stored under the content key."""
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+    monkeypatch.setattr(summary_store, "DATA_DIR", str(tmp_path))
+    write_legacy_summary(tmp_path)
+
+    record = find_summary_record("key1", "meeting_en_1.json")
+    assert record["summary"] == SUMMARY_TEXT and record["owners"] == ["Speaker A", "Maria"]
+    assert record["prompt_version"] == "legacy"
+    assert load_summary_record("key1") == record, "Migrated summaries are found by key afterwards"
+    assert find_summary_record("key2", "other.json") is None
+
+
+def test_legacy_summaries_are_stale_after_prompt_or_transcript_changes(tmp_path, monkeypatch):
+    """A legacy summary is ignored after a prompt version bump or once the transcript is newer."""
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+    monkeypatch.setattr(summary_store, "DATA_DIR", str(tmp_path))
+    write_legacy_summary(tmp_path)
+
+    monkeypatch.setitem(summary_store.SUMMARY_CONFIG, "prompt_version", "test-next")
+    assert find_summary_record("key1", "meeting_en_1.json") is None
+    assert latest_summary_record() is None
+    monkeypatch.setitem(
+        summary_store.SUMMARY_CONFIG, "prompt_version", summary_store.SUMMARY_CONFIG["legacy_prompt_version"]
+    )
+
+    write_legacy_summary(tmp_path, transcript_age=-60)
+    assert find_summary_record("key1", "meeting_en_1.json") is None
+    assert load_summary_record("key1") is None, "Stale legacy summaries are not migrated"
+
+
+def test_latest_summary_record_falls_back_to_legacy_files(tmp_path, monkeypatch):
+    """With no JSON records, the newest current legacy text summary feeds the visual summary."""
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", str(tmp_path / "summaries"))
+    monkeypatch.setattr(summary_store, "DATA_DIR", str(tmp_path))
+    assert latest_summary_record() is None
+
+    write_legacy_summary(tmp_path)
+
+    record = latest_summary_record()
+    assert record["source_file"] == "meeting_en_1.json"
+    assert record["summary"] == SUMMARY_TEXT and record["key"]
@@ -0,0 +1,96 @@
+import json
+
+from backend.services.transcript_catalog import TranscriptCatalog
+
+
+def write(data_dir, filename, data):
+    path = data_dir / filename
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def make_catalog(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(exist_ok=True)
+    return TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir)), data_dir
+
+
+def test_record_links_translations_and_computes_stats(tmp_path):
+    """Stats come from the data being written and an English file marks its Georgian source."""
+    catalog, data_dir = make_catalog(tmp_path)
+    georgian = {"transcript": [{"speaker": "A", "text": "გამარჯობა"}], "language": "ka"}
+    english = {
+        "transcript": [{"speaker": "A", "text": "hello there"}, {"speaker": "B", "text": "hi"}],
+        "language": "en",
+        "translated": True,
+    }
+
+    catalog.record("m_ge_1.json", georgian, write(data_dir, "m_ge_1.json", georgian))
+    catalog.record("m_en_1.json", english, write(data_dir, "m_en_1.json", english))
+
+    rows = {row["filename"]: row for row in catalog.query(sort="filename")["transcripts"]}
+    assert rows["m_ge_1.json"]["has_translation"] is True
+    assert rows["m_ge_1.json"]["translated_filename"] == "m_en_1.json"
+    assert rows["m_en_1.json"]["word_count"] == 3
+    assert rows["m_en_1.json"]["speaker_count"] == 2
+
+
+def test_cursor_pagination_walks_every_row_once(tmp_path):
+    """Following next_cursor returns each transcript exactly once, in sort order."""
+    catalog, data_dir = make_catalog(tmp_path)
+    for i in range(25):
+        data = [{"speaker": "A", "text": " ".join(["word"] * (i % 7))}]
+        catalog.record(f"t_en_{i:02d}.json", data, write(data_dir, f"t_en_{i:02d}.json", data))
+
+    seen, cursor = [], None
+    while True:
+        page = catalog.query(sort="word_count", order="asc", limit=10, cursor=cursor)
+        seen.extend(page["transcripts"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert len({row["filename"] for row in seen}) == 25
+    counts = [row["word_count"] for row in seen]
+    assert counts == sorted(counts)
+
+
+def test_filters_and_counts(tmp_path):
+    """Language, translation status and filename filters narrow both the page and the totals."""
+    catalog, data_dir = make_catalog(tmp_path)
+    for name in ("a_ge_1.json", "b_ge_2.json", "b_en_2.json", "c_en_3.json"):
+        catalog.record(name, [], write(data_dir, name, []))
+
+    georgian = catalog.query(language="Georgian")
+    assert georgian["total"] == 2 and georgian["georgian_count"] == 2
+    assert [r["filename"] for r in catalog.query(language="Georgian", has_translation=False)["transcripts"]] == ["a_ge_1.json"]
+    assert catalog.query(search="b_")["total"] == 2
+    assert catalog.query(search="%")["total"] == 0, "LIKE wildcards in the search are literal"
+
+
+def test_empty_catalog_is_backfilled_from_data_dir(tmp_path):
+    """Transcripts written before the catalog existed are catalogued once, in any layout."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write(data_dir, "list_en_1.json", [{"speaker": "A", "text": "one two"}])
+    write(data_dir, "utt_en_2.json", {"utterances": [{"speaker": "B", "text": "three"}]})
+
+    catalog = TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir))
+
+    result = catalog.query(sort="filename", order="asc")
+    assert [r["word_count"] for r in result["transcripts"]] == [2, 1]
+
+
+def test_recreated_catalog_never_reuses_a_version(tmp_path):
+    """A new catalog database starts a new version even though its write counter restarts."""
+    catalog, data_dir = make_catalog(tmp_path)
+    data = {"transcript": [{"speaker": "A", "text": "hello"}], "language": "en"}
+    catalog.record("m_en_1.json", data, write(data_dir, "m_en_1.json", data))
+    first = catalog.version()[0]
+    assert TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir)).version()[0] == first
+
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / f"catalog.sqlite3{suffix}").unlink(missing_ok=True)
+    recreated = TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir))
+    assert recreated.version()[0] != first
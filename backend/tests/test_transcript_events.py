@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from backend.services import transcript_events
+from backend.transcript_format import encode_transcript, write_transcript
+from backend.transcript_model import wait_for_transcript
+
+DATA = {"transcript": [{"speaker": "A", "text": "hello", "start": 0, "end": 500}], "language": "en"}
+
+
+@pytest.fixture
+def recheck(monkeypatch):
+    """Set how often waits recheck for files written by other processes."""
+
+    def set_interval(seconds):
+        monkeypatch.setattr(transcript_events.get_transcript_events(), "external_recheck_seconds", seconds)
+
+    return set_interval
+
+
+def test_reader_wakes_as_soon_as_the_transcript_is_published(tmp_path, recheck):
+    """A waiting reader starts on the writer's publish event, not on a polling interval."""
+    recheck(60)
+    path = str(tmp_path / "meeting.json")
+    writer = threading.Timer(0.2, write_transcript, args=(path, DATA))
+
+    started = time.monotonic()
+    writer.start()
+    transcript = wait_for_transcript(path, timeout=10)
+    elapsed = time.monotonic() - started
+
+    assert transcript is not None and transcript.full_text == "hello"
+    assert elapsed < 2, f"Reader should wake on publish, waited {elapsed:.2f}s"
+
+
+def test_existing_transcript_loads_without_waiting(tmp_path, recheck):
+    """Atomic writes mean an existing file is complete and is read at once."""
+    recheck(60)
+    path = str(tmp_path / "meeting.json")
+    write_transcript(path, DATA)
+
+    started = time.monotonic()
+    assert wait_for_transcript(path, timeout=10) is not None
+    assert time.monotonic() - started < 0.5
+
+
+def test_external_writes_are_picked_up_and_missing_files_time_out(tmp_path, recheck):
+    """Files written by another process are found on the coarse recheck; absent ones return None."""
+    recheck(0.05)
+    path = tmp_path / "external.json"
+    threading.Timer(0.1, path.write_bytes, args=(encode_transcript(DATA),)).start()
+
+    assert wait_for_transcript(str(path), timeout=5) is not None
+    assert wait_for_transcript(str(tmp_path / "never.json"), timeout=0.2) is None
+
+
+def test_watched_directories_wait_for_publish_without_rechecking(tmp_path):
+    """In a watched directory ready() reruns only on publish; elsewhere it is polled on the interval."""
+    events = transcript_events.TranscriptEvents(external_recheck_seconds=0.01)
+    path = str(tmp_path / "external.json")
+    calls = []
+
+    def ready():
+        calls.append(1)
+        return "loaded" if len(calls) > 1 and events.generation(path) else None
+
+    events.watch_directory(str(tmp_path))
+    threading.Timer(0.3, events.publish, args=(path,)).start()
+    assert events.wait_for(path, ready, timeout=5) == "loaded"
+    assert len(calls) == 2, "A watched directory must not be polled"
+
+    events.unwatch_directory(str(tmp_path))
+    calls.clear()
+    assert events.wait_for(str(tmp_path / "never.json"), lambda: calls.append(1), timeout=0.2) is None
+    assert len(calls) > 5, "Unwatched directories fall back to the recheck interval"
@@ -0,0 +1,120 @@
+import json
+import os
+
+import pytest
+
+import backend.transcript_format as transcript_format
+from backend.migrate_transcripts import migrate_transcripts
+from backend.transcript_format import (
+    TranscriptReader,
+    encode_transcript,
+    read_metadata,
+    read_transcript,
+    write_transcript,
+)
+
+
+def make_transcript(count=200):
+    return {
+        "transcript": [
+            {"speaker": f"S{i % 3}", "text": f"utterance {i} გამარჯობა", "start": i * 1000, "end": i * 1000 + 900}
+            for i in range(count)
+        ],
+        "language": "en",
+        "duration": count,
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [make_transcript(), make_transcript()["transcript"], {"utterances": [], "language": "ka"}, {"language": "en"}],
+)
+def test_compact_round_trip_preserves_every_layout(tmp_path, data):
+    """All three stored layouts read back exactly as written."""
+    path = str(tmp_path / "t.json")
+    write_transcript(path, data, storage_format="compact")
+
+    assert read_transcript(path) == data
+
+
+def test_reader_decodes_only_the_requested_blocks(tmp_path, monkeypatch):
+    """Metadata needs no decompression and a range only touches overlapping blocks."""
+    path = tmp_path / "t.json"
+    path.write_bytes(encode_transcript(make_transcript(), codec="zlib", block_size=10))
+    decoded = []
+    original = transcript_format._decompress
+    monkeypatch.setattr(
+        transcript_format, "_decompress", lambda raw, codec: decoded.append(1) or original(raw, codec)
+    )
+
+    meta = read_metadata(str(path))
+    assert meta["language"] == "en" and meta["utterance_count"] == 200
+    assert decoded == []
+
+    utterances = TranscriptReader(str(path)).utterances(95, 105)
+    assert [u["start"] for u in utterances] == [i * 1000 for i in range(95, 105)]
+    assert len(decoded) == 2, "Only the two blocks covering 95-104 should be decoded"
+
+
+def test_legacy_json_is_read_transparently(tmp_path):
+    """Files written before the compact format are served through the same API."""
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(make_transcript(5), indent=2))
+
+    reader = TranscriptReader(str(path))
+    assert not reader.compact
+    assert reader.utterances(1, 3) == make_transcript(5)["transcript"][1:3]
+
+
+def test_migration_converts_in_place_and_is_reversible(tmp_path):
+    """Migration shrinks files, keeps their mtime and can be rolled back to identical JSON data."""
+    data = make_transcript()
+    path = tmp_path / "m_en_1.json"
+    path.write_text(json.dumps(data, indent=2))
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    report = migrate_transcripts(str(tmp_path), "compact", checkpoint_path=checkpoint)
+    assert report["converted"] == 1 and report["bytes_after"] < report["bytes_before"]
+    assert TranscriptReader(str(path)).compact
+    assert os.stat(path).st_mtime == 1_600_000_000
+    assert migrate_transcripts(str(tmp_path), "compact", checkpoint_path=checkpoint)["skipped"] == 1
+
+    migrate_transcripts(str(tmp_path), "json", checkpoint_path=checkpoint)
+    assert json.loads(path.read_text()) == data
+
+
+def test_segment_matches_a_full_scan(tmp_path):
+    """Indexed window lookups return exactly the overlapping utterances, in start order."""
+    data = make_transcript(500)
+    data["transcript"][10]["end"] = 60_000  # one long utterance spanning many others
+    compact = tmp_path / "compact.json"
+    compact.write_bytes(encode_transcript(data, codec="zlib", block_size=16))
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps(data))
+
+    indexed, unindexed = TranscriptReader(str(compact)), TranscriptReader(str(legacy))
+    assert indexed.indexed and not unindexed.indexed
+    for start, end in [(0, 1), (42_000, 47_000), (42_500, 42_600), (499_000, 900_000), (900_000, 901_000)]:
+        expected = sorted(
+            (u for u in data["transcript"] if u["start"] < end and u["end"] > start),
+            key=lambda u: u["start"],
+        )
+        assert indexed.segment(start, end) == expected
+        assert unindexed.segment(start, end) == expected
+
+
+def test_segment_decodes_only_matching_blocks(tmp_path, monkeypatch):
+    """A short window in a long meeting touches one block."""
+    path = tmp_path / "t.json"
+    path.write_bytes(encode_transcript(make_transcript(5000), codec="zlib", block_size=64))
+    decoded = []
+    original = transcript_format._decompress
+    monkeypatch.setattr(
+        transcript_format, "_decompress", lambda raw, codec: decoded.append(1) or original(raw, codec)
+    )
+
+    utterances = TranscriptReader(str(path)).segment(2_520_000, 2_523_000)
+
+    assert [u["start"] for u in utterances] == [2_520_000, 2_521_000, 2_522_000]
+    assert len(decoded) == 1
@@ -0,0 +1,70 @@
+import pytest
+
+from backend.generate_summary import format_utterances
+from backend.services.transcript_catalog import transcript_stats
+from backend.summary_store import summary_key
+from backend.transcript_format import write_transcript
+from backend.transcript_model import Transcript, load_transcript
+
+
+def make_utterances(count=150):
+    return [
+        {"speaker": f"S{i % 3}", "text": f"utterance {i} გამარჯობა", "start": i * 1000, "end": i * 1000 + 900}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "data, layout",
+    [
+        ({"transcript": make_utterances(), "language": "ka"}, "transcript"),
+        ({"utterances": make_utterances(), "language": "ka"}, "utterances"),
+        (make_utterances(), "list"),
+    ],
+)
+def test_one_loader_normalizes_every_layout(tmp_path, data, layout):
+    """Compact files in all three layouts load into the same columnar transcript."""
+    path = str(tmp_path / "t.json")
+    write_transcript(path, data, storage_format="compact")
+
+    transcript = load_transcript(path)
+
+    assert transcript.layout == layout
+    assert transcript.to_utterances() == make_utterances()
+    assert transcript.language == ("en" if layout == "list" else "ka")
+
+
+def test_columns_are_interned_and_share_one_text_buffer():
+    """Speakers are stored once, times as integers, and texts as slices of one buffer."""
+    utterances = make_utterances()
+    transcript = Transcript.from_utterances(utterances)
+
+    assert transcript.speakers == [None, "S0", "S1", "S2"], "Each speaker label should be stored once"
+    assert transcript.speaker_ids.typecode == "H" and transcript.starts.typecode == "q"
+    assert transcript.full_text == " ".join(u["text"] for u in utterances)
+    assert [transcript.text(i) for i in range(len(transcript))] == [u["text"] for u in utterances]
+    assert transcript.start(10) == 10000 and transcript.end(10) == 10900
+
+
+def test_missing_fields_round_trip():
+    """Utterances without speaker, times or text keep their shape."""
+    utterances = [{"text": "no speaker"}, {"speaker": "A", "text": ""}, {"speaker": "A", "text": "x", "start": 5}]
+    transcript = Transcript.from_utterances(utterances)
+
+    assert transcript.to_utterances() == utterances
+    assert transcript.speaker(0) is None and transcript.start(1) is None
+    assert format_utterances(transcript) == ["Speaker: no speaker", "A: ", "A: x"]
+
+
+def test_consumers_match_the_dict_based_results():
+    """Summary keys, prompt lines and dashboard stats are unchanged by the model."""
+    utterances = make_utterances()
+    transcript = Transcript.from_utterances(utterances)
+
+    assert summary_key(transcript, "ka") == summary_key(utterances, "ka"), "Cached summaries must stay valid"
+    assert format_utterances(transcript) == [f"{u['speaker']}: {u['text']}" for u in utterances]
+    assert transcript_stats({"transcript": utterances}) == {
+        "word_count": sum(len(u["text"].split()) for u in utterances),
+        "speaker_count": 3,
+        "utterance_count": 150,
+    }
@@ -0,0 +1,103 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from backend.semantic import index_transcripts
+from backend.services.near_duplicates import NearDuplicateIndex
+from backend.services.transcript_catalog import TranscriptCatalog
+from backend.services.transcript_watcher import TranscriptWatcher
+
+
+def transcript(text):
+    return {"transcript": [{"speaker": "A", "text": text}], "language": "en"}
+
+
+@pytest.fixture
+def watcher_env(tmp_path, monkeypatch):
+    """A watcher over a temporary data directory with a fake clock and embedding client."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(index_transcripts, "INDEX_FILE", tmp_path / "vector_index.json")
+    requests = []
+
+    def fake_embedding(input, model):
+        requests.append(list(input))
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        )
+
+    monkeypatch.setattr(index_transcripts, "create_embedding", fake_embedding)
+    now = [0.0]
+    watcher = TranscriptWatcher(
+        str(data_dir),
+        checkpoint_path=str(tmp_path / "checkpoint.json"),
+        catalog=TranscriptCatalog(str(tmp_path / "catalog.sqlite3"), str(data_dir)),
+        duplicates=NearDuplicateIndex(str(tmp_path / "duplicates.sqlite3"), str(data_dir)),
+        debounce_seconds=2,
+        batch_size=10,
+        clock=lambda: now[0],
+    )
+    return SimpleNamespace(data_dir=data_dir, watcher=watcher, requests=requests, now=now, tmp_path=tmp_path)
+
+
+def advance(env, seconds):
+    env.now[0] += seconds
+    return env.watcher.run_once()
+
+
+def test_new_files_are_debounced_and_embedded_in_one_batch(watcher_env):
+    """Files are processed only after they stop changing, with one embedding request per batch."""
+    env = watcher_env
+    for i in range(3):
+        (env.data_dir / f"m{i}.json").write_text(json.dumps(transcript(f"meeting {i}")))
+
+    assert advance(env, 0) is None, "First sighting only starts the debounce"
+    report = advance(env, 2)
+
+    assert report["embedded"] == 3 and len(env.requests) == 1
+    assert sorted(item["source"] for item in index_transcripts.load_index()) == ["m0.json", "m1.json", "m2.json"]
+    assert env.watcher.catalog.query()["total"] == 3
+    assert advance(env, 5) is None, "Checkpointed files are not processed again"
+
+
+def test_only_changed_files_are_reprocessed(watcher_env):
+    """A rewrite re-embeds that file, a touch with the same bytes does not, deletions are dropped."""
+    env = watcher_env
+    for name, text in [("a.json", "first"), ("b.json", "second"), ("c.json", "third")]:
+        (env.data_dir / name).write_text(json.dumps(transcript(text)))
+    advance(env, 0)
+    advance(env, 2)
+    env.requests.clear()
+
+    (env.data_dir / "a.json").write_text(json.dumps(transcript("first, revised")))
+    stat = os.stat(env.data_dir / "b.json")
+    os.utime(env.data_dir / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    os.remove(env.data_dir / "c.json")
+    removal = advance(env, 0)
+    report = advance(env, 2)
+
+    assert removal["removed"] == 1, "Deletions need no debounce"
+    assert env.requests == [["first, revised"]]
+    assert report["unchanged"] == 1 and report["embedded"] == 1
+    texts = {item["source"]: item["text"] for item in index_transcripts.load_index()}
+    assert texts == {"a.json": "first, revised", "b.json": "second"}
+
+
+def test_checkpoint_survives_restarts_and_skips_already_indexed_text(watcher_env):
+    """A new watcher resumes from the checkpoint; text already in the index is not re-embedded."""
+    env = watcher_env
+    (env.data_dir / "a.json").write_text(json.dumps(transcript("kept")))
+    index_transcripts.update_index([{"embedding": [1.0], "text": "kept", "source": "a.json"}])
+    advance(env, 0)
+    advance(env, 2)
+    assert env.requests == [], "Text already in the index should not be embedded again"
+
+    restarted = TranscriptWatcher(
+        str(env.data_dir),
+        checkpoint_path=str(env.tmp_path / "checkpoint.json"),
+        catalog=env.watcher.catalog,
+        debounce_seconds=0,
+    )
+    assert restarted.scan() == ([], [])
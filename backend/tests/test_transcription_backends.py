@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.transcription_backends import (
+    AssemblyAIBackend,
+    LocalBackend,
+    RecordReplayBackend,
+    TranscriptionBackend,
+)
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Creates a small fake audio file."""
+    path = tmp_path / "meeting.wav"
+    path.write_bytes(b"RIFF fake audio payload")
+    return str(path)
+
+
+def test_local_backend_is_deterministic(audio_file):
+    """The local backend returns the same synthetic transcript for the same file."""
+    backend = LocalBackend(latency_seconds=0, utterances=5)
+    first = backend.transcribe(audio_file, "en")
+    second = backend.transcribe(audio_file, "en")
+
+    assert first == second, "Synthetic transcript should be deterministic"
+    assert len(first["transcript"]) == 5, "Should return the configured utterance count"
+    starts = [u["start"] for u in first["transcript"]]
+    assert starts == sorted(starts), "Utterances should be in time order"
+
+
+def test_record_then_replay(audio_file, tmp_path):
+    """Recorded responses are served back verbatim in replay mode."""
+    recordings = str(tmp_path / "recordings")
+    recorder = RecordReplayBackend(
+        mode="record", inner=LocalBackend(latency_seconds=0), recordings_dir=recordings
+    )
+    recorded = recorder.transcribe(audio_file, "ka")
+
+    replayer = RecordReplayBackend(mode="replay", recordings_dir=recordings)
+    assert replayer.transcribe(audio_file, "ka") == recorded, "Replay should match recording"
+
+    with pytest.raises(Exception):
+        replayer.transcribe(audio_file, "en")
+
+
+def test_assemblyai_detects_the_language_for_auto(audio_file):
+    """`auto` turns on AssemblyAI language detection instead of being sent as a language code."""
+    configs = []
+
+    class FakeTranscriber:
+        def __init__(self, config):
+            configs.append(config)
+
+        def transcribe(self, file_path):
+            return SimpleNamespace(status="completed", utterances=None, text="Hello", language_code="sk")
+
+    backend = AssemblyAIBackend.__new__(AssemblyAIBackend)
+    backend.aai = SimpleNamespace(
+        TranscriptionConfig=lambda **kwargs: kwargs,
+        Transcriber=FakeTranscriber,
+        TranscriptStatus=SimpleNamespace(error="error"),
+    )
+
+    assert backend.transcribe(audio_file, "auto")["language"] == "sk"
+    backend.transcribe(audio_file, "ka")
+
+    assert configs[0]["language_detection"] and configs[0]["language_code"] is None
+    assert configs[1]["language_code"] == "ka" and not configs[1]["language_detection"]
+
+
+def test_backend_without_transcribe_fails_at_creation():
+    """A backend that does not implement transcribe cannot be instantiated."""
+
+    class Incomplete(TranscriptionBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
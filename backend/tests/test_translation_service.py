@@ -0,0 +1,124 @@
+import threading
+
+from backend.services.translation_memory import TranslationMemory
+from backend.services.translation_service import (
+    TranslationService,
+    pack_batches,
+    split_long_text,
+)
+
+
+class FakeTranslator:
+    """Upper-cases text and records how many requests it received."""
+
+    def __init__(self, calls, mangle_separators=False):
+        self.calls = calls
+        self.mangle_separators = mangle_separators
+        self.lock = threading.Lock()
+
+    def translate(self, text):
+        with self.lock:
+            self.calls.append(text)
+        if self.mangle_separators:
+            text = text.replace("|||", "")
+        return text.upper()
+
+
+def make_transcript(count):
+    return {
+        "language": "ka",
+        "transcript": [
+            {"speaker": f"S{i % 2}", "text": f"utterance {i}", "start": i * 10, "end": i * 10 + 5}
+            for i in range(count)
+        ],
+    }
+
+
+def test_pack_batches_respects_size_limit():
+    """Batches never exceed the character limit and skip empty segments."""
+    texts = ["a" * 40, "", "b" * 40, "c" * 40, "d" * 200]
+    batches = pack_batches(texts, max_chars=100)
+
+    assert batches == [[0, 2], [3], [4]], "Segments should be packed in order within the limit"
+
+
+def test_split_long_text_prefers_sentence_boundaries():
+    """Over-long segments are split into request-sized pieces without losing text."""
+    text = "First sentence here. " * 20 + "x" * 150
+    pieces = split_long_text(text.strip(), max_chars=100)
+
+    assert all(len(piece) <= 100 for piece in pieces), "No piece may exceed the limit"
+    assert " ".join(pieces).replace(" ", "") == text.replace(" ", "")
+    assert pieces[0].endswith("."), "Splits should fall on sentence boundaries when possible"
+
+
+def test_translate_transcript_batches_and_preserves_alignment():
+    """Utterances are translated in few requests and keep speaker/start/end."""
+    calls = []
+    service = TranslationService(
+        max_workers=3,
+        max_batch_chars=60,
+        translator_factory=lambda lang: FakeTranslator(calls),
+        memory=TranslationMemory(":memory:"),
+    )
+    data = make_transcript(12)
+    result = service.translate_transcript(data)
+
+    assert len(calls) < 12, "Utterances should be sent in batches"
+    assert result["language"] == "en" and result["original_language"] == "ka"
+    for original, translated in zip(data["transcript"], result["transcript"]):
+        assert translated["text"] == original["text"].upper()
+        assert (translated["speaker"], translated["start"], translated["end"]) == (
+            original["speaker"],
+            original["start"],
+            original["end"],
+        )
+
+
+def test_failed_batch_falls_back_per_utterance():
+    """If boundary markers are lost, each utterance is translated on its own."""
+    calls = []
+    service = TranslationService(
+        max_workers=1,
+        max_batch_chars=1000,
+        translator_factory=lambda lang: FakeTranslator(calls, mangle_separators=True),
+        memory=TranslationMemory(":memory:"),
+    )
+    result = service.translate_transcript(make_transcript(4))
+
+    assert [u["text"] for u in result["transcript"]] == [f"UTTERANCE {i}" for i in range(4)]
+    assert len(calls) == 5, "One failed batch request plus one request per utterance"
+
+
+def test_translation_memory_serves_repeated_segments():
+    """Repeated segments and re-runs are served from the translation memory."""
+    calls = []
+    memory = TranslationMemory(":memory:")
+    service = TranslationService(
+        max_workers=1, translator_factory=lambda lang: FakeTranslator(calls), memory=memory
+    )
+    texts = ["gamarjoba", "gamarjoba ", "agenda item", "gamarjoba"]
+
+    first = service.translate_texts(texts, "ka")
+    requests_after_first = len(calls)
+    second = service.translate_texts(texts, "ka")
+
+    assert first == second == ["GAMARJOBA", "GAMARJOBA", "AGENDA ITEM", "GAMARJOBA"]
+    assert len(calls) == requests_after_first, "Re-run should not call the translator"
+    assert memory.stats()["hits"] == 4
+
+
+def test_translation_memory_evicts_least_recently_used(tmp_path):
+    """The memory persists to disk and keeps at most `max_entries` entries."""
+    path = str(tmp_path / "tm.sqlite3")
+    memory = TranslationMemory(path, max_entries=2)
+    memory.put("one", "ONE", "ka", "en", "google")
+    memory.put("two", "TWO", "ka", "en", "google")
+    memory.get("one", "ka", "en", "google")
+    memory.put("three", "THREE", "ka", "en", "google")
+
+    reopened = TranslationMemory(path, max_entries=2)
+    assert reopened.get("one", "ka", "en", "google") == "ONE"
+    assert reopened.get("three", "ka", "en", "google") == "THREE"
+    assert reopened.get("one", "ka", "en", "gpt-4") is None, "Engine is part of the key"
+    assert reopened.stats()["entries"] == 2
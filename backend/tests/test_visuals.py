@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from backend.config import VISUAL_CONFIG
+from backend.visuals import generate_visual
+
+PROMPTS = {"executive": "exec prompt", "stakeholder": "stakeholder prompt", "action_board": "board prompt"}
+
+
+@pytest.fixture
+def fake_dalle(tmp_path, monkeypatch):
+    """A slow fake image generator and a temporary visual cache."""
+    monkeypatch.setitem(VISUAL_CONFIG, "cache_dir", str(tmp_path / "visuals"))
+    calls = []
+    lock = threading.Lock()
+
+    def fake_generate(prompt):
+        time.sleep(0.2)
+        with lock:
+            calls.append(prompt)
+        return f"https://images.example/{len(calls)}.png"
+
+    monkeypatch.setattr(generate_visual, "generate_visual_image", fake_generate)
+    return calls
+
+
+def test_visuals_are_generated_concurrently(fake_dalle):
+    """Three visuals take about as long as one, and each reports its own timing."""
+    started = time.perf_counter()
+    results = generate_visual.generate_visuals("summary1", PROMPTS)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5, f"Generations should overlap (took {elapsed:.2f}s)"
+    assert sorted(fake_dalle) == sorted(PROMPTS.values())
+    for visual in results.values():
+        assert visual["url"] and not visual["cached"] and visual["seconds"] >= 0.2
+
+
+def test_repeat_views_are_served_from_cache(fake_dalle):
+    """An unchanged summary returns cached URLs without calling DALL·E again."""
+    first = generate_visual.generate_visuals("summary1", PROMPTS)
+    fake_dalle.clear()
+
+    second = generate_visual.generate_visuals("summary1", PROMPTS)
+
+    assert fake_dalle == [], "Cached visuals should not be regenerated"
+    assert {t: v["url"] for t, v in second.items()} == {t: v["url"] for t, v in first.items()}
+    assert all(v["cached"] and v["seconds"] < 0.2 for v in second.values())
+
+
+def test_cache_misses_on_new_summary_prompt_version_or_expiry(fake_dalle, monkeypatch):
+    """A changed summary, a prompt version bump or an expired entry regenerates the visual."""
+    one = {"executive": "exec prompt"}
+    generate_visual.generate_visuals("summary1", one)
+
+    generate_visual.generate_visuals("summary2", one)
+    monkeypatch.setitem(VISUAL_CONFIG, "prompt_version", "test-next")
+    generate_visual.generate_visuals("summary1", one)
+    monkeypatch.setitem(VISUAL_CONFIG, "ttl_seconds", -1)
+    generate_visual.generate_visuals("summary1", one)
+
+    assert len(fake_dalle) == 4
+
+
+def test_failed_generations_are_not_cached(fake_dalle, monkeypatch):
+    """A visual that failed is retried on the next request."""
+    monkeypatch.setattr(generate_visual, "generate_visual_image", lambda prompt: None)
+
+    result = generate_visual.generate_visuals("summary1", {"executive": "p"})
+
+    assert result["executive"]["url"] is None
+    assert generate_visual.load_cached_visual(generate_visual.visual_cache_key("summary1", "executive")) is None
@@ -11,6 +11,64 @@ transcription_service = TranscriptionService()
 translation_service = TranslationService()
 
 
+def process_audio_file(file_path: str, filename: str, language: str = "en") -> dict:
+    """
+        Run a saved audio file through the full ingest pipeline: transcription, translation (if not English),
+        summary generation and embedding. Near-duplicates of an earlier transcript stop after saving.
+
+        Args:
+            file_path (str): Path to the audio file on disk.
+            filename (str): Original name of the uploaded file, used to derive the transcript filename.
+            language (str, optional): Language code passed to the transcription backend.
+
+        Returns:
+            dict: Structured transcript data plus the saved transcript filename(s).
+    """
+    transcript_data = transcription_service.transcribe(file_path, language)
+
+    output_filename = transcription_service.save_transcript(transcript_data, filename)
+    output_path = os.path.abspath(os.path.join(DATA_DIR, output_filename))
+
+    if not os.path.exists(output_path):
+        raise Exception(f"❌ Output JSON file missing after save: {output_path}")
+
+    if transcript_data.get("duplicate_of"):
+        # Already translated, summarized and indexed as the original
+        return {**transcript_data, "filename": output_filename}
+
+    # save_transcript has set the language from the transcript text
+    if transcript_data["language"] != "en":
+        translated_data = translation_service.translate_transcript(transcript_data)
+        translated_filename = transcription_service.save_transcript(
+            translated_data, filename.replace("_ge_", "_en_")
+        )
+
+        try:
+            requests.post(
+                "http://localhost:5050/api/summary",
+                json={"filename": translated_filename},
+            ).raise_for_status()
+        except Exception as e:
+            print(f"⚠️ Post-processing error (summary): {e}")
+
+        return {
+            **translated_data,
+            "filename": output_filename,
+            "original_filename": output_filename,
+            "translated_filename": translated_filename,
+        }
+
+    try:
+        requests.post(
+            "http://localhost:5050/api/summary",
+            json={"filename": output_filename},
+        ).raise_for_status()
+    except Exception as e:
+        print(f"⚠️ Post-processing error (summary): {e}")
+
+    return {**transcript_data, "filename": output_filename}
+
+
 def transcribe_audio():
     """Handle the /api/transcribe request: saves uploaded audio, performs transcription using AssemblyAI,
     triggers translation (if Georgian), generates summaries, and returns structured transcript data."""
@@ -23,46 +81,7 @@ def transcribe_audio():
         file_path = os.path.join(TEMP_DIR, file.filename)
         file.save(file_path)
 
-        transcript_data = transcription_service.transcribe(file_path, language)
-
-        output_filename = transcription_service.save_transcript(
-            transcript_data, file.filename
-        )
-        output_path = os.path.abspath(os.path.join(DATA_DIR, output_filename))
-
-        if not os.path.exists(output_path):
-            raise Exception(f"❌ Output JSON file missing after save: {output_path}")
-
-        if transcript_data["language"] == "ka":
-            translated_data = translation_service.translate_transcript(transcript_data)
-            translated_filename = transcription_service.save_transcript(
-                translated_data, file.filename.replace("_ge_", "_en_")
-            )
-
-            try:
-                requests.post(
-                    "http://localhost:5050/api/summary",
-                    json={"filename": translated_filename},
-                ).raise_for_status()
-            except Exception as e:
-                print(f"⚠️ Post-processing error (summary): {e}")
-
-            response_data = {
-                **translated_data,
-                "original_filename": output_filename,
-                "translated_filename": translated_filename,
-            }
-
-        else:
-            try:
-                requests.post(
-                    "http://localhost:5050/api/summary",
-                    json={"filename": output_filename},
-                ).raise_for_status()
-            except Exception as e:
-                print(f"⚠️ Post-processing error (summary): {e}")
-
-            response_data = {**transcript_data, "filename": output_filename}
+        response_data = process_audio_file(file_path, file.filename, language)
 
         try:
             os.remove(file_path)
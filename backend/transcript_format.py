@@ -0,0 +1,378 @@
+import json
+import mmap
+import struct
+import zlib
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.config import TRANSCRIPT_STORAGE_CONFIG
+from backend.file_utils import atomic_write_bytes, atomic_write_json
+from backend.services.transcript_events import get_transcript_events
+
+try:
+    import zstandard
+except ImportError:  # Optional: zlib is used when zstandard is not installed
+    zstandard = None
+
+# File layout: prefix (magic, format version, codec, header length), JSON header, time index,
+# utterance blocks. The header holds the transcript metadata and the block offset table; each
+# block is compressed JSONL. The time index (version 2+) is a fixed-width array of
+# (start ms, end ms, utterance index) sorted by start, searched in place with binary search.
+MAGIC = b"SMTR"
+FORMAT_VERSION = 2
+_PREFIX = struct.Struct(">4sBBI")
+_TIME_ENTRY = struct.Struct(">qqI")
+CODECS = {"none": 0, "zlib": 1, "zstd": 2}
+_CODEC_NAMES = {code: name for name, code in CODECS.items()}
+UTTERANCE_KEYS = ("transcript", "utterances")
+
+
+def split_transcript(data: Any) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+    """
+        Split a transcript in any stored layout into (layout, metadata, utterances).
+
+        The layout is 'list' for a raw utterance list, the utterance key ('transcript' or
+        'utterances') for dicts, or 'none' for dicts without utterances.
+    """
+    if isinstance(data, list):
+        return "list", {}, data
+    if not isinstance(data, dict):
+        raise ValueError(f"Unsupported transcript type: {type(data).__name__}")
+    for key in UTTERANCE_KEYS:
+        if key in data:
+            return key, {k: v for k, v in data.items() if k != key}, data[key] or []
+    return "none", dict(data), []
+
+
+def join_transcript(layout: str, metadata: Dict[str, Any], utterances: List[Dict[str, Any]]) -> Any:
+    """Rebuild the original layout from split_transcript's parts."""
+    if layout == "list":
+        return utterances
+    if layout == "none":
+        return dict(metadata)
+    return {**metadata, layout: utterances}
+
+
+def resolve_codec(name: Optional[str] = None) -> str:
+    """Return the codec to write with, falling back from zstd to zlib when zstandard is missing."""
+    name = name or TRANSCRIPT_STORAGE_CONFIG["compression"]
+    if name not in CODECS:
+        raise ValueError(f"Unknown transcript compression: {name}")
+    if name == "zstd" and zstandard is None:
+        return "zlib"
+    return name
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=TRANSCRIPT_STORAGE_CONFIG["zstd_level"]).compress(raw)
+    if codec == "zlib":
+        return zlib.compress(raw, TRANSCRIPT_STORAGE_CONFIG["zlib_level"])
+    return raw
+
+
+def _decompress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Transcript is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    if codec == "zlib":
+        return zlib.decompress(raw)
+    return raw
+
+
+def _time_entries(utterances: List[Dict[str, Any]]) -> List[Tuple[int, int, int]]:
+    """Return (start, end, index) for utterances with numeric timestamps, sorted by start."""
+    entries = []
+    for index, utterance in enumerate(utterances):
+        start, end = utterance.get("start"), utterance.get("end")
+        if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+            entries.append((int(start), int(end), index))
+    entries.sort()
+    return entries
+
+
+def encode_transcript(data: Any, codec: Optional[str] = None, block_size: Optional[int] = None) -> bytes:
+    """
+        Encode a transcript in the compact format.
+
+        Utterances are written as compact JSON lines in blocks of `block_size`, each block compressed
+        on its own, so a reader can decode only the blocks it needs. A start-time index over the
+        utterances is written between the header and the blocks.
+
+        Args:
+            data (Any): Transcript in any stored layout.
+            codec (str, optional): 'zstd', 'zlib' or 'none'; defaults to TRANSCRIPT_STORAGE_CONFIG.
+            block_size (int, optional): Utterances per block; defaults to TRANSCRIPT_STORAGE_CONFIG.
+
+        Returns:
+            bytes: The encoded file content.
+    """
+    codec = resolve_codec(codec)
+    block_size = max(1, block_size or TRANSCRIPT_STORAGE_CONFIG["block_size"])
+    layout, metadata, utterances = split_transcript(data)
+
+    body = bytearray()
+    blocks = []
+    for start in range(0, len(utterances), block_size):
+        chunk = utterances[start : start + block_size]
+        raw = "\n".join(
+            json.dumps(u, ensure_ascii=False, separators=(",", ":")) for u in chunk
+        ).encode("utf-8")
+        compressed = _compress(raw, codec)
+        blocks.append([len(body), len(compressed), len(chunk)])
+        body.extend(compressed)
+
+    entries = _time_entries(utterances)
+    time_index = b"".join(_TIME_ENTRY.pack(*entry) for entry in entries)
+
+    header = json.dumps(
+        {
+            "layout": layout,
+            "metadata": metadata,
+            "count": len(utterances),
+            "blocks": blocks,
+            "time_index": {
+                "entries": len(entries),
+                "max_duration": max((end - start for start, end, _ in entries), default=0),
+            },
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    prefix = _PREFIX.pack(MAGIC, FORMAT_VERSION, CODECS[codec], len(header))
+    return prefix + header + time_index + bytes(body)
+
+
+def is_compact(raw_prefix: bytes) -> bool:
+    """Return True if the bytes start with the compact transcript magic."""
+    return raw_prefix[: len(MAGIC)] == MAGIC
+
+
+def compact_version(raw_prefix: bytes) -> Optional[int]:
+    """Return the compact format version of a file's leading bytes, or None for legacy JSON."""
+    if not is_compact(raw_prefix) or len(raw_prefix) < _PREFIX.size:
+        return None
+    return _PREFIX.unpack_from(raw_prefix)[1]
+
+
+def _parse_prefix(prefix: bytes) -> Tuple[int, str, int]:
+    """Validate a compact file prefix and return (version, codec name, header length)."""
+    if len(prefix) < _PREFIX.size:
+        raise ValueError("Truncated compact transcript header")
+    _, version, codec, header_length = _PREFIX.unpack_from(prefix)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported transcript format version {version}")
+    return version, _CODEC_NAMES[codec], header_length
+
+
+def _index_size(header: Dict[str, Any]) -> int:
+    return header.get("time_index", {}).get("entries", 0) * _TIME_ENTRY.size
+
+
+def overlaps(utterance: Dict[str, Any], start_ms: int, end_ms: int) -> bool:
+    """Return True if an utterance overlaps the half-open window [start_ms, end_ms)."""
+    start, end = utterance.get("start"), utterance.get("end")
+    if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+        return False
+    return start < end_ms and end > start_ms
+
+
+def loads_transcript(raw: bytes) -> Any:
+    """Decode a whole stored transcript (compact or legacy JSON) from bytes; drop-in for json.loads."""
+    if not is_compact(raw):
+        return json.loads(raw.decode("utf-8"))
+
+    _, codec, header_length = _parse_prefix(raw)
+    header = json.loads(raw[_PREFIX.size : _PREFIX.size + header_length].decode("utf-8"))
+    data_start = _PREFIX.size + header_length + _index_size(header)
+    utterances = []
+    for offset, length, _ in header["blocks"]:
+        start = data_start + offset
+        if start + length > len(raw):
+            raise ValueError("Truncated compact transcript body")
+        block = _decompress(raw[start : start + length], codec)
+        utterances.extend(json.loads(line) for line in block.split(b"\n"))
+    return join_transcript(header["layout"], header["metadata"], utterances)
+
+
+class TranscriptReader:
+    """
+    Read a stored transcript, compact or legacy JSON, without decoding more than needed.
+
+    For compact files only the header is parsed on open; `utterances(start, stop)` decompresses
+    just the blocks that overlap the range, and `segment(start_ms, end_ms)` binary-searches the
+    memory-mapped time index and decodes only the blocks holding matching utterances. Legacy JSON
+    files (and compact files written before the time index) are parsed in full and filtered.
+
+    Attributes:
+        - layout: 'transcript', 'utterances', 'list' or 'none'.
+        - metadata: Every top-level field except the utterances.
+        - count: Number of utterances.
+        - compact: Whether the file is in the compact format.
+        - indexed: Whether the file has a time index.
+
+    Methods:
+        - utterances(start, stop): Utterances [start, stop) as dicts.
+        - iter_utterances(): Every utterance, one block in memory at a time.
+        - segment(start_ms, end_ms): Utterances overlapping a time window, ordered by start.
+        - to_data(): The whole transcript in its original layout.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if is_compact(prefix):
+                self.version, self.codec, header_length = _parse_prefix(prefix)
+                header = json.loads(f.read(header_length).decode("utf-8"))
+                self.compact = True
+                self.indexed = "time_index" in header
+                self._index_start = _PREFIX.size + header_length
+                self._index_entries = header.get("time_index", {}).get("entries", 0)
+                self._max_duration = header.get("time_index", {}).get("max_duration", 0)
+                self._data_start = self._index_start + _index_size(header)
+                self._blocks = header["blocks"]
+                self._block_starts: Optional[List[int]] = None
+                self._legacy: Optional[List[Dict[str, Any]]] = None
+                self.layout, self.metadata, self.count = (
+                    header["layout"], header["metadata"], header["count"]
+                )
+            else:
+                data = json.loads((prefix + f.read()).decode("utf-8"))
+                self.compact = False
+                self.indexed = False
+                self.version = None
+                self.codec = None
+                self.layout, self.metadata, self._legacy = split_transcript(data)
+                self.count = len(self._legacy)
+
+    def utterances(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return utterances [start, stop), decoding only the blocks that overlap the range."""
+        stop = self.count if stop is None else min(stop, self.count)
+        start = max(0, start)
+        if start >= stop:
+            return []
+        if self._legacy is not None:
+            return self._legacy[start:stop]
+
+        result = []
+        first_index = 0
+        with open(self.path, "rb") as f:
+            for offset, length, count in self._blocks:
+                block_end = first_index + count
+                if block_end > start and first_index < stop:
+                    f.seek(self._data_start + offset)
+                    lines = _decompress(f.read(length), self.codec).split(b"\n")
+                    for line in lines[max(0, start - first_index) : stop - first_index]:
+                        result.append(json.loads(line))
+                if block_end >= stop:
+                    break
+                first_index = block_end
+        return result
+
+    def iter_utterances(self) -> Iterator[Dict[str, Any]]:
+        """Yield every utterance in order, decoding one block at a time."""
+        if self._legacy is not None:
+            yield from self._legacy
+            return
+        with open(self.path, "rb") as f:
+            for offset, length, _ in self._blocks:
+                f.seek(self._data_start + offset)
+                for line in _decompress(f.read(length), self.codec).split(b"\n"):
+                    yield json.loads(line)
+
+    def _utterances_at(self, f, indices: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Decode the utterances at `indices`, reading each needed block once."""
+        if self._block_starts is None:
+            self._block_starts = [0, *accumulate(count for _, _, count in self._blocks)]
+        block_starts = self._block_starts
+        wanted: Dict[int, List[int]] = {}
+        for index in indices:
+            block = bisect_right(block_starts, index) - 1
+            wanted.setdefault(block, []).append(index)
+
+        found = {}
+        for block, block_indices in wanted.items():
+            offset, length, _ = self._blocks[block]
+            f.seek(self._data_start + offset)
+            lines = _decompress(f.read(length), self.codec).split(b"\n")
+            for index in block_indices:
+                found[index] = json.loads(lines[index - block_starts[block]])
+        return found
+
+    def segment(self, start_ms: int, end_ms: int) -> List[Dict[str, Any]]:
+        """
+            Return utterances overlapping the window [start_ms, end_ms), ordered by start time.
+
+            With a time index, the first candidate is found by binary search over the fixed-width
+            entries (an utterance starting before start_ms - longest utterance cannot overlap), and
+            entries are scanned only until one starts at or after end_ms, so the cost depends on the
+            window, not on the meeting length.
+        """
+        if not self.indexed:
+            utterances = [u for u in self.utterances() if overlaps(u, start_ms, end_ms)]
+            return sorted(utterances, key=lambda u: u["start"])
+        if self._index_entries == 0 or start_ms >= end_ms:
+            return []
+
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            base, size = self._index_start, _TIME_ENTRY.size
+            earliest = start_ms - self._max_duration
+            lo, hi = 0, self._index_entries
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if _TIME_ENTRY.unpack_from(mm, base + mid * size)[0] < earliest:
+                    lo = mid + 1
+                else:
+                    hi = mid
+
+            matches = []
+            for position in range(lo, self._index_entries):
+                start, end, index = _TIME_ENTRY.unpack_from(mm, base + position * size)
+                if start >= end_ms:
+                    break
+                if end > start_ms:
+                    matches.append(index)
+
+            found = self._utterances_at(f, matches)
+        return [found[index] for index in matches]
+
+    def to_data(self) -> Any:
+        """Return the full transcript in its original layout."""
+        return join_transcript(self.layout, self.metadata, self.utterances())
+
+
+def read_transcript(path: str) -> Any:
+    """Load a stored transcript (compact or legacy JSON) in its original layout; drop-in for json.load."""
+    with open(path, "rb") as f:
+        return loads_transcript(f.read())
+
+
+def read_metadata(path: str) -> Dict[str, Any]:
+    """Return a transcript's top-level fields and utterance count without decoding utterances."""
+    reader = TranscriptReader(path)
+    return {**reader.metadata, "layout": reader.layout, "utterance_count": reader.count}
+
+
+def write_transcript(path: str, data: Any, storage_format: Optional[str] = None):
+    """
+        Write a transcript atomically in the configured storage format and publish it.
+
+        Readers waiting for the file (see `transcript_model.wait_for_transcript`) are woken as soon
+        as the rename completes.
+
+        Args:
+            path (str): Destination path (transcripts keep their .json names in either format).
+            data (Any): Transcript in any stored layout.
+            storage_format (str, optional): 'compact' or 'json'; defaults to TRANSCRIPT_STORAGE_CONFIG.
+    """
+    storage_format = storage_format or TRANSCRIPT_STORAGE_CONFIG["format"]
+    if storage_format == "json":
+        atomic_write_json(path, data)
+    elif storage_format == "compact":
+        atomic_write_bytes(path, encode_transcript(data))
+    else:
+        raise ValueError(f"Unknown transcript storage format: {storage_format}")
+    get_transcript_events().publish(path)
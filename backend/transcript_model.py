@@ -0,0 +1,224 @@
+import os
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from backend.services.transcript_events import get_transcript_events
+from backend.transcript_format import TranscriptReader, split_transcript
+
+# Sentinel for utterances without a start/end timestamp
+NO_TIME = -1
+
+
+class Transcript:
+    """
+    Columnar in-memory transcript shared by every consumer.
+
+    Speakers are interned into a small table and stored as integer ids (0 means no speaker), start
+    and end times live in integer arrays, and all utterance texts share one string buffer joined
+    with single spaces, addressed by offsets. The full text used for embeddings is the buffer
+    itself, and per-utterance strings are sliced only when asked for.
+
+    Attributes:
+        - metadata: Top-level transcript fields other than the utterances (language, flags...).
+        - layout: Stored layout the transcript came from ('transcript', 'utterances' or 'list').
+
+    Methods:
+        - from_data(data): Build from any stored layout (dict with 'transcript'/'utterances', or a list).
+        - from_utterances(utterances, metadata): Build from utterance dicts.
+        - text(i), speaker(i), start(i), end(i): Field accessors.
+        - full_text: All utterance texts joined with spaces.
+        - lines(): `speaker: text` lines for prompts.
+        - speaker_text_pairs(): (speaker, text) pairs, e.g. for content hashing.
+        - word_count(), speaker_count(): Dashboard stats.
+        - to_utterances(): Utterance dicts, for code that still needs them.
+    """
+
+    __slots__ = ("metadata", "layout", "speakers", "_speaker_ids", "speaker_ids", "starts", "ends", "_parts", "_text", "_offsets")
+
+    def __init__(self, metadata: Optional[Dict[str, Any]] = None, layout: str = "transcript"):
+        self.metadata = metadata or {}
+        self.layout = layout
+        self.speakers: List[Optional[str]] = [None]
+        self._speaker_ids: Dict[str, int] = {}
+        self.speaker_ids = array("H")
+        self.starts = array("q")
+        self.ends = array("q")
+        self._parts: Optional[List[str]] = []
+        self._text = ""
+        self._offsets = array("Q", [0])
+
+    # Construction
+
+    def append(self, speaker: Optional[str], text: str, start: Any = None, end: Any = None):
+        """Add one utterance."""
+        if speaker is None:
+            speaker_id = 0
+        else:
+            speaker = str(speaker)
+            speaker_id = self._speaker_ids.get(speaker)
+            if speaker_id is None:
+                speaker_id = self._speaker_ids[speaker] = len(self.speakers)
+                self.speakers.append(speaker)
+        self.speaker_ids.append(speaker_id)
+        self.starts.append(int(start) if isinstance(start, (int, float)) else NO_TIME)
+        self.ends.append(int(end) if isinstance(end, (int, float)) else NO_TIME)
+
+        text = str(text or "")
+        if self._parts is None:
+            self._parts = [self._text] if self._text else []
+        self._parts.append(text)
+        self._offsets.append(self._offsets[-1] + len(text) + 1)
+
+    def extend(self, utterances: Iterable[Dict[str, Any]]):
+        """Add utterance dicts."""
+        for utterance in utterances:
+            self.append(
+                utterance.get("speaker"),
+                utterance.get("text", ""),
+                utterance.get("start"),
+                utterance.get("end"),
+            )
+
+    @classmethod
+    def from_utterances(
+        cls,
+        utterances: Iterable[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        layout: str = "transcript",
+    ) -> "Transcript":
+        """Build a transcript from utterance dicts."""
+        transcript = cls(metadata, layout)
+        transcript.extend(utterances)
+        return transcript
+
+    @classmethod
+    def from_data(cls, data: Any) -> "Transcript":
+        """Build a transcript from any stored layout: {'transcript': [...]}, {'utterances': [...]} or [...]."""
+        layout, metadata, utterances = split_transcript(data)
+        return cls.from_utterances(utterances, metadata, layout)
+
+    # Access
+
+    def _buffer(self) -> str:
+        if self._parts is not None:
+            self._text = " ".join(self._parts)
+            self._parts = None
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self.speaker_ids)
+
+    def text(self, i: int) -> str:
+        return self._buffer()[self._offsets[i] : self._offsets[i + 1] - 1]
+
+    def speaker(self, i: int) -> Optional[str]:
+        return self.speakers[self.speaker_ids[i]]
+
+    def start(self, i: int) -> Optional[int]:
+        return None if self.starts[i] == NO_TIME else self.starts[i]
+
+    def end(self, i: int) -> Optional[int]:
+        return None if self.ends[i] == NO_TIME else self.ends[i]
+
+    @property
+    def full_text(self) -> str:
+        """All utterance texts joined with single spaces (no copy: this is the text buffer)."""
+        return self._buffer()
+
+    @property
+    def language(self) -> str:
+        return self.metadata.get("language", "en")
+
+    @property
+    def original_language(self) -> str:
+        return self.metadata.get("original_language", "en")
+
+    @property
+    def translated(self) -> bool:
+        return bool(self.metadata.get("translated", False))
+
+    def lines(self, default_speaker: str = "Speaker") -> List[str]:
+        """Render utterances as `speaker: text` lines."""
+        buffer, offsets, speakers, ids = self._buffer(), self._offsets, self.speakers, self.speaker_ids
+        return [
+            f"{speakers[ids[i]] or default_speaker}: {buffer[offsets[i] : offsets[i + 1] - 1]}"
+            for i in range(len(ids))
+        ]
+
+    def speaker_text_pairs(self) -> Iterator[Tuple[Optional[str], str]]:
+        for i in range(len(self)):
+            yield self.speaker(i), self.text(i)
+
+    def word_count(self) -> int:
+        return len(self.full_text.split())
+
+    def speaker_count(self) -> int:
+        """Distinct speaker labels, counting unlabelled utterances as one speaker."""
+        return len(set(self.speaker_ids))
+
+    def utterance(self, i: int) -> Dict[str, Any]:
+        utterance: Dict[str, Any] = {"text": self.text(i)}
+        if self.speaker_ids[i]:
+            utterance["speaker"] = self.speaker(i)
+        if self.starts[i] != NO_TIME:
+            utterance["start"] = self.starts[i]
+        if self.ends[i] != NO_TIME:
+            utterance["end"] = self.ends[i]
+        return utterance
+
+    def to_utterances(self) -> List[Dict[str, Any]]:
+        return [self.utterance(i) for i in range(len(self))]
+
+
+TranscriptLike = Union[Transcript, List[Dict[str, Any]]]
+
+
+def as_transcript(utterances: TranscriptLike) -> Transcript:
+    """Accept a Transcript or a list of utterance dicts and return a Transcript."""
+    if isinstance(utterances, Transcript):
+        return utterances
+    return Transcript.from_utterances(utterances)
+
+
+def load_transcript(path: str) -> Transcript:
+    """
+        Load a stored transcript (compact or legacy JSON, any layout) into the columnar model.
+
+        Compact files are decoded block by block, so the utterance dicts of the whole meeting are
+        never held in memory at once.
+    """
+    reader = TranscriptReader(path)
+    transcript = Transcript(reader.metadata, reader.layout)
+    transcript.extend(reader.iter_utterances())
+    return transcript
+
+
+def wait_for_transcript(path: str, timeout: Optional[float] = None) -> Optional[Transcript]:
+    """
+        Load a transcript, waiting for it to be published if it does not exist yet.
+
+        Transcripts are written atomically, so an existing file is always complete and is loaded
+        at once. A missing file is waited for until a writer in this process, or the transcript
+        watcher for files written by other processes, publishes it. Outside a watched directory
+        external writes are found by polling every `external_recheck_seconds` (1s by default).
+
+        Returns:
+            Optional[Transcript]: The transcript, or None if it did not appear within `timeout`.
+    """
+    path = os.fspath(path)
+    errors: List[Exception] = []
+
+    def ready() -> Optional[Transcript]:
+        # A file being written by a non-atomic external writer may not decode yet
+        try:
+            return load_transcript(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            errors[:] = [e]
+            return None
+
+    transcript = get_transcript_events().wait_for(path, ready, timeout)
+    if transcript is None and errors:
+        print(f"⚠️ Could not read transcript {os.path.basename(path)}: {errors[0]}")
+    return transcript
@@ -1,24 +1,27 @@
 # translate_georgian.py
 
 import os
-import json
 import re
 import requests
-from openai import OpenAI
-from dotenv import load_dotenv
-from semantic.index_transcripts import append_single_embedding
-
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-DATA_DIR = "data"
+from backend.config import DATA_DIR
+from backend.semantic.index_transcripts import append_single_embedding
+from backend.services.api_clients import create_chat_completion
+from backend.services.transcript_catalog import catalog_transcript
+from backend.services.translation_memory import get_translation_memory
+from backend.transcript_format import read_transcript, write_transcript
 
 def is_georgian_file(filename):
     return "_ge_" in filename and filename.endswith(".json")
 
 def translate_text(text):
+    memory = get_translation_memory()
+    if memory is None:
+        return _translate_with_gpt(text)
+    return memory.translate(text, "ka", "en", "gpt-4", _translate_with_gpt)
+
+def _translate_with_gpt(text):
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
             model="gpt-4",  # or "gpt-3.5-turbo"
             messages=[
                 {
@@ -43,8 +46,7 @@ def translate_georgian_transcript(filename):
         print(f"❌ File not found: {input_path}")
         return None
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_transcript(input_path)
 
     translated = []
     for entry in data:
@@ -63,8 +65,8 @@ def translate_georgian_transcript(filename):
     translated_filename = re.sub(r"_ge_", "_", filename)
     output_path = os.path.join(DATA_DIR, translated_filename)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(translated, f, indent=2, ensure_ascii=False)
+    write_transcript(output_path, translated)
+    catalog_transcript(translated_filename, translated, output_path)
 
     print(f"✅ Translated file saved: {translated_filename}")
 
@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from backend.config import GEORGIAN_BATCH_CONFIG
+from backend.file_utils import atomic_write_json
+from backend.semantic.index_transcripts import append_single_embedding
+from backend.services.transcript_catalog import catalog_transcript, translated_name
+from backend.services.translation_service import TranslationService
+from backend.transcript_format import read_transcript, write_transcript
+
+_translation_service: Optional[TranslationService] = None
+_service_lock = threading.Lock()
+
+
+def _get_translation_service() -> TranslationService:
+    global _translation_service
+    with _service_lock:
+        if _translation_service is None:
+            _translation_service = TranslationService()
+        return _translation_service
+
+
+def _source_signature(path: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {"source_mtime": stat.st_mtime, "source_size": stat.st_size}
+
+
+def load_checkpoint(checkpoint_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load the per-file checkpoint written by previous runs (empty if missing or unreadable)."""
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable translation checkpoint: {e}")
+        return {}
+
+
+def needs_translation(
+    data_dir: str, filename: str, checkpoint: Dict[str, Dict[str, Any]]
+) -> bool:
+    """
+        Decide whether a Georgian file still has to be translated.
+
+        A file is skipped when its English counterpart exists and the source has not changed since
+        the checkpoint recorded it (files translated before checkpoints existed are also skipped).
+    """
+    if not os.path.exists(os.path.join(data_dir, translated_name(filename))):
+        return True
+
+    record = checkpoint.get(filename)
+    if record is None:
+        return False
+
+    current = _source_signature(os.path.join(data_dir, filename))
+    return (
+        record.get("source_mtime") != current["source_mtime"]
+        or record.get("source_size") != current["source_size"]
+    )
+
+
+def translate_file(data_dir: str, filename: str) -> str:
+    """
+        Translate one Georgian transcript file to English, utterance by utterance, and save it atomically
+        in the configured transcript storage format.
+
+        Long transcripts are chunked by TranslationService, so no single translator request exceeds
+        the size limit, and already-translated segments are served from the translation memory.
+
+        Returns:
+            str: Name of the written English transcript file.
+    """
+    data = read_transcript(os.path.join(data_dir, filename))
+
+    if isinstance(data, dict):
+        entries = data.get("transcript") or data.get("utterances") or []
+        source_lang = data.get("language") if data.get("language") not in (None, "en") else "ka"
+    else:
+        entries, source_lang = data, "ka"
+
+    translated_texts = _get_translation_service().translate_texts(
+        [entry.get("text", "") for entry in entries], source_lang
+    )
+
+    output_filename = translated_name(filename)
+    output_path = os.path.join(data_dir, output_filename)
+    translated = {
+        "transcript": [
+            {**entry, "text": text} for entry, text in zip(entries, translated_texts)
+        ],
+        "language": "en",
+        "original_language": source_lang,
+        "translated": True,
+        "translated_from": filename,
+    }
+    write_transcript(output_path, translated)
+    catalog_transcript(output_filename, translated, output_path)
+
+    append_single_embedding(output_filename)
+    return output_filename
+
+
+def translate_georgian_batch(
+    data_dir: str,
+    filenames: List[str],
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+        Translate Georgian transcripts in parallel, yielding a progress event as each file finishes.
+
+        Files that are already translated are skipped, and every completed file is recorded in a
+        checkpoint so an interrupted run resumes where it stopped.
+
+        Args:
+            data_dir (str): Directory holding the transcripts.
+            filenames (List[str]): Georgian transcript filenames to consider.
+            max_workers (int, optional): Files translated concurrently; defaults to GEORGIAN_BATCH_CONFIG.
+            checkpoint_path (str, optional): Checkpoint file; defaults to GEORGIAN_BATCH_CONFIG.
+
+        Yields:
+            Dict[str, Any]: Progress events with 'progress' (percent) and 'status' keys.
+    """
+    checkpoint_path = checkpoint_path or GEORGIAN_BATCH_CONFIG["checkpoint_path"]
+    workers = max(1, int(max_workers or GEORGIAN_BATCH_CONFIG["max_workers"]))
+    checkpoint = load_checkpoint(checkpoint_path)
+
+    total = len(filenames)
+    done = 0
+    pending = []
+    for filename in filenames:
+        if needs_translation(data_dir, filename, checkpoint):
+            pending.append(filename)
+        else:
+            done += 1
+            yield {
+                "progress": round((done / total) * 100, 2),
+                "status": f"Skipped {filename} (already translated)",
+            }
+
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(translate_file, data_dir, filename): filename
+            for filename in pending
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            done += 1
+            try:
+                output_filename = future.result()
+                checkpoint[filename] = {
+                    **_source_signature(os.path.join(data_dir, filename)),
+                    "translated_filename": output_filename,
+                    "completed_at": datetime.now().isoformat(),
+                }
+                atomic_write_json(checkpoint_path, checkpoint)
+                yield {
+                    "progress": round((done / total) * 100, 2),
+                    "status": f"Translated {filename}",
+                }
+            except Exception as e:
+                print(f"❌ Failed to translate {filename}: {e}")
+                yield {
+                    "progress": round((done / total) * 100, 2),
+                    "status": f"Error translating {filename}: {str(e)}",
+                }
@@ -1,10 +1,16 @@
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
-from dotenv import load_dotenv
-from openai import OpenAI
+from backend.config import VISUAL_CONFIG
+from backend.file_utils import atomic_write_json
+from backend.services.api_clients import generate_image
+from backend.services.singleflight import SingleFlight
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Coalesces concurrent requests for the same visual so it is generated once
+visual_flight = SingleFlight()
 
 
 def generate_visual_image(prompt_text: str):
@@ -18,9 +24,9 @@ def generate_visual_image(prompt_text: str):
             str or None: URL of the generated image if successful; None otherwise.
     """
     try:
-        response = client.images.generate(
-            model="dall-e-3",
-            prompt=prompt_text,
+        response = generate_image(
+            prompt_text,
+            model=VISUAL_CONFIG["model"],
             size="1024x1024",
             quality="standard",
             n=1,
@@ -30,3 +36,91 @@ def generate_visual_image(prompt_text: str):
     except Exception as e:
         print(f"❌ Failed to generate visual summary: {e}")
         return None
+
+
+def visual_cache_key(summary_key: str, visual_type: str) -> str:
+    """Return the cache key of one visual: source summary hash, visual type and prompt version."""
+    return f"{summary_key}_{visual_type}_v{VISUAL_CONFIG['prompt_version']}"
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(VISUAL_CONFIG["cache_dir"], f"{key}.json")
+
+
+def load_cached_visual(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached visual for `key`, or None if it is missing or older than the TTL."""
+    try:
+        with open(_cache_path(key), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable visual cache entry {key}: {e}")
+        return None
+    if time.time() - entry.get("created_ts", 0) > VISUAL_CONFIG["ttl_seconds"]:
+        return None
+    return entry
+
+
+def _visual(summary_key: str, visual_type: str, prompt: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    key = visual_cache_key(summary_key, visual_type)
+    entry = load_cached_visual(key)
+    if entry:
+        return {"url": entry["url"], "cached": True, "seconds": round(time.perf_counter() - started, 3)}
+
+    def generate() -> Optional[str]:
+        print(f"🎨 Generating {visual_type} visual...")
+        url = generate_visual_image(prompt)
+        if url:
+            atomic_write_json(
+                _cache_path(key),
+                {
+                    "url": url,
+                    "summary_key": summary_key,
+                    "visual_type": visual_type,
+                    "prompt_version": VISUAL_CONFIG["prompt_version"],
+                    "created_ts": time.time(),
+                },
+            )
+        return url
+
+    url, shared = visual_flight.do(key, generate)
+    return {"url": url, "cached": shared, "seconds": round(time.perf_counter() - started, 3)}
+
+
+def generate_visuals(
+    summary_key: str, prompts: Dict[str, str], max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+        Generate one visual per prompt concurrently, serving unexpired results from the cache.
+
+        Visuals are cached by (summary hash, visual type, prompt version), so repeat views of an
+        unchanged summary return without calling DALL·E, and concurrent requests for the same visual
+        share one generation.
+
+        Args:
+            summary_key (str): Hash of the summary the prompts were built from.
+            prompts (Dict[str, str]): Prompt per visual type.
+            max_workers (int, optional): Concurrent generations; defaults to VISUAL_CONFIG.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per visual type, 'url' (None if generation failed),
+                                       'cached' and 'seconds' (time taken for that visual).
+    """
+    if not prompts:
+        return {}
+    workers = max(1, min(len(prompts), max_workers or VISUAL_CONFIG["max_workers"]))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            visual_type: executor.submit(_visual, summary_key, visual_type, prompt)
+            for visual_type, prompt in prompts.items()
+        }
+    results = {}
+    for visual_type, future in futures.items():
+        try:
+            results[visual_type] = future.result()
+        except Exception as e:
+            print(f"❌ Error generating {visual_type} visual: {e}")
+            results[visual_type] = {"url": None, "cached": False, "seconds": None}
+    return results
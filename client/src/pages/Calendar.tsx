@@ -28,14 +28,37 @@ function Calendar() {
   ];
 
   useEffect(() => {
-    fetch("http://localhost:5050/data/calendar_events.json")
-      .then((res) => res.json())
+    // Load only the visible month, following pages until the range is complete
+    let cancelled = false;
+    const month = `${currentYear}-${String(currentMonth + 1).padStart(2, "0")}`;
+
+    const loadMonth = async () => {
+      const loaded: Event[] = [];
+      let offset: number | null = 0;
+      while (offset !== null) {
+        const res = await fetch(`http://localhost:5050/api/calendar?month=${month}&offset=${offset}`);
+        const data = await res.json();
+        loaded.push(...data.events);
+        offset = data.next_offset;
+      }
+      return loaded;
+    };
+
+    loadMonth()
       .then((data) => {
-        console.log("✅ Loaded events:", data);
-        setEvents(data);
+        if (!cancelled) {
+          console.log(`✅ Loaded ${data.length} event(s) for ${month}`);
+          setEvents(data);
+        }
       })
-      .catch(() => setEvents([]));
-  }, []);
+      .catch(() => {
+        if (!cancelled) setEvents([]);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [currentYear, currentMonth]);
 
   function getDayMeetings(day: number): Event[] {
     const dateStr = `${currentYear}-${String(currentMonth + 1).padStart(2, "0")}-${String(day).padStart(2, "0")}`;
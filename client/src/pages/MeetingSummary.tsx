@@ -1,9 +1,15 @@
 import { useEffect, useState } from "react";
 import Layout from "../components/Layout";
 
+interface ActionItem {
+  task: string;
+  owner?: string | null;
+  date?: string | null;
+}
+
 function MeetingSummary() {
   const [summary, setSummary] = useState("");
-  const [actionItems, setActionItems] = useState<string[]>([]);
+  const [actionItems, setActionItems] = useState<ActionItem[]>([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -14,16 +20,20 @@ function MeetingSummary() {
       return;
     }
 
+    const applySummary = (data: any) => {
+      setSummary(data.summary);
+      if (Array.isArray(data.action_items)) {
+        setActionItems(data.action_items);
+      }
+    };
+
     const fetchSummary = async () => {
       console.log("🧠 Fetching summary for:", filename);
       try {
         const res = await fetch(`http://localhost:5050/api/summary?filename=${encodeURIComponent(filename)}`);
         const data = await res.json();
         if (res.ok && data.summary) {
-          setSummary(data.summary);
-          if (Array.isArray(data.action_items)) {
-            setActionItems(data.action_items);
-          }
+          applySummary(data);
         } else {
           setSummary("⚠️ Failed to load summary.");
         }
@@ -34,7 +44,34 @@ function MeetingSummary() {
       }
     };
 
-    fetchSummary();
+    // Stream tokens as they are generated; fall back to the blocking endpoint on failure
+    let streamed = "";
+    const source = new EventSource(
+      `http://localhost:5050/api/summary/stream?filename=${encodeURIComponent(filename)}`
+    );
+    source.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      if (data.type === "token") {
+        streamed += data.content;
+        setSummary(streamed);
+        setLoading(false);
+      } else if (data.type === "done") {
+        applySummary(data);
+        setLoading(false);
+        source.close();
+      } else if (data.type === "error") {
+        source.close();
+        fetchSummary();
+      }
+    };
+    source.onerror = () => {
+      source.close();
+      if (!streamed) {
+        fetchSummary();
+      }
+    };
+
+    return () => source.close();
   }, []);
 
   return (
@@ -70,7 +107,14 @@ function MeetingSummary() {
                     >
                       <div className="flex items-start gap-2">
                         <span className="text-blue-500 text-xl">📌</span>
-                        <span className="text-gray-700">{item}</span>
+                        <span className="text-gray-700">
+                          {item.task}
+                          {(item.owner || item.date) && (
+                            <span className="block text-sm text-gray-500">
+                              {[item.owner, item.date].filter(Boolean).join(" · ")}
+                            </span>
+                          )}
+                        </span>
                       </div>
                     </div>
                   ))}